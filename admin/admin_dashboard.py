@@ -1,10 +1,11 @@
 # admin/admin_dashboard.py
 import streamlit as st
 import secrets
-from db import get_connection
+from db import get_connection, get_pool_stats, hot_query
 from auth.email_service import send_hr_verification_email
 from utils.mail import send_email
 from utils.templates import template_account_rejected
+from utils import cache, query_log
 
 
 def admin_dashboard():
@@ -21,6 +22,8 @@ def admin_dashboard():
             st.success("Logged out!")
             st.rerun()
 
+    render_query_stats()
+
     hrs = fetch_pending_hr()
 
     if not hrs:
@@ -31,15 +34,57 @@ def admin_dashboard():
         render_hr_card(user_id, name, email)
 
 
+_PENDING_HR_SQL = hot_query(
+    "pending_hr_queue",
+    "SELECT id, name, email FROM users WHERE role='hr' AND status='pending_approval'",
+)
+
+
 def fetch_pending_hr():
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute("SELECT id, name, email FROM users WHERE role='hr' AND status='pending_approval'")
+    cur.execute(_PENDING_HR_SQL)
     data = cur.fetchall()
     conn.close()
     return data
 
 
+def render_query_stats():
+    """Pool/cache counters, plus SQL timings from utils.query_log when TRUSTHIRE_SQL_TRACE=1."""
+    with st.expander("📊 Performance", expanded=False):
+        st.caption(f"Connection pool: {get_pool_stats()}")
+
+        st.markdown("**Caches**")
+        st.dataframe(cache.all_stats(), use_container_width=True)
+
+        if not query_log.enabled():
+            st.caption("SQL tracing is off (set TRUSTHIRE_SQL_TRACE=1 to collect query timings).")
+            return
+
+        st.caption(f"Slow query log threshold: {query_log.SLOW_QUERY_MS:.0f} ms")
+
+        st.markdown("**Slowest statements (total time)**")
+        top = query_log.top_statements(limit=20)
+        if top:
+            st.dataframe(top, use_container_width=True)
+        else:
+            st.write("No statements recorded yet.")
+
+        st.markdown("**Recent page renders**")
+        reruns = query_log.recent_reruns()
+        if reruns:
+            st.dataframe(
+                [{k: v for k, v in r.items() if k != "top"} for r in reruns],
+                use_container_width=True,
+            )
+        else:
+            st.write("No renders recorded yet.")
+
+        if st.button("Reset stats", key="reset_query_stats"):
+            query_log.reset()
+            st.rerun()
+
+
 def render_hr_card(user_id, name, email):
     with st.container():
         st.markdown(
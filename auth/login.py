@@ -1,7 +1,14 @@
 import streamlit as st
-from db import get_connection, verify_password
+from db import get_connection, hot_query, verify_password
 from datetime import datetime
 
+_LOGIN_SQL = hot_query("login_by_email", """
+    SELECT id, name, email, role, password, status, company_id
+    FROM users
+    WHERE email=?
+""", ("a@b.com",))
+
+
 def login_page():
     st.title("Login")
 
@@ -19,11 +26,7 @@ def login_page():
         conn = get_connection()
         cur = conn.cursor()
 
-        cur.execute("""
-            SELECT id, name, email, role, password, status, company_id
-            FROM users
-            WHERE email=?
-        """, (email,))
+        cur.execute(_LOGIN_SQL, (email,))
         row = cur.fetchone()
 
         if not row:
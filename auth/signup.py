@@ -1,7 +1,7 @@
 # auth/signup.py
 import streamlit as st
 import re
-from db import get_connection, hash_password
+from db import get_connection, hash_password, hot_query
 from auth.email_service import send_verification_email
 from datetime import datetime
 import secrets
@@ -40,6 +40,20 @@ def is_strong_password(pw):
         and re.search(r"[!@#$%^&*]", pw)
     )
 
+
+_DUPLICATE_EMAIL_SQL = hot_query(
+    "signup_duplicate_email",
+    "SELECT id FROM users WHERE LOWER(TRIM(email)) = LOWER(TRIM(?))",
+    ("a@b.com",),
+)
+
+_COMPANY_BY_DOMAIN_SQL = hot_query(
+    "company_by_domain",
+    "SELECT id FROM companies WHERE LOWER(domain)=LOWER(?)",
+    ("b.com",),
+)
+
+
 def signup_page():
     st.title("TrustHire Registration")
 
@@ -107,10 +121,7 @@ def signup_page():
                 cur = conn.cursor()
 
                 # ---------- DUPLICATE EMAIL CHECK ----------
-                cur.execute(
-                    "SELECT id FROM users WHERE LOWER(TRIM(email)) = LOWER(TRIM(?))",
-                    (email.strip(),)
-                )
+                cur.execute(_DUPLICATE_EMAIL_SQL, (email.strip(),))
                 if cur.fetchone():
                     st.error("Email already registered")
                     conn.close()
@@ -123,7 +134,7 @@ def signup_page():
                 if role == "HR":
                     domain = get_domain(email)
 
-                    cur.execute("SELECT id FROM companies WHERE LOWER(domain)=LOWER(?)", (domain,))
+                    cur.execute(_COMPANY_BY_DOMAIN_SQL, (domain,))
                     row = cur.fetchone()
                     if row:
                         company_id = row[0]
@@ -1,8 +1,15 @@
 # auth/verify_email.py
 import streamlit as st
-from db import get_connection
+from db import get_connection, hot_query
 from datetime import datetime
 
+_VERIFY_TOKEN_SQL = hot_query(
+    "verify_token",
+    "SELECT id, role, status FROM users WHERE verification_token=?",
+    ("token",),
+)
+
+
 def verify_email_page(_=None):
     token = st.query_params.get("token", "")
 
@@ -13,10 +20,7 @@ def verify_email_page(_=None):
     conn = get_connection()
     cur = conn.cursor()
 
-    cur.execute(
-        "SELECT id, role, status FROM users WHERE verification_token=?",
-        (token,)
-    )
+    cur.execute(_VERIFY_TOKEN_SQL, (token,))
     user = cur.fetchone()
 
     if not user:
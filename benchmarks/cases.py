@@ -0,0 +1,326 @@
+# benchmarks/cases.py
+"""
+Benchmark cases for benchmarks.run.
+
+A case is a function taking the shared Context and returning a zero-argument
+callable to time (setup happens before the return and is not timed), or a
+(callable, n_items) pair to also get the per-item cost. Raise
+Skip when a case cannot run here, e.g. the PDF libraries are not installed.
+Register new cases with @case("group", "name").
+"""
+import glob
+import os
+
+from benchmarks.sample_resumes import SAMPLES
+
+CASES = []
+
+
+class Skip(Exception):
+    pass
+
+
+class Context:
+    def __init__(self, db_path, resume_dir=None):
+        self.db_path = db_path
+        self.resume_dir = resume_dir
+        self._cache = {}
+
+    def memo(self, key, fn):
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    # ---------- RESUMES ----------
+    def resume_files(self):
+        if not self.resume_dir:
+            return []
+        files = []
+        for ext in ("*.pdf", "*.docx"):
+            files.extend(glob.glob(os.path.join(self.resume_dir, "**", ext), recursive=True))
+        return sorted(files)
+
+    def resume_texts(self):
+        """Extracted text of the corpus, or the built-in samples when there is none."""
+        def load():
+            files = self.resume_files()
+            if files:
+                parser = parser_module()
+                texts = [parser.extract_text(f) for f in files]
+                texts = [t for t in texts if t]
+                if texts:
+                    return texts
+            return list(SAMPLES.values())
+        return self.memo("resume_texts", load)
+
+    # ---------- SEEDED DATA ----------
+    def busiest_candidate(self):
+        def load():
+            from db import get_connection
+            conn = get_connection()
+            row = conn.execute("""
+                SELECT candidate_id FROM job_applications
+                GROUP BY candidate_id ORDER BY COUNT(*) DESC LIMIT 1
+            """).fetchone()
+            if not row:
+                row = conn.execute("SELECT id FROM users WHERE role='candidate' LIMIT 1").fetchone()
+            conn.close()
+            if not row:
+                raise Skip("no candidates in database")
+            return row[0]
+        return self.memo("candidate", load)
+
+    def busiest_company(self):
+        def load():
+            from db import get_connection
+            conn = get_connection()
+            row = conn.execute("""
+                SELECT company_id FROM job_posts
+                GROUP BY company_id ORDER BY COUNT(*) DESC LIMIT 1
+            """).fetchone()
+            conn.close()
+            if not row:
+                raise Skip("no job posts in database")
+            return row[0]
+        return self.memo("company", load)
+
+
+def case(group, name):
+    def register(fn):
+        CASES.append((f"{group}.{name}", fn))
+        return fn
+    return register
+
+
+def parser_module():
+    try:
+        from candidate import resume_parser
+    except ImportError as e:
+        raise Skip(f"resume parser unavailable: {e}")
+    return resume_parser
+
+
+# ---------- PARSING ----------
+@case("parse", "extract_text")
+def extract_text_corpus(ctx):
+    parser = parser_module()
+    files = ctx.resume_files()
+    if not files:
+        raise Skip("no --resumes corpus given")
+    return lambda: [parser.extract_text(f) for f in files]
+
+
+def _pdf_case(n_pages, parallel):
+    def run(ctx):
+        import tempfile
+        from benchmarks.sample_pdfs import resume_pdf
+        try:
+            from candidate import pdf_pages
+        except ImportError as e:
+            raise Skip(f"pdfplumber unavailable: {e}")
+        if parallel and pdf_pages._pool_workers(n_pages) < 2:
+            raise Skip("PDF pool unused (one CPU, or set TRUSTHIRE_PDF_WORKERS >= 2)")
+        pdf_dir = ctx.memo("pdf_dir", tempfile.mkdtemp)
+        path = ctx.memo(f"pdf_{n_pages}", lambda: resume_pdf(os.path.join(pdf_dir, f"resume_{n_pages}p.pdf"), n_pages))
+        return lambda: pdf_pages.extract_pdf_text(path, parallel=parallel), n_pages
+    return run
+
+
+# generated multi-page PDFs: serial vs page ranges split across the process pool
+for _n in (1, 5, 30):
+    case("parse", f"pdf_{_n}_pages_serial")(_pdf_case(_n, False))
+    case("parse", f"pdf_{_n}_pages_parallel")(_pdf_case(_n, True))
+
+
+@case("parse", "extract_sections")
+def extract_sections_corpus(ctx):
+    parser = parser_module()
+    texts = ctx.resume_texts()
+    return lambda: [parser.extract_sections(t) for t in texts]
+
+
+@case("parse", "extract_fields")
+def extract_fields_corpus(ctx):
+    parser = parser_module()
+    texts = ctx.resume_texts()
+    return lambda: [parser.extract_fields(t) for t in texts], len(texts)
+
+
+@case("parse", "extract_skills")
+def extract_skills_corpus(ctx):
+    parser = parser_module()
+    texts = ctx.resume_texts()
+    sections = [parser.extract_sections(t) for t in texts]
+    return lambda: [parser.extract_skills_from_resume(s.get("skills"), t) for s, t in zip(sections, texts)]
+
+
+def _skill_scan_case(extra):
+    """Whole-text skill scan with `extra` made-up spellings added to the dictionary."""
+    def run(ctx):
+        from jobmatch.skill_automaton import SkillAutomaton
+        from jobmatch.skill_dictionary import get_dictionary
+
+        spellings = dict(get_dictionary().ids)
+        spellings.update((f"skill{i} tool", -1) for i in range(extra))
+        automaton = SkillAutomaton(spellings)
+        texts = ctx.resume_texts()
+        return lambda: [automaton.find_all(t) for t in texts], len(texts)
+    return run
+
+
+# time should stay flat as the vocabulary grows
+for _n in (0, 10_000, 100_000):
+    case("parse", f"skill_scan_vocab_plus_{_n}")(_skill_scan_case(_n))
+
+
+# ---------- MATCHING ----------
+@case("match", "one_candidate_all_jobs")
+def match_one_candidate(ctx):
+    from jobmatch.retrieve_score import score_skill_ids
+    from jobmatch.store_data import load_open_jobs, get_candidate_skill_ids
+
+    jobs = load_open_jobs()
+    skills = get_candidate_skill_ids(ctx.busiest_candidate())
+    return lambda: [score_skill_ids(skills, job["skill_ids"]) for job in jobs], len(jobs)
+
+
+@case("match", "one_candidate_all_jobs_batch")
+def match_one_candidate_batch(ctx):
+    from jobmatch.batch_score import SkillMatrix, score_candidate_against_jobs
+    from jobmatch.store_data import load_open_jobs, get_candidate_skill_ids
+
+    jobs = load_open_jobs()
+    matrix = SkillMatrix([j["id"] for j in jobs], [j["skill_ids"] for j in jobs])
+    skills = get_candidate_skill_ids(ctx.busiest_candidate())
+    return lambda: score_candidate_against_jobs(skills, matrix), len(jobs)
+
+
+@case("match", "one_candidate_all_jobs_bits")
+def match_one_candidate_bits(ctx):
+    from jobmatch.retrieve_score import score_skill_bits
+    from jobmatch.store_data import load_open_jobs, get_candidate_skill_bits
+
+    jobs = load_open_jobs()
+    bits = get_candidate_skill_bits(ctx.busiest_candidate())
+    return lambda: [score_skill_bits(bits, job["skill_bits"]) for job in jobs], len(jobs)
+
+
+def synthetic_jobs(n=50_000, seed=7):
+    """n random job skill lists drawn from the seed vocabulary, no database needed."""
+    import random
+    from benchmarks.seed_data import SKILL_POOL
+    rng = random.Random(seed)
+    return [rng.sample(SKILL_POOL, rng.randint(3, 8)) for _ in range(n)]
+
+
+@case("match", "loop_50k_jobs")
+def match_loop_50k(ctx):
+    from jobmatch.retrieve_score import score_skills
+    jobs = ctx.memo("jobs_50k", synthetic_jobs)
+    skills = jobs[0] + jobs[1]
+    return lambda: [score_skills(skills, j) for j in jobs], len(jobs)
+
+
+@case("match", "bits_50k_jobs")
+def match_bits_50k(ctx):
+    from jobmatch.retrieve_score import score_skill_bits
+    from jobmatch.skill_bits import to_bits
+    from jobmatch.skill_dictionary import skill_ids
+    jobs = ctx.memo("jobs_50k", synthetic_jobs)
+    job_bits = [to_bits(skill_ids(j)) for j in jobs]
+    bits = to_bits(skill_ids(jobs[0] + jobs[1]))
+    return lambda: [score_skill_bits(bits, j) for j in job_bits], len(jobs)
+
+
+@case("match", "batch_50k_jobs")
+def match_batch_50k(ctx):
+    from jobmatch.batch_score import SkillMatrix, score_candidate_against_jobs
+    jobs = ctx.memo("jobs_50k", synthetic_jobs)
+    matrix = SkillMatrix(list(range(len(jobs))), jobs)
+    skills = jobs[0] + jobs[1]
+    return lambda: score_candidate_against_jobs(skills, matrix), len(jobs)
+
+
+@case("match", "batch_50k_jobs_scores_only")
+def match_batch_50k_scores(ctx):
+    from jobmatch.batch_score import SkillMatrix, score_candidate_against_jobs
+    jobs = ctx.memo("jobs_50k", synthetic_jobs)
+    matrix = SkillMatrix(list(range(len(jobs))), jobs)
+    skills = jobs[0] + jobs[1]
+    return lambda: score_candidate_against_jobs(skills, matrix, with_missing=False), len(jobs)
+
+
+@case("match", "one_job_all_applicants_batch")
+def match_job_applicants(ctx):
+    from jobmatch.batch_score import score_job_applicants
+    from db import get_connection
+    conn = get_connection()
+    row = conn.execute("""
+        SELECT job_id, COUNT(*) FROM job_applications GROUP BY job_id ORDER BY COUNT(*) DESC LIMIT 1
+    """).fetchone()
+    conn.close()
+    if not row:
+        raise Skip("no applications in database")
+    job_id, n = row
+    return lambda: score_job_applicants(job_id), n
+
+
+# ---------- PAGE QUERIES ----------
+@case("sql", "show_available_jobs")
+def sql_available_jobs(ctx):
+    # uncached loader: what a cache miss costs
+    from jobmatch.store_data import load_open_jobs
+    return load_open_jobs
+
+
+@case("sql", "show_applied_jobs")
+def sql_applied_jobs(ctx):
+    from jobmatch.store_data import get_applied_jobs
+    user_id = ctx.busiest_candidate()
+    return lambda: get_applied_jobs(user_id)
+
+
+@case("sql", "view_applicants_page")
+def sql_company_applicants(ctx):
+    from jobmatch.store_data import get_company_applicants
+    company_id = ctx.busiest_company()
+    return lambda: get_company_applicants(company_id)
+
+
+@case("match", "top10_inverted_index")
+def match_top_k(ctx):
+    from jobmatch.skill_index import SkillIndex
+    from jobmatch.store_data import load_open_jobs, get_candidate_skill_ids
+
+    jobs = load_open_jobs()
+    index = SkillIndex()
+    for job in jobs:
+        index.add(job["id"], job["skill_ids"])
+    skills = get_candidate_skill_ids(ctx.busiest_candidate())
+    return lambda: index.top_k(skills, 10), len(jobs)
+
+
+@case("match", "tfidf_resume_all_jobs")
+def match_tfidf(ctx):
+    from jobmatch.tfidf_match import TfidfJobModel
+    model = ctx.memo("tfidf", lambda: TfidfJobModel().fit())
+    text = ctx.resume_texts()[0]
+    return lambda: model.score_text(text), len(model.job_ids)
+
+
+@case("match", "similar_candidates_exact")
+def similar_exact(ctx):
+    from jobmatch.minhash_lsh import exact_top_k, load_all_candidate_skill_ids
+    sets = ctx.memo("candidate_sets", lambda: {u: set(ids) for u, ids in load_all_candidate_skill_ids().items()})
+    user_id = ctx.busiest_candidate()
+    return lambda: exact_top_k(sets, sets.get(user_id, ()), 10, exclude=user_id), len(sets)
+
+
+@case("match", "similar_candidates_lsh")
+def similar_lsh(ctx):
+    from jobmatch.minhash_lsh import LSHIndex, load_all_candidate_skill_ids
+    index = LSHIndex()
+    for user_id, ids in load_all_candidate_skill_ids().items():
+        index.add(user_id, ids)
+    user_id = ctx.busiest_candidate()
+    return lambda: index.query_key(user_id, 10), len(index)
@@ -0,0 +1,135 @@
+# benchmarks/db_concurrency.py
+"""
+Read/write concurrency before vs after the WAL pragma profile.
+
+Readers run the browse-jobs query in a loop while writers replay the
+save_skills pattern (DELETE + INSERT per skill in one transaction).
+
+    python -m benchmarks.db_concurrency --seconds 5 --readers 8 --writers 2
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from db import ConnectionPool, PRAGMA_PROFILES
+
+SKILLS = ["python", "java", "sql", "react", "django", "git", "docker", "aws", "c", "html"]
+
+
+def _seed(pool, jobs=2000, users=500):
+    conn = pool.acquire()
+    conn.executescript("""
+        CREATE TABLE companies (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE job_posts (
+            id INTEGER PRIMARY KEY, company_id INTEGER, role TEXT, skills TEXT,
+            status TEXT, created_at TEXT
+        );
+        CREATE TABLE user_skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, skill TEXT, added_at TEXT
+        );
+    """)
+    conn.executemany("INSERT INTO companies (id, name) VALUES (?, ?)", [(i, f"Company {i}") for i in range(1, 51)])
+    conn.executemany(
+        "INSERT INTO job_posts (company_id, role, skills, status, created_at) VALUES (?, ?, ?, 'open', ?)",
+        [
+            (random.randint(1, 50), f"Role {i}", ", ".join(random.sample(SKILLS, 4)), datetime.now().isoformat())
+            for i in range(jobs)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO user_skills (user_id, skill, added_at) VALUES (?, ?, ?)",
+        [(u, s, datetime.now().isoformat()) for u in range(1, users + 1) for s in random.sample(SKILLS, 5)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _reader(pool, stop, counts):
+    while not stop.is_set():
+        conn = pool.acquire()
+        try:
+            conn.execute("""
+                SELECT jp.id, jp.role, c.name, jp.skills
+                FROM job_posts jp JOIN companies c ON jp.company_id = c.id
+                WHERE jp.status='open'
+                ORDER BY jp.created_at DESC LIMIT 50
+            """).fetchall()
+            counts["reads"] += 1
+        except sqlite3.OperationalError:
+            counts["read_errors"] += 1
+        finally:
+            conn.close()
+
+
+def _writer(pool, stop, counts, users):
+    while not stop.is_set():
+        user_id = random.randint(1, users)
+        conn = pool.acquire()
+        try:
+            conn.execute("DELETE FROM user_skills WHERE user_id=?", (user_id,))
+            for skill in random.sample(SKILLS, 6):
+                conn.execute(
+                    "INSERT INTO user_skills (user_id, skill, added_at) VALUES (?, ?, ?)",
+                    (user_id, skill, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                )
+            conn.commit()
+            counts["writes"] += 1
+        except sqlite3.OperationalError:
+            counts["write_errors"] += 1
+        finally:
+            conn.close()
+
+
+def run_profile(profile, seconds, readers, writers, users=500):
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(os.path.join(tmp, "bench.db"), size=readers + writers, profile=profile)
+        _seed(pool, users=users)
+
+        counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+        stop = threading.Event()
+        threads = [threading.Thread(target=_reader, args=(pool, stop, counts)) for _ in range(readers)]
+        threads += [threading.Thread(target=_writer, args=(pool, stop, counts, users)) for _ in range(writers)]
+
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        pool.close_all()
+
+    return {
+        "profile": profile,
+        "reads_per_sec": round(counts["reads"] / elapsed, 1),
+        "writes_per_sec": round(counts["writes"] / elapsed, 1),
+        "read_errors": counts["read_errors"],
+        "write_errors": counts["write_errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--profiles", nargs="+", default=["legacy", "production"], choices=sorted(PRAGMA_PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'reads/s':>10}{'writes/s':>10}{'read err':>10}{'write err':>10}")
+    for profile in args.profiles:
+        r = run_profile(profile, args.seconds, args.readers, args.writers)
+        print(
+            f"{r['profile']:<12}{r['reads_per_sec']:>10}{r['writes_per_sec']:>10}"
+            f"{r['read_errors']:>10}{r['write_errors']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/lsh_recall.py
+"""
+Recall / latency of the MinHash LSH index against exact Jaccard.
+
+    python -m benchmarks.lsh_recall
+    python -m benchmarks.lsh_recall --sets 100000 --queries 200 --perm 128
+
+Skill sets are synthetic but clustered like real profiles (a role's core
+skills plus a few random ones), so there are real near neighbours to find.
+recall@k = share of the exact top-k similarity levels the LSH answer reaches
+(ties at the k-th place count as hits).
+"""
+import argparse
+import random
+import statistics
+import time
+
+from jobmatch.minhash_lsh import LSHIndex, exact_top_k
+
+VOCAB = 400
+PROFILES = 60
+
+
+def make_sets(n, seed=3):
+    rng = random.Random(seed)
+    profiles = [rng.sample(range(1, VOCAB + 1), 12) for _ in range(PROFILES)]
+    sets = {}
+    for key in range(1, n + 1):
+        core = rng.choice(profiles)
+        ids = set(rng.sample(core, rng.randint(4, 9)))
+        ids.update(rng.sample(range(1, VOCAB + 1), rng.randint(0, 3)))
+        sets[key] = ids
+    return sets
+
+
+def recall(approx, exact, k):
+    if not exact:
+        return 1.0
+    kth = exact[-1][1]
+    hits = sum(1 for _, s in approx if s >= kth)
+    return min(hits, len(exact)) / len(exact)
+
+
+def run(sets, queries, perm, bands, k):
+    start = time.perf_counter()
+    index = LSHIndex(num_perm=perm, bands=bands)
+    for key, ids in sets.items():
+        index.add(key, ids)
+    build_s = time.perf_counter() - start
+
+    lat, rec, cands = [], [], []
+    for q in queries:
+        t0 = time.perf_counter()
+        got = index.query_key(q, k)
+        lat.append((time.perf_counter() - t0) * 1000)
+        cands.append(len(index.candidates(sets[q])))
+        rec.append(recall(got, exact_top_k(sets, sets[q], k, exclude=q), k))
+    return build_s, statistics.median(lat), statistics.mean(rec), statistics.mean(cands)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sets", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--perm", type=int, default=64)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    sets = make_sets(args.sets)
+    queries = random.Random(9).sample(list(sets), args.queries)
+
+    lat = []
+    for q in queries:
+        t0 = time.perf_counter()
+        exact_top_k(sets, sets[q], args.k, exclude=q)
+        lat.append((time.perf_counter() - t0) * 1000)
+    print(f"{args.sets:,} skill sets, {args.queries} queries, k={args.k}")
+    print(f"  {'exact Jaccard':<22}{'':>10}{statistics.median(lat):>10.2f} ms/query   recall 1.000")
+
+    for bands in [b for b in (4, 8, 16, 32, 64) if args.perm % b == 0 and b <= args.perm]:
+        build_s, q_ms, rec, cands = run(sets, queries, args.perm, bands, args.k)
+        label = f"LSH {bands}x{args.perm // bands}"
+        print(
+            f"  {label:<22}build {build_s:5.1f}s{q_ms:>10.2f} ms/query   recall {rec:.3f}"
+            f"   ({cands:,.0f} candidates re-ranked)"
+        )
+
+
+if __name__ == "__main__":
+    main()
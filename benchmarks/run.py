@@ -0,0 +1,160 @@
+# benchmarks/run.py
+"""
+Time the real hot paths and compare them with a stored baseline.
+
+    # seeded throwaway database (small), built-in resume samples
+    python -m benchmarks.run
+
+    # production-sized data + real resumes, save as the new baseline
+    python -m benchmarks.seed_data --db /tmp/load.db
+    python -m benchmarks.run --db /tmp/load.db --resumes ~/resumes --save-baseline
+
+    # before deploy: exits 1 if any case is slower than baseline by > tolerance
+    python -m benchmarks.run --db /tmp/load.db --resumes ~/resumes --out results.json
+
+Results are JSON: {"meta": {...}, "results": {"group.name": {"median_ms": ...}}}.
+Cases that process a known number of items also report per_item_us.
+The baseline is machine-specific, so create it on the machine that runs the checks.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# small default dataset so a plain `python -m benchmarks.run` finishes quickly
+SMALL = {"candidates": 2000, "companies": 100, "jobs": 2000, "applications": 40000}
+
+# differences below this are timer noise, never a regression
+NOISE_FLOOR_MS = 0.05
+
+
+def time_case(fn, repeat, warmup=1):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min_ms": round(samples[0], 4),
+        "runs": repeat,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Names of cases whose median grew by more than `tolerance` (0.25 = 25%)."""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base or "median_ms" not in r or "median_ms" not in base:
+            continue
+        limit = base["median_ms"] * (1 + tolerance)
+        if r["median_ms"] > limit and r["median_ms"] - base["median_ms"] > NOISE_FLOOR_MS:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="seeded database (default: build a small temporary one)")
+    parser.add_argument("--resumes", help="directory of .pdf/.docx resumes for the parsing cases")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="*", help="glob over case names, e.g. 'sql.*'")
+    parser.add_argument("--out", help="write JSON results here")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    tmp = None
+    db_path = args.db
+    if not db_path:
+        tmp = tempfile.TemporaryDirectory()
+        db_path = os.path.join(tmp.name, "bench.db")
+
+    # must happen before anything imports db (the pool binds the path on import)
+    os.environ["TRUSTHIRE_DB_PATH"] = os.path.abspath(db_path)
+    os.environ.setdefault("TRUSTHIRE_DB_PROFILE", "test")
+
+    from benchmarks.cases import CASES, Context, Skip
+
+    if tmp is not None:
+        from benchmarks.seed_data import seed
+        seed(db_path, **SMALL)
+
+    ctx = Context(db_path, args.resumes)
+    results = {}
+    for name, fn in CASES:
+        if not fnmatch.fnmatch(name, args.only):
+            continue
+        try:
+            thunk = fn(ctx)
+            items = None
+            if isinstance(thunk, tuple):
+                thunk, items = thunk
+            results[name] = time_case(thunk, args.repeat)
+            line = f"{name:<40}{results[name]['median_ms']:>12.3f} ms"
+            if items:
+                results[name]["items"] = items
+                results[name]["per_item_us"] = round(results[name]["median_ms"] * 1000 / items, 4)
+                line += f"   ({results[name]['per_item_us']:.3f} us/item over {items:,})"
+            print(line)
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+            print(f"{name:<40}{'skipped':>12}   ({e})")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.node(),
+            "db": os.path.abspath(db_path) if args.db else "temporary (small seed)",
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    exit_code = 0
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get("results", {})
+        regressions = compare(results, baseline, args.tolerance)
+        for name in regressions:
+            print(
+                f"❌ REGRESSION {name}: {results[name]['median_ms']:.3f} ms "
+                f"vs baseline {baseline[name]['median_ms']:.3f} ms"
+            )
+        if regressions:
+            exit_code = 1
+        else:
+            print(f"✅ No regressions vs baseline (tolerance {args.tolerance:.0%})")
+
+    if tmp is not None:
+        from db import _pool
+        _pool.close_all()
+        tmp.cleanup()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# benchmarks/sample_pdfs.py
+"""
+Multi-page text PDFs built from the sample resumes, for the extract_text
+cases (1, 5 and 30 page documents). Written by hand so the benchmarks need
+no PDF writer library: Helvetica, one text object per page.
+"""
+import os
+
+from benchmarks.sample_resumes import SAMPLES
+
+LINES_PER_PAGE = 60
+
+
+def _escape(line):
+    line = line.encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path, pages):
+    """pages: list of lists of text lines."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for lines in pages:
+        body = "BT /F1 10 Tf 12 TL 50 790 Td " + " ".join(f"({_escape(l)}) Tj T*" for l in lines) + " ET"
+        stream = body.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+    return path
+
+
+def resume_pdf(path, n_pages):
+    """An n_pages PDF filled with the sample resumes, cycled."""
+    lines = [l for text in SAMPLES.values() for l in text.splitlines() if l.strip()]
+    pages = []
+    for p in range(n_pages):
+        start = (p * LINES_PER_PAGE) % len(lines)
+        pages.append([lines[(start + i) % len(lines)] for i in range(LINES_PER_PAGE)])
+    return write_pdf(path, pages)
+
+
+if __name__ == "__main__":
+    import sys
+    out = sys.argv[1] if len(sys.argv) > 1 else "."
+    for n in (1, 5, 30):
+        print(resume_pdf(os.path.join(out, f"resume_{n}p.pdf"), n))
@@ -0,0 +1,106 @@
+# benchmarks/sample_resumes.py
+"""
+Plain-text resumes shaped like what extract_text() returns for the PDFs we
+see in production. Used when no --resumes corpus directory is given.
+"""
+
+LABELLED = """ANU MARIYA JOSEPH
+Email: anu.joseph@example.com
+Phone: +91 98470 12345
+LinkedIn: linkedin.com/in/anu-joseph
+GitHub: github.com/anujoseph
+
+CAREER OBJECTIVE
+Motivated computer science graduate looking for a backend developer role where I can build
+reliable services and grow with a product team.
+
+EDUCATION
+B.Tech in Computer Science and Engineering - College of Engineering Trivandrum, 2020 - 2024
+Higher Secondary (Plus Two) - St. Mary's HSS, 2020
+SSLC - St. Mary's HSS, 2018
+
+TECHNICAL SKILLS
+Python, Java, C, SQL, MySQL, PostgreSQL, Django, Flask, React.js, Node.js
+Git | GitHub | Docker | Linux | VS Code
+
+EXPERIENCE
+Software Engineering Intern - Infosys Technologies Ltd
+- Developed REST APIs in Django for an internal leave management system
+- Optimized slow SQL queries and added indexes, cutting page load by 40%
+- Wrote unit tests with pytest and set up CI on GitHub Actions
+
+PROJECTS
+TrustHire - resume verification portal built with Streamlit and SQLite
+Smart Attendance - face recognition attendance using OpenCV
+
+CERTIFICATIONS
+AWS Cloud Practitioner
+NPTEL Data Structures and Algorithms
+
+PERSONAL DETAILS
+Date of Birth 12/04/2002
+Gender Female
+Nationality Indian
+Address Kunnumpuram House, Kazhakoottam, Thiruvananthapuram, Kerala
+Languages English, Malayalam, Hindi
+
+DECLARATION
+I hereby declare that the above information is true to the best of my knowledge.
+"""
+
+SPACED_NAME = """K I S H A N   D A S
+kishan.das@example.com   MOB: 9895012345
+Locality: Kozhikode, Kerala
+
+PROFILE
+Data analyst with two years of experience turning messy spreadsheets into dashboards.
+
+WORK EXPERIENCE
+Data Analyst, Malabar Analytics Pvt Ltd (2022 - Present)
+- Built Power BI dashboards with DAX measures for 12 retail stores
+- Automated weekly sales reports with Python (pandas) and SQL
+- Managed data quality checks for the finance team
+Trainee, Calicut Solutions
+- Handled Excel based reporting
+
+SKILLS
+JavaScript TypeScript React.js Next.js Node.js Express MongoDB Python Pandas NumPy Power BI DAX Excel Tableau
+Machine Learning, Deep Learning, NLP
+
+EDUCATION
+MCA - Calicut University 2021
+BCA - Farook College 2019
+
+PERSONAL INFORMATION
+Gender: Male
+Nationality: India
+Hobbies: cricket, photography
+"""
+
+MINIMAL = """Resume
+Fathima Rahman
+fathima.r@example.com
++91-7012345678
+
+Summary: Frontend developer who enjoys turning designs into fast, accessible web pages.
+
+Skills: HTML, CSS, JavaScript, React, Redux, Tailwind CSS, Figma, Git, Jest, Webpack
+
+Experience
+Frontend Developer - Bluewave Technologies (2023 - 2024)
+- Implemented responsive UI components in React
+- Improved Lighthouse performance score from 62 to 94
+
+Education
+B.Sc Computer Science - MES College, 2023
+
+Address: Flat 4B, Marine Drive, Kochi
+Nationality: Indian
+Gender: Female
+"""
+
+SAMPLES = {
+    "labelled": LABELLED,
+    "spaced_name": SPACED_NAME,
+    "minimal": MINIMAL,
+}
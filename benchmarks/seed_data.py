@@ -0,0 +1,240 @@
+# benchmarks/seed_data.py
+"""
+Fill a TrustHire database with production-sized synthetic data.
+
+Deterministic for a given --seed, so benchmark numbers are comparable
+between runs. Rows are generated lazily and written with executemany()
+in large batches inside one transaction per table.
+
+    python -m benchmarks.seed_data --db /tmp/trusthire_load.db
+    python -m benchmarks.seed_data --db /tmp/small.db --candidates 1000 --companies 50 \\
+        --jobs 500 --applications 20000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from db import ConnectionPool, hash_password, run_migrations
+from jobmatch.match_scores import rebuild_all
+from jobmatch.skill_bits import backfill as backfill_skill_bits
+from jobmatch.skill_dictionary import SkillDictionary
+
+BATCH = 10_000
+EPOCH = datetime(2025, 1, 1)
+
+SKILL_POOL = [
+    "python", "java", "c", "c++", "c#", "javascript", "typescript", "go", "rust", "kotlin",
+    "swift", "php", "ruby", "scala", "r", "matlab", "html", "css", "sass", "react",
+    "angular", "vue", "next.js", "node.js", "express", "django", "flask", "fastapi", "spring",
+    "spring boot", "laravel", "rails", ".net", "sql", "mysql", "postgresql", "sqlite", "mongodb",
+    "redis", "elasticsearch", "cassandra", "kafka", "rabbitmq", "docker", "kubernetes", "terraform",
+    "ansible", "jenkins", "git", "github", "gitlab", "linux", "bash", "aws", "azure", "gcp",
+    "machine learning", "deep learning", "nlp", "computer vision", "pandas", "numpy",
+    "scikit-learn", "tensorflow", "pytorch", "power bi", "tableau", "excel", "dax", "spark",
+    "hadoop", "airflow", "graphql", "rest api", "microservices", "agile", "scrum", "jira",
+    "figma", "photoshop", "selenium", "junit", "pytest", "android", "ios", "flutter",
+]
+ROLES = [
+    "Software Engineer", "Backend Developer", "Frontend Developer", "Full Stack Developer",
+    "Data Analyst", "Data Scientist", "ML Engineer", "DevOps Engineer", "QA Engineer",
+    "Mobile Developer", "Cloud Engineer", "Business Analyst", "UI/UX Designer", "Intern",
+]
+CITIES = ["Bangalore", "Kochi", "Chennai", "Hyderabad", "Pune", "Mumbai", "Delhi", "Trivandrum", "Remote"]
+FIRST = ["Anu", "Arjun", "Meera", "Rahul", "Fathima", "Kiran", "Sneha", "Vishnu", "Aisha", "Nikhil", "Divya", "Adil"]
+LAST = ["Nair", "Menon", "Kumar", "Das", "Pillai", "Sharma", "Thomas", "Joseph", "Reddy", "Iyer", "Khan", "Varma"]
+CERT_TYPES = ["SSLC", "Plus Two", "Degree", "Internship", "Seminar", "Tech Fest", "Other"]
+
+
+def _ts(rng, days=365):
+    return (EPOCH + timedelta(seconds=rng.randrange(days * 86400))).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _batched(rows, size=BATCH):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(conn, label, sql, rows):
+    start = time.perf_counter()
+    n = 0
+    for batch in _batched(rows):
+        conn.executemany(sql, batch)
+        n += len(batch)
+    conn.commit()
+    took = time.perf_counter() - start
+    rate = n / took if took else 0
+    print(f"  {label:<14}{n:>12,} rows  {took:7.2f}s  ({rate:,.0f} rows/s)")
+    return n
+
+
+def _max_id(conn, table):
+    return conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+
+
+def seed(db_path, candidates, companies, jobs, applications, seed=42,
+         skills_per_candidate=(3, 12), skills_per_job=(3, 8), certificates_per_candidate=(0, 3)):
+    rng = random.Random(seed)
+    pool = ConnectionPool(db_path, size=1, profile="test")
+    conn = pool.acquire()
+    run_migrations(conn)
+    dictionary = SkillDictionary().load(conn)
+
+    password = hash_password("Password@123")
+    company_base = _max_id(conn, "companies")
+    user_base = _max_id(conn, "users")
+    job_base = _max_id(conn, "job_posts")
+
+    print(f"Seeding {db_path} (seed={seed})")
+
+    # ---------- COMPANIES ----------
+    _insert(conn, "companies", """
+        INSERT INTO companies (name, domain, status, city, country, website, created_at)
+        VALUES (?, ?, 'approved', ?, 'India', ?, ?)
+    """, (
+        (f"Company {company_base + i}", f"company{company_base + i}.example.com", rng.choice(CITIES),
+         f"https://company{company_base + i}.example.com", _ts(rng))
+        for i in range(1, companies + 1)
+    ))
+
+    # ---------- USERS (one HR per company, then candidates) ----------
+    _insert(conn, "hr users", """
+        INSERT INTO users (name, email, password, role, company_id, status, created_at)
+        VALUES (?, ?, ?, 'hr', ?, 'active', ?)
+    """, (
+        (f"HR {company_base + i}", f"hr@company{company_base + i}.example.com", password, company_base + i, _ts(rng))
+        for i in range(1, companies + 1)
+    ))
+    hr_base = user_base
+    cand_base = user_base + companies
+
+    _insert(conn, "candidates", """
+        INSERT INTO users (name, email, password, role, status, phone, created_at)
+        VALUES (?, ?, ?, 'candidate', 'active', ?, ?)
+    """, (
+        (f"{rng.choice(FIRST)} {rng.choice(LAST)}", f"candidate{cand_base + i}@example.com", password,
+         f"9{rng.randrange(10**9):09d}", _ts(rng))
+        for i in range(1, candidates + 1)
+    ))
+
+    # ---------- CANDIDATE SKILLS ----------
+    lo, hi = skills_per_candidate
+    _insert(conn, "user_skills", """
+        INSERT OR IGNORE INTO user_skills (user_id, skill, skill_id, added_at) VALUES (?, ?, ?, ?)
+    """, (
+        (cand_base + i, skill, dictionary.ensure(conn, skill), _ts(rng))
+        for i in range(1, candidates + 1)
+        for skill in rng.sample(SKILL_POOL, rng.randint(lo, hi))
+    ))
+
+    # ---------- CERTIFICATES (metadata only) ----------
+    lo, hi = certificates_per_candidate
+    _insert(conn, "certificates", """
+        INSERT INTO certificates (user_id, certificate_type, file_path, uploaded_at) VALUES (?, ?, ?, ?)
+    """, (
+        (cand_base + i, cert, f"uploads/certificates/user_{cand_base + i}/{cert.lower().replace(' ', '_')}.pdf", _ts(rng))
+        for i in range(1, candidates + 1)
+        for cert in rng.sample(CERT_TYPES, rng.randint(lo, hi))
+    ))
+
+    # ---------- JOB POSTS ----------
+    # free-text skills like HR types them: mixed case, uneven spacing
+    lo, hi = skills_per_job
+
+    picked_skills = []
+
+    def job_skills():
+        picked = rng.sample(SKILL_POOL, rng.randint(lo, hi))
+        picked_skills.append(picked)
+        return " , ".join(s.title() if rng.random() < 0.3 else s for s in picked)
+
+    _insert(conn, "job_posts", """
+        INSERT INTO job_posts (company_id, hr_id, role, skills, experience, salary, location, description, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        (
+            company_base + c,
+            hr_base + c,
+            rng.choice(ROLES),
+            job_skills(),
+            f"{rng.randint(0, 8)}+ years",
+            f"{rng.randint(3, 30)} LPA",
+            rng.choice(CITIES),
+            "Synthetic job description for load testing.",
+            "open" if rng.random() < 0.85 else "closed",
+            _ts(rng),
+        )
+        for c in (rng.randint(1, companies) for _ in range(jobs))
+    ))
+    _insert(conn, "job_skills", """
+        INSERT INTO job_skills (job_id, skill_id, skill, position) VALUES (?, ?, ?, ?)
+    """, (
+        (job_base + j, dictionary.ensure(conn, skill), skill, pos)
+        for j, picked in enumerate(picked_skills, start=1)
+        for pos, skill in enumerate(picked)
+    ))
+
+    # ---------- APPLICATIONS ----------
+    # spread evenly-ish over candidates; each candidate applies to distinct jobs
+    per_candidate = applications / candidates if candidates else 0
+
+    def application_rows():
+        remaining = applications
+        for i in range(1, candidates + 1):
+            if remaining <= 0:
+                return
+            k = min(remaining, jobs, max(0, int(rng.gauss(per_candidate, per_candidate / 3) + 0.5)))
+            if i == candidates:
+                k = min(remaining, jobs)
+            remaining -= k
+            for j in rng.sample(range(1, jobs + 1), k):
+                yield (job_base + j, cand_base + i, _ts(rng))
+
+    _insert(conn, "applications", """
+        INSERT OR IGNORE INTO job_applications (job_id, candidate_id, applied_at) VALUES (?, ?, ?)
+    """, application_rows())
+
+    start = time.perf_counter()
+    backfill_skill_bits(conn)
+    conn.commit()
+    print(f"  {'skill bitsets':<14}{'':>12}       {time.perf_counter() - start:7.2f}s")
+
+    start = time.perf_counter()
+    rebuild_all(conn)
+    conn.commit()
+    n = conn.execute("SELECT COUNT(*) FROM job_match_scores").fetchone()[0]
+    print(f"  {'match scores':<14}{n:>12,} rows  {time.perf_counter() - start:7.2f}s")
+
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+    pool.close_all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", required=True, help="database file to create or extend")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--companies", type=int, default=5_000)
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--applications", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    if os.path.abspath(args.db) == os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "trusthire.db")):
+        parser.error("refusing to seed the application database; pass a separate --db file")
+
+    start = time.perf_counter()
+    seed(args.db, args.candidates, args.companies, args.jobs, args.applications, seed=args.seed)
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,64 +1,83 @@
 import streamlit as st
 from datetime import datetime
 from db import get_connection
+from utils.events import emit, APPLICATION_CREATED
 
-from jobmatch.retrieve_score import retrieve_match_result
+from jobmatch.match_scores import get_match_scores
+from jobmatch.minhash_lsh import similar_jobs
+from jobmatch.store_data import get_candidate_skill_ids, get_open_jobs_for_candidate
+from jobmatch.skill_index import top_jobs_for_skills
+from jobmatch.tfidf_match import score_user_against_jobs
 from jobmatch.display_result import display_match_result
 
+MATCH_MODES = ["Skills", "Resume text (TF-IDF)"]
+
 
 def browse_jobs_page(user):
     st.title("💼 Browse Jobs")
 
-    conn = get_connection()
-    jobs = conn.execute("""
-        SELECT
-            jp.id,
-            jp.role,
-            jp.location,
-            jp.experience,
-            jp.skills,
-            jp.description,
-            c.name
-        FROM job_posts jp
-        JOIN companies c ON jp.company_id = c.id
-        WHERE jp.status = 'open'
-        ORDER BY jp.created_at DESC
-    """).fetchall()
-    conn.close()
+    # two set-based queries for the whole page (no per-job lookups)
+    jobs = get_open_jobs_for_candidate(user["id"])
+    candidate_skills = get_candidate_skill_ids(user["id"])
 
     if not jobs:
         st.warning("No jobs posted yet.")
         return
 
+    # ⭐ TOP MATCHES (inverted index: only jobs sharing a skill are scored)
+    by_id = {job["id"]: job for job in jobs}
+    top = [(by_id[job_id], score) for job_id, score, _ in top_jobs_for_skills(candidate_skills, k=5) if job_id in by_id]
+    if top:
+        st.subheader("⭐ Recommended for you")
+        for job, score in top:
+            st.write(f"**{job['role']}** · {job['company']} · {job['location']} — {score}% match")
+
+    mode = st.radio("Match by", MATCH_MODES, horizontal=True, key="match_mode")
+    if mode == MATCH_MODES[1]:
+        # one matrix-vector product for every job
+        scores = score_user_against_jobs(user["id"])
+    else:
+        # materialised job_match_scores: one indexed read, already best first
+        scores = {job_id: score for job_id, score, _ in get_match_scores(user["id"])}
+    jobs = sorted(jobs, key=lambda j: -scores.get(j["id"], 0.0))
+    have = set(candidate_skills)
+
     # 🔽 IMPORTANT: EVERYTHING BELOW IS INSIDE THE LOOP
     for job in jobs:
-        job_id, role, location, experience, skills, description, company = job
+        job_id = job["id"]
 
         st.markdown("---")
-        st.subheader(role)
-        st.write(f"🏢 Company: {company}")
-        st.write(f"📍 Location: {location}")
-        st.write(f"📄 Experience: {experience}")
-        st.write(f"🧠 Skills Required: {skills}")
-        st.write(description)
+        st.subheader(job["role"])
+        st.write(f"🏢 Company: {job['company']}")
+        st.write(f"📍 Location: {job['location']}")
+        st.write(f"📄 Experience: {job['experience']}")
+        st.write(f"🧠 Skills Required: {job['skills']}")
+        st.write(job["description"])
 
         # ✅ JOB MATCH SCORE (ALWAYS VISIBLE)
         try:
-            score, matched, missing = retrieve_match_result(user["id"], job_id)
-            display_match_result(score, missing)
+            score = scores.get(job_id, 0.0)
+            if mode == MATCH_MODES[1]:
+                st.progress(min(int(score), 100))
+                st.info(f"📄 Resume similarity: {score:.0f}%")
+            else:
+                # stored score (no row: nothing shared); only the names of missing skills are listed here
+                missing = [name for name, i in zip(job["skill_list"], job["skill_ids"]) if i not in have]
+                display_match_result(score, missing)
         except Exception as e:
             st.error("Error calculating match score")
             st.exception(e)
 
-        # ✅ CHECK APPLICATION STATUS
-        conn = get_connection()
-        applied = conn.execute(
-            "SELECT 1 FROM job_applications WHERE job_id=? AND candidate_id=?",
-            (job_id, user["id"])
-        ).fetchone()
-        conn.close()
+        # 🔗 SIMILAR JOBS (LSH lookup only when asked for)
+        if st.button("🔗 Similar jobs", key=f"similar_{job_id}"):
+            similar = [(by_id[jid], sim) for jid, sim in similar_jobs(job_id, k=5) if jid in by_id]
+            for other, sim in similar:
+                st.write(f"• {other['role']} · {other['company']} — {sim:.0%} same skills")
+            if not similar:
+                st.info("No similar open jobs.")
 
-        if applied:
+        # ✅ APPLICATION STATUS (already fetched with the job)
+        if job["applied"]:
             st.warning("⚠️ You already applied for this job")
         else:
             if st.button("Apply", key=f"apply_{job_id}"):
@@ -69,7 +88,7 @@ def browse_jobs_page(user):
 
 def apply_job(candidate_id, job_id):
     conn = get_connection()
-    conn.execute("""
+    cur = conn.execute("""
         INSERT OR IGNORE INTO job_applications
         (job_id, candidate_id, applied_at)
         VALUES (?, ?, ?)
@@ -79,4 +98,6 @@ def apply_job(candidate_id, job_id):
         datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     ))
     conn.commit()
-    conn.close()
\ No newline at end of file
+    conn.close()
+    if cur.rowcount:
+        emit(APPLICATION_CREATED, job_id=job_id, candidate_id=candidate_id)
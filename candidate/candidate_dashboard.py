@@ -6,8 +6,12 @@ import sqlite3
 import hashlib
 from datetime import datetime
 
-from candidate.resume_parser import parse_resume
-from db import get_connection, create_tables
+from candidate.parse_queue import latest_job, submit_parse
+from candidate.resume_parser import file_hash, get_cached_parse, parse_resume
+from db import get_connection, hot_query
+from jobmatch.match_scores import get_match_scores
+from jobmatch.store_data import get_open_jobs, get_applied_jobs
+from utils.events import emit, APPLICATION_CREATED, SKILLS_CHANGED
 
 
 # ---------- CONFIG ----------
@@ -25,22 +29,6 @@ CERT_TYPES = [
     "Other",
 ]
 
-PROFILE_COLUMNS = {
-    "name": "TEXT",
-    "email": "TEXT",
-    "phone": "TEXT",
-    "gender": "TEXT",
-    "nationality": "TEXT",
-    "address": "TEXT",
-    "summary": "TEXT",
-    "education": "TEXT",
-    "experience": "TEXT",
-    "linkedin": "TEXT",
-    "github": "TEXT",
-    "updated_at": "TEXT",
-}
-
-
 # ---------- SMALL HELPERS ----------
 def nice_value(v):
     if v is None:
@@ -93,37 +81,7 @@ def show_points(raw: str):
 
 
 # ---------- DB HELPERS ----------
-def ensure_candidate_profile_table():
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS candidate_profile (
-            user_id INTEGER PRIMARY KEY,
-            name TEXT,
-            email TEXT,
-            phone TEXT,
-            updated_at TEXT,
-            FOREIGN KEY(user_id) REFERENCES users(id)
-        )
-        """
-    )
-    conn.commit()
-
-    cur.execute("PRAGMA table_info(candidate_profile)")
-    existing_cols = {row[1] for row in cur.fetchall()}
-
-    for col, col_type in PROFILE_COLUMNS.items():
-        if col not in existing_cols and col != "user_id":
-            cur.execute(f"ALTER TABLE candidate_profile ADD COLUMN {col} {col_type}")
-            conn.commit()
-
-    conn.close()
-
-
 def get_saved_candidate_profile(user_id):
-    ensure_candidate_profile_table()
     conn = get_connection()
     row = conn.execute(
         """
@@ -160,7 +118,6 @@ def get_saved_candidate_profile(user_id):
 
 
 def save_candidate_profile(user_id, data: dict):
-    ensure_candidate_profile_table()
     conn = get_connection()
 
     conn.execute(
@@ -212,7 +169,6 @@ def reset_resume_fields_in_profile(user_id: int):
     When a new resume is uploaded, reset resume-driven fields
     but keep manual personal fields (gender/nationality/address).
     """
-    ensure_candidate_profile_table()
     conn = get_connection()
     conn.execute(
         """
@@ -307,12 +263,29 @@ def merged_profile(user_id, parsed_data: dict, profile_basic: dict):
     }
 
 
+def _apply_parsed(user_id: int, parsed: dict):
+    st.session_state.parsed_data = parsed
+    st.session_state.pop("parse_job_id", None)
+    _save_parsed_into_profile(user_id, parsed)
+
+
+def _submit_resume(user_id: int, resume_path: str, content_hash: str):
+    """Parsed dict when already known (cache hit); otherwise queue it and remember the job."""
+    parsed, job_id = submit_parse(user_id, resume_path, content_hash)
+    if parsed and isinstance(parsed, dict):
+        _apply_parsed(user_id, parsed)
+        return parsed
+    if job_id:
+        st.session_state.parse_job_id = job_id
+    return None
+
+
 def load_resume_if_exists(user_id: int):
     """
-    Auto-load and parse resume on dashboard load if resume_path exists
-    and session doesn't have parsed_data yet.
+    Auto-load the parsed resume on dashboard load if resume_path exists
+    and session doesn't have parsed_data yet (cache hit, or a background parse).
     """
-    if st.session_state.get("parsed_data") is not None:
+    if st.session_state.get("parsed_data") is not None or st.session_state.get("parse_job_id"):
         return
 
     conn = get_connection()
@@ -321,10 +294,35 @@ def load_resume_if_exists(user_id: int):
 
     resume_path = row[0] if row else None
     if resume_path and os.path.exists(resume_path):
-        parsed = parse_resume(user_id, resume_path)
-        if parsed and isinstance(parsed, dict):
-            st.session_state.parsed_data = parsed
-            _save_parsed_into_profile(user_id, parsed)
+        _submit_resume(user_id, resume_path, file_hash(resume_path))
+
+
+@st.fragment(run_every=2)
+def _parse_status(user_id: int):
+    """Polls the background parse started by an upload / login until it finishes."""
+    job = latest_job(user_id)
+    if not job or job["id"] != st.session_state.get("parse_job_id"):
+        return
+    if job["status"] in ("queued", "running"):
+        st.info("⏳ Parsing your resume in the background. Your profile will update when it is done.")
+    elif job["status"] == "done":
+        parsed = get_cached_parse(job["content_hash"])
+        if parsed is None:
+            # the worker's result is keyed by the parser and vocabulary it ran
+            # with; if either moved on since, parse here instead of polling forever
+            st.warning("The background parse result is out of date; parsing your resume again.")
+            parsed = parse_resume(user_id, job["resume_path"], content_hash=job["content_hash"])
+        if parsed:
+            _apply_parsed(user_id, parsed)
+            # skills were saved in the worker process; refresh this process's indexes
+            emit(SKILLS_CHANGED, user_id=user_id, added=[], removed=[])
+            st.rerun(scope="app")
+        else:
+            st.session_state.pop("parse_job_id", None)
+            st.warning("Resume uploaded, but parsing returned no text/data (scanned PDFs need OCR).")
+    else:
+        st.session_state.pop("parse_job_id", None)
+        st.warning(f"Resume uploaded, but parsing failed: {job['error'] or job['status']}")
 
 
 # ---------- STYLING ----------
@@ -514,18 +512,6 @@ def upload_certificate(user_id, cert_type, uploaded_file):
         f.write(uploaded_file.getbuffer())
 
     conn = get_connection()
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS certificates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            certificate_type TEXT NOT NULL,
-            file_path TEXT NOT NULL,
-            uploaded_at TEXT,
-            FOREIGN KEY(user_id) REFERENCES users(id)
-        )
-        """
-    )
     conn.execute(
         """
         INSERT INTO certificates (user_id, certificate_type, file_path, uploaded_at)
@@ -543,27 +529,26 @@ def upload_certificate(user_id, cert_type, uploaded_file):
 def show_available_jobs(user_id):
     st.subheader("Available Jobs")
 
-    conn = get_connection()
-    jobs = conn.execute(
-        """
-        SELECT jp.id, jp.role, c.name, jp.experience, jp.skills, jp.salary, jp.status
-        FROM job_posts jp
-        JOIN companies c ON jp.company_id = c.id
-        WHERE jp.status='open'
-        ORDER BY jp.created_at DESC
-        """
-    ).fetchall()
-    conn.close()
+    # shared, cached listing (invalidated when HR posts/edits/closes/deletes)
+    jobs = get_open_jobs()
 
     if not jobs:
         st.info("No jobs available at the moment.")
         return
 
+    # precomputed skill match per job (job_match_scores), one indexed query;
+    # jobs without a row share no skill with the candidate
+    stored = {job_id: score for job_id, score, _ in get_match_scores(user_id)}
+    scores = {job["id"]: stored.get(job["id"], 0.0) for job in jobs}
+    if st.toggle("Best match first", value=True, key="jobs_sort_by_match"):
+        jobs = sorted(jobs, key=lambda j: -scores[j["id"]])
+
     cols_per_row = 3
     for i in range(0, len(jobs), cols_per_row):
         cols = st.columns(cols_per_row)
         for col, job in zip(cols, jobs[i : i + cols_per_row]):
-            job_id, title, company, experience, skills, salary, status = job
+            job_id, title, company = job["id"], job["role"], job["company"]
+            experience, skills, salary = job["experience"], job["skills"], job["salary"]
             with col:
                 st.markdown(
                     f"""
@@ -574,6 +559,7 @@ def show_available_jobs(user_id):
                         <p><b>Experience:</b> {experience or '—'}</p>
                         <p><b>Skills:</b> {skills or '—'}</p>
                         <p><b>Salary:</b> {salary or '—'}</p>
+                        <p><b>Skill match:</b> {scores[job_id]:.0f}%</p>
                     </div>
                     """,
                     unsafe_allow_html=True,
@@ -582,19 +568,6 @@ def show_available_jobs(user_id):
                 if st.button("Apply", key=f"apply_{job_id}_{user_id}"):
                     conn2 = get_connection()
                     try:
-                        conn2.execute(
-                            """
-                            CREATE TABLE IF NOT EXISTS job_applications (
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                job_id INTEGER NOT NULL,
-                                candidate_id INTEGER NOT NULL,
-                                applied_at TEXT,
-                                UNIQUE(job_id, candidate_id),
-                                FOREIGN KEY(job_id) REFERENCES job_posts(id),
-                                FOREIGN KEY(candidate_id) REFERENCES users(id)
-                            )
-                            """
-                        )
                         conn2.execute(
                             """
                             INSERT INTO job_applications (job_id, candidate_id, applied_at)
@@ -603,6 +576,7 @@ def show_available_jobs(user_id):
                             (job_id, user_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
                         )
                         conn2.commit()
+                        emit(APPLICATION_CREATED, job_id=job_id, candidate_id=user_id)
                         st.success("✅ Applied successfully")
                     except sqlite3.IntegrityError:
                         st.warning("⚠️ You already applied for this job")
@@ -613,26 +587,7 @@ def show_available_jobs(user_id):
 def show_applied_jobs(user_id):
     st.subheader("Applied Jobs")
 
-    conn = get_connection()
-    rows = conn.execute(
-        """
-        SELECT
-            ja.id,
-            jp.role,
-            c.name,
-            jp.experience,
-            jp.skills,
-            jp.salary,
-            ja.applied_at
-        FROM job_applications ja
-        JOIN job_posts jp ON ja.job_id = jp.id
-        JOIN companies c ON jp.company_id = c.id
-        WHERE ja.candidate_id = ?
-        ORDER BY ja.applied_at DESC
-        """,
-        (user_id,),
-    ).fetchall()
-    conn.close()
+    rows = get_applied_jobs(user_id)
 
     if not rows:
         st.info("You have not applied for any jobs yet.")
@@ -660,6 +615,13 @@ def show_applied_jobs(user_id):
                 )
 
 
+_USER_SKILLS_SQL = hot_query(
+    "user_skills",
+    "SELECT DISTINCT skill FROM user_skills WHERE user_id=? ORDER BY skill",
+    (1,),
+)
+
+
 # ---------- VIEW RENDERERS ----------
 def render_dashboard_home(user, profile_basic):
     user_id = user["id"] if isinstance(user, dict) else user[0]
@@ -800,10 +762,7 @@ def render_dashboard_home(user, profile_basic):
 
         # Skills chips (from DB saved by resume_parser.py)
         conn = get_connection()
-        skills = conn.execute(
-            "SELECT DISTINCT skill FROM user_skills WHERE user_id=? ORDER BY skill",
-            (user_id,),
-        ).fetchall()
+        skills = conn.execute(_USER_SKILLS_SQL, (user_id,)).fetchall()
         conn.close()
 
         st.markdown("**Skills**")
@@ -830,14 +789,12 @@ def render_dashboard_home(user, profile_basic):
 
         resume = st.file_uploader("Upload Resume", type=["pdf", "docx"], key=f"resume_{user_id}")
 
-        if resume:
-            new_hash = _file_hash(resume)
-
-            if st.session_state.get("resume_hash") != new_hash:
-                st.session_state.resume_hash = new_hash
-                st.session_state.parsed_data = None
-                st.session_state.editing_profile = False
-                reset_resume_fields_in_profile(user_id)
+        new_hash = _file_hash(resume) if resume else None
+        if resume and st.session_state.get("resume_hash") != new_hash:
+            st.session_state.resume_hash = new_hash
+            st.session_state.parsed_data = None
+            st.session_state.editing_profile = False
+            reset_resume_fields_in_profile(user_id)
 
             os.makedirs(RESUME_DIR, exist_ok=True)
             resume_path = os.path.join(
@@ -854,16 +811,16 @@ def render_dashboard_home(user, profile_basic):
             conn.commit()
             conn.close()
 
-            # Parse and save results
-            parsed = parse_resume(user_id, resume_path)
-            if parsed and isinstance(parsed, dict):
-                st.session_state.parsed_data = parsed
-                _save_parsed_into_profile(user_id, parsed)
+            # Parse: instant on a cache hit, otherwise queued for the parse workers
+            if _submit_resume(user_id, resume_path, new_hash):
                 st.success("✅ Resume uploaded & parsed successfully. Profile updated.")
                 st.rerun()
-            else:
+            elif not st.session_state.get("parse_job_id"):
                 st.warning("Resume uploaded, but parsing returned no text/data (scanned PDFs need OCR).")
 
+        if st.session_state.get("parse_job_id"):
+            _parse_status(user_id)
+
         st.markdown("</div>", unsafe_allow_html=True)
 
     # C) CERTIFICATE UPLOAD CARD
@@ -950,9 +907,6 @@ def render_applied_jobs_page(user, profile_basic):
 
 # ---------- DASHBOARD ENTRY POINT ----------
 def candidate_dashboard(user):
-    create_tables()
-    ensure_candidate_profile_table()
-
     st.session_state.setdefault("parsed_data", None)
     st.session_state.setdefault("editing_profile", False)
     st.session_state.setdefault("resume_hash", None)
@@ -0,0 +1,203 @@
+# candidate/parse_queue.py
+"""
+Durable resume-parse queue (parse_jobs table) drained by worker processes.
+
+    python -m candidate.parse_queue                  # TRUSTHIRE_PARSE_WORKERS processes (at least 1)
+    python -m candidate.parse_queue --workers 4
+
+The dashboard calls submit_parse() on upload: a cached result (parsed_resumes)
+comes back at once, anything else is parsed inline or, when
+TRUSTHIRE_PARSE_WORKERS > 0, queued while the page polls latest_job().
+Workers claim the oldest queued row in one UPDATE ... RETURNING, run
+parse_resume (which fills parsed_resumes and user_skills) and mark the row
+done / failed. Rows left "running" by a crashed worker are picked up again
+after STALE_AFTER seconds, up to MAX_ATTEMPTS times.
+
+The app does not start workers itself, so parsing stays inline in the
+Streamlit process (TRUSTHIRE_PARSE_WORKERS=0, the default) unless the variable
+is set for the app and the command above is running next to it; otherwise
+uploads would sit in the queue forever.
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from datetime import datetime, timedelta
+
+from db import get_connection, hot_query
+
+WORKERS = int(os.environ.get("TRUSTHIRE_PARSE_WORKERS", "0"))
+POLL_INTERVAL = float(os.environ.get("TRUSTHIRE_PARSE_POLL", "1.0"))
+STALE_AFTER = int(os.environ.get("TRUSTHIRE_PARSE_STALE_AFTER", "600"))
+MAX_ATTEMPTS = 3
+
+
+def _now(offset=0):
+    return (datetime.now() - timedelta(seconds=offset)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+# ---------- APP SIDE ----------
+def enqueue(user_id, resume_path, content_hash):
+    """Queue a parse; returns the job id. Re-uploading the same file reuses the pending job."""
+    conn = get_connection()
+    try:
+        row = conn.execute("""
+            SELECT id FROM parse_jobs
+            WHERE user_id=? AND content_hash=? AND status IN ('queued', 'running')
+            ORDER BY id DESC LIMIT 1
+        """, (user_id, content_hash)).fetchone()
+        if row:
+            return row[0]
+        # an older upload still waiting is not worth parsing any more
+        conn.execute(
+            "UPDATE parse_jobs SET status='superseded', finished_at=? WHERE user_id=? AND status='queued'",
+            (_now(), user_id),
+        )
+        cur = conn.execute("""
+            INSERT INTO parse_jobs (user_id, resume_path, content_hash, status, attempts, created_at)
+            VALUES (?, ?, ?, 'queued', 0, ?)
+        """, (user_id, resume_path, content_hash, _now()))
+        conn.commit()
+        return cur.lastrowid
+    finally:
+        conn.close()
+
+
+def submit_parse(user_id, resume_path, content_hash):
+    """
+    (parsed, job_id): parsed is the result when it is already known (cache
+    hit, or inline mode); otherwise None and job_id is the queued job to poll.
+    """
+    from candidate.resume_parser import get_cached_parse, parse_resume
+
+    if WORKERS <= 0 or get_cached_parse(content_hash) is not None:
+        return parse_resume(user_id, resume_path, content_hash=content_hash), None
+    return None, enqueue(user_id, resume_path, content_hash)
+
+
+_LATEST_JOB_SQL = hot_query("parse_job_latest", """
+    SELECT id, status, resume_path, content_hash, error, created_at, finished_at
+    FROM parse_jobs WHERE user_id=? ORDER BY id DESC LIMIT 1
+""", (1,))
+
+
+def latest_job(user_id):
+    """The candidate's newest parse job as a dict, or None."""
+    conn = get_connection()
+    row = conn.execute(_LATEST_JOB_SQL, (user_id,)).fetchone()
+    conn.close()
+    if not row:
+        return None
+    keys = ("id", "status", "resume_path", "content_hash", "error", "created_at", "finished_at")
+    return dict(zip(keys, row))
+
+
+# ---------- WORKER SIDE ----------
+_TIME_OUT_SQL = hot_query("parse_job_time_out", """
+    UPDATE parse_jobs SET status='failed', error='timed out', finished_at=?
+    WHERE status='running' AND started_at < ? AND attempts >= ?
+""", ("2000-01-01 00:00:00", "2000-01-01 00:00:00", 3))
+
+_CLAIM_SQL = hot_query("parse_job_claim", """
+    UPDATE parse_jobs
+    SET status='running', attempts=attempts + 1, started_at=?, worker=?
+    WHERE id = (
+        SELECT id FROM parse_jobs
+        WHERE status='queued' OR (status='running' AND started_at < ?)
+        ORDER BY id LIMIT 1
+    )
+    RETURNING id, user_id, resume_path, content_hash
+""", ("2000-01-01 00:00:00", "pid-1", "2000-01-01 00:00:00"))
+
+
+def claim_next(worker=""):
+    """Mark the oldest runnable job running and return (id, user_id, resume_path, content_hash)."""
+    conn = get_connection()
+    try:
+        stale = _now(STALE_AFTER)
+        conn.execute(_TIME_OUT_SQL, (_now(), stale, MAX_ATTEMPTS))
+        row = conn.execute(_CLAIM_SQL, (_now(), worker, stale)).fetchone()
+        conn.commit()
+        return row
+    finally:
+        conn.close()
+
+
+def _finish(job_id, status, error=None):
+    conn = get_connection()
+    try:
+        conn.execute(
+            "UPDATE parse_jobs SET status=?, error=?, finished_at=? WHERE id=?",
+            (status, error, _now(), job_id),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run_job(job):
+    from candidate.resume_parser import parse_resume
+
+    job_id, user_id, resume_path, content_hash = job
+    start = time.perf_counter()
+    try:
+        parsed = parse_resume(user_id, resume_path, content_hash=content_hash)
+    except Exception as e:
+        conn = get_connection()
+        attempts = conn.execute("SELECT attempts FROM parse_jobs WHERE id=?", (job_id,)).fetchone()[0]
+        conn.close()
+        _finish(job_id, "failed" if attempts >= MAX_ATTEMPTS else "queued", str(e)[:500])
+        print(f"❌ parse job {job_id} (user {user_id}) failed: {e}")
+        return
+    if parsed is None:
+        _finish(job_id, "failed", "no text could be extracted (scanned PDFs need OCR)")
+    else:
+        _finish(job_id, "done")
+    print(f"📄 parse job {job_id} (user {user_id}) in {time.perf_counter() - start:.1f}s")
+
+
+def worker_loop(stop, poll_interval=POLL_INTERVAL):
+    # Ctrl+C reaches the whole process group; the parent decides when to stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    name = f"pid-{os.getpid()}"
+    while not stop.is_set():
+        job = claim_next(name)
+        if job is None:
+            stop.wait(poll_interval)
+            continue
+        run_job(job)
+
+
+def run(workers=WORKERS, poll_interval=POLL_INTERVAL):
+    # spawn: every worker opens its own database connections
+    ctx = multiprocessing.get_context("spawn")
+    stop = ctx.Event()
+    procs = [ctx.Process(target=worker_loop, args=(stop, poll_interval)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    # SIGTERM / Ctrl+C: workers finish the job in hand, then exit
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    print(f"✅ {workers} resume parse workers running (Ctrl+C to stop)")
+    try:
+        while any(p.is_alive() for p in procs):
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        print("⏹ Stopping parse workers")
+    stop.set()
+    for p in procs:
+        p.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=max(WORKERS, 1), help="parser processes")
+    parser.add_argument("--poll", type=float, default=POLL_INTERVAL, help="seconds between queue checks when idle")
+    args = parser.parse_args(argv)
+    run(args.workers, args.poll)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# candidate/pdf_pages.py
+"""
+Per-page PDF text extraction for resume_parser.extract_text.
+
+Kept apart from resume_parser so pool workers only import pdfplumber,
+not spaCy or the database layer. Documents with at least PARALLEL_PAGES
+pages are split into contiguous page ranges, one per worker; each worker
+opens the file itself and returns its pages' text in order. On a single
+CPU, or when there are too few pages to give every worker
+MIN_PAGES_PER_WORKER of them, extraction stays serial: starting the
+workers would cost more than it saves.
+
+    TRUSTHIRE_PDF_PARALLEL_PAGES   page count that switches to the pool (default 12)
+    TRUSTHIRE_PDF_WORKERS          pool size (default min(4, CPUs)); 1 disables it
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pdfplumber
+
+PARALLEL_PAGES = int(os.environ.get("TRUSTHIRE_PDF_PARALLEL_PAGES", "12"))
+WORKERS = int(os.environ.get("TRUSTHIRE_PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+MIN_PAGES_PER_WORKER = 2
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _page_text(page):
+    return page.extract_text(x_tolerance=2, y_tolerance=2)
+
+
+def extract_page_range(file_path, start, stop):
+    """Text of pages[start:stop] (None for pages without text)."""
+    with pdfplumber.open(file_path) as pdf:
+        return [_page_text(page) for page in pdf.pages[start:stop]]
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: never fork a multi-threaded Streamlit server
+            _pool = ProcessPoolExecutor(WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _pool_workers(n_pages):
+    """Workers to split n_pages across; below 2 means extract serially."""
+    if (os.cpu_count() or 1) < 2 or multiprocessing.current_process().daemon:
+        # one CPU gains nothing; daemonic processes may not have children
+        return 1
+    return min(WORKERS, n_pages // MIN_PAGES_PER_WORKER)
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def extract_pdf_text(file_path, parallel=None):
+    """
+    All page texts joined by newlines. parallel=None picks the pool when the
+    document has at least PARALLEL_PAGES pages; True / False force a mode,
+    though True still falls back to serial where the pool cannot help.
+    """
+    with pdfplumber.open(file_path) as pdf:
+        n = len(pdf.pages)
+        if parallel is None:
+            parallel = n >= PARALLEL_PAGES
+        workers = _pool_workers(n) if parallel else 1
+        if workers < 2:
+            parts = [_page_text(page) for page in pdf.pages]
+            return "\n".join(p for p in parts if p)
+
+    step = -(-n // workers)
+    try:
+        futures = [
+            _get_pool().submit(extract_page_range, file_path, start, min(start + step, n))
+            for start in range(0, n, step)
+        ]
+        return "\n".join(p for f in futures for p in f.result() if p)
+    except BrokenProcessPool:
+        # a worker died (e.g. killed for memory): start a fresh pool next time
+        _reset_pool()
+        return extract_pdf_text(file_path, parallel=False)
@@ -1,16 +1,23 @@
 # candidate/resume_parser.py
 
 
+import hashlib
+import json
 import logging
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
 import os
 import re
 from datetime import datetime
 
-import pdfplumber
 from docx import Document
 
-from db import get_connection
+from candidate.pdf_pages import extract_pdf_text
+from db import get_connection, hot_query
+from jobmatch.skill_automaton import get_automaton
+from jobmatch.skill_bits import save_user_bits
+from jobmatch.skill_dictionary import get_dictionary, normalize_skill, skill_ids
+from jobmatch import match_scores  # noqa: F401  (keeps job_match_scores in step with SKILLS_CHANGED)
+from utils.events import emit, SKILLS_CHANGED
 
 
 # =========================
@@ -57,11 +64,8 @@ def extract_text(file_path: str) -> str:
 
     if file_path.lower().endswith(".pdf"):
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    t = page.extract_text(x_tolerance=2, y_tolerance=2)
-                    if t:
-                        text += t + "\n"
+            # long documents are split across a process pool (candidate.pdf_pages)
+            text = extract_pdf_text(file_path)
         except Exception:
             text = ""
 
@@ -74,9 +78,7 @@ def extract_text(file_path: str) -> str:
     elif file_path.lower().endswith(".docx"):
         try:
             doc = Document(file_path)
-            for p in doc.paragraphs:
-                if p.text:
-                    text += p.text + "\n"
+            text = "\n".join(p.text for p in doc.paragraphs if p.text)
         except Exception:
             text = ""
 
@@ -109,135 +111,189 @@ def _first_match(patterns, text, flags=re.IGNORECASE):
     return None
 
 
-def _extract_labeled_value(text: str, labels):
-    """
-    Extracts a single-line value after a label.
-    Works for:
-      "Email: x"
-      "E-MAIL : x"
-      "MOB: 999..."
-      "Address something"
-    """
-    for lab in labels:
-        m = re.search(rf"\b{lab}\b\s*[:\-]?\s*(.+)", text, re.IGNORECASE)
+# =========================
+# FIELD RULES
+# =========================
+# Every single-value field is one precompiled rule, and extract_fields
+# evaluates the whole table against one shared lowercase copy of the text.
+# Rules with a literal anchor jump straight to the anchor with str.find and
+# only run the regex there, instead of an IGNORECASE re.search walking the
+# whole text once per label. Answers are the same as re.search(rule, text).
+_LABEL_VALUE = r"(?i)\b{}\b\s*[:\-]?\s*(.+)"
+
+# name: (pattern, anchor in the lowercased text or None, chars a match may start before the anchor)
+FIELD_RULES = {
+    "email": (r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", None, 0),
+    # 10-digit Indian mobile (starting 6-9), optionally +91; spaces / dashes allowed in between
+    "phone": (r"(?:\+[ -]*9[ -]*1[ -]*)?[6-9](?:[ -]*\d){9}", None, 0),
+    "linkedin": (r"(?i)(https?://)?(www\.)?linkedin\.com/[A-Za-z0-9\-_/]+", "linkedin.com/", len("https://www.")),
+    "linkedin_short": (r"(?i)\bin/[A-Za-z0-9\-_]+", "in/", 0),
+    "github": (r"(?i)(https?://)?(www\.)?github\.com/[A-Za-z0-9\-_/]+", "github.com/", len("https://www.")),
+    "gender": (_LABEL_VALUE.format("gender"), "gender", 0),
+    "nationality": (_LABEL_VALUE.format("nationality"), "nationality", 0),
+    "address": (_LABEL_VALUE.format("address"), "address", 0),
+    "locality": (_LABEL_VALUE.format("locality"), "locality", 0),
+    "location": (_LABEL_VALUE.format("location"), "location", 0),
+}
+_RULES = [
+    (name, re.compile(pattern), anchor, back)
+    for name, (pattern, anchor, back) in FIELD_RULES.items()
+]
+
+# (?i) matches these where str.lower() keeps them apart (or changes the length)
+_FIND_UNSAFE = ("\u0130", "\u0131", "\u017f")
+
+_MULTI_SPACE = re.compile(r"\s{2,}")
+_PHONE_SEPARATORS = re.compile(r"[ -]")
+
+_PERSONAL_END = re.compile(r"^\s*(education|projects|skills|experience|internships)\b", re.IGNORECASE)
+_PERSONAL_KEYS = ("gender", "nationality", "address", "locality")
+_PERSONAL_KEY = re.compile(
+    r"^\s*(?:" + "|".join(f"(?P<{k}>{k})" for k in _PERSONAL_KEYS) + r")\s*[:\-]?\s*(?P<value>.+)$",
+    re.IGNORECASE,
+)
+
+
+def _first_rule_match(rule, text, low, anchor, back):
+    if low is None or anchor is None:
+        return rule.search(text)
+    q = low.find(anchor)
+    if back:
+        # nothing can match before the first anchor minus the optional prefix
+        return rule.search(text, max(0, q - back)) if q != -1 else None
+    while q != -1:
+        m = rule.match(text, q)
         if m:
-            v = m.group(1).strip()
-            # stop at double spaces that start next field in same line (common in table resumes)
-            v = re.split(r"\s{2,}", v)[0].strip()
-            return v
+            return m
+        q = low.find(anchor, q + 1)
     return None
 
 
-def _extract_from_personal_details_block(text: str, key: str):
+def _match_rules(text: str, low):
+    """{rule name: first match} for every rule in FIELD_RULES that matches."""
+    found = {}
+    for name, rule, anchor, back in _RULES:
+        m = _first_rule_match(rule, text, low, anchor, back)
+        if m:
+            found[name] = m
+    return found
+
+
+def _labeled_value(m):
+    """
+    Single-line value after a label:
+      "Email: x", "E-MAIL : x", "MOB: 999...", "Address something"
     """
-    Handles resumes like:
+    if not m:
+        return None
+    # stop at double spaces that start next field in same line (common in table resumes)
+    return _MULTI_SPACE.split(m.group(1).strip())[0].strip()
+
+
+def _personal_details(text: str, low: str):
+    """
+    {key: value} from blocks like the one below, first line per key, one pass:
       PERSONAL DETAILS
       Address Eriyattuparambil (H) ...
       Locality Malappuram ,Kerala
       Gender Female
       Nationality India
     """
-    low = text.lower()
     idx = low.find("personal details")
     if idx == -1:
         idx = low.find("personal information")
     if idx == -1:
-        return None
-
-    block = text[idx: idx + 1200]  # enough chunk
-    lines = _lines(block)
+        return {}
 
-    for ln in lines:
-        if re.match(r"^\s*(education|projects|skills|experience|internships)\b", ln, re.IGNORECASE):
+    out = {}
+    for ln in _lines(text[idx: idx + 1200]):  # enough chunk
+        if _PERSONAL_END.match(ln):
             break
-        m = re.match(rf"^\s*{re.escape(key)}\s*[:\-]?\s*(.+)$", ln, re.IGNORECASE)
-        if m:
-            return m.group(1).strip()
-
-    return None
+        k = _PERSONAL_KEY.match(ln)
+        if k:
+            key = next(key for key in _PERSONAL_KEYS if k.group(key))
+            out.setdefault(key, k.group("value").strip())
+    return out
+
+
+def _gender_value(g: str):
+    g2 = g.strip().lower()
+    if "male" in g2:
+        return "Male"
+    if "female" in g2:
+        return "Female"
+    if "other" in g2:
+        return "Other"
+    return g.title()
+
+
+def extract_fields(text: str):
+    """email, phone, gender, nationality, address, linkedin, github from one rule table pass."""
+    lowered = text.lower()
+    # anchors found in the lowercase copy are only valid where offsets line up
+    low = lowered if len(lowered) == len(text) and not any(c in text for c in _FIND_UNSAFE) else None
+    hits = _match_rules(text, low)
+    block = None
+
+    def personal(key):
+        nonlocal block
+        if block is None:
+            block = _personal_details(text, lowered)
+        return block.get(key)
+
+    gender = _labeled_value(hits.get("gender"))
+    if not gender:
+        gender = personal("gender")
+
+    nationality = _labeled_value(hits.get("nationality"))
+    if not nationality:
+        nationality = personal("nationality")
+
+    # first label that is present wins, even when its value turns out empty
+    label = hits.get("address") or hits.get("locality") or hits.get("location")
+    address = _labeled_value(label)
+    if not address:
+        addr2, loc2 = personal("address"), personal("locality")
+        address = f"{addr2}, {loc2}" if addr2 and loc2 else addr2 or loc2
+
+    email, phone = hits.get("email"), hits.get("phone")
+    linkedin = hits.get("linkedin") or hits.get("linkedin_short")
+    github = hits.get("github")
+    return {
+        "email": email.group(0).strip() if email else None,
+        "phone": _PHONE_SEPARATORS.sub("", phone.group(0)) if phone else None,
+        "gender": _gender_value(gender) if gender else None,
+        "nationality": nationality.strip() if nationality else None,
+        "address": _clean_spaces(address) if address else None,
+        "linkedin": _fix_url(linkedin.group(0)) if linkedin else None,
+        "github": _fix_url(github.group(0)) if github else None,
+    }
 
 
 # =========================
 # EXTRACTORS
 # =========================
+# single-field wrappers; parse_resume uses extract_fields directly
 def extract_email(text: str):
-    m = re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
-    return m.group(0).strip() if m else None
+    return extract_fields(text)["email"]
 
 
 def extract_phone(text: str):
-    """
-    Returns the first phone found.
-    Handles:
-      +91, spaces, dashes, etc.
-    """
-    t = text.replace(" ", "").replace("-", "")
-    # find any 10-digit Indian mobile (starting 6-9), optionally prefixed by +91
-    m = re.search(r"(\+91)?[6-9]\d{9}", t)
-    return m.group(0) if m else None
+    """First phone found (+91, spaces, dashes, etc. handled)."""
+    return extract_fields(text)["phone"]
 
 
 def extract_gender(text: str):
-    # label style
-    g = _extract_labeled_value(text, ["gender"])
-    if g:
-        g2 = g.strip().lower()
-        if "male" in g2:
-            return "Male"
-        if "female" in g2:
-            return "Female"
-        if "other" in g2:
-            return "Other"
-        return g.title()
-
-    # personal details block
-    g = _extract_from_personal_details_block(text, "Gender")
-    if g:
-        g2 = g.strip().lower()
-        if "male" in g2:
-            return "Male"
-        if "female" in g2:
-            return "Female"
-        if "other" in g2:
-            return "Other"
-        return g.title()
-
-    return None
+    return extract_fields(text)["gender"]
 
 
 def extract_nationality(text: str):
-    n = _extract_labeled_value(text, ["nationality"])
-    if n:
-        return n.strip()
-    n = _extract_from_personal_details_block(text, "Nationality")
-    return n.strip() if n else None
+    return extract_fields(text)["nationality"]
 
 
 def extract_address(text: str):
-    """
-    Supports:
-      Address: ...
-      Address ...
-      Locality: ...
-      Location: ...
-      Personal details block address/locality lines
-    """
-    addr = _extract_labeled_value(text, ["address", "locality", "location"])
-    if addr:
-        return _clean_spaces(addr)
-
-    # from personal details table
-    addr2 = _extract_from_personal_details_block(text, "Address")
-    loc2 = _extract_from_personal_details_block(text, "Locality")
-
-    if addr2 and loc2:
-        return _clean_spaces(f"{addr2}, {loc2}")
-    if addr2:
-        return _clean_spaces(addr2)
-    if loc2:
-        return _clean_spaces(loc2)
-
-    return None
+    """Address: / Locality: / Location: label, else the personal details block address + locality."""
+    return extract_fields(text)["address"]
 
 
 def _collapse_spaced_caps(line: str) -> str:
@@ -298,25 +354,8 @@ def _fix_url(u: str):
 
 
 def extract_links(text: str):
-    linkedin = None
-    github = None
-
-    # LinkedIn full URL
-    m = re.search(r"(https?://)?(www\.)?linkedin\.com/[A-Za-z0-9\-_/]+", text, re.IGNORECASE)
-    if m:
-        linkedin = m.group(0)
-    else:
-        # short format: in/username
-        m2 = re.search(r"\bin/[A-Za-z0-9\-_]+", text, re.IGNORECASE)
-        if m2:
-            linkedin = m2.group(0)
-
-    # GitHub URL
-    g = re.search(r"(https?://)?(www\.)?github\.com/[A-Za-z0-9\-_/]+", text, re.IGNORECASE)
-    if g:
-        github = g.group(0)
-
-    return _fix_url(linkedin), _fix_url(github)
+    fields = extract_fields(text)
+    return fields["linkedin"], fields["github"]
 
 
 # =========================
@@ -487,22 +526,13 @@ STOPWORDS = {
     "software", "programming", "area of interest", "interests"
 }
 
-COMMON_SKILLS = {
-    # programming
-    "python", "java", "c", "c++", "javascript", "typescript", "html", "css",
-    # frameworks
-    "react", "react.js", "next", "next.js", "node", "node.js", "express", "django", "flask",
-    "spring", "spring boot",
-    # databases/tools
-    "sql", "mysql", "postgresql", "mongodb", "sqlite", "git", "github",
-    "vscode", "visual studio code", "eclipse",
-    # data/ai
-    "machine learning", "deep learning", "nlp", "power bi", "dax",
-    # misc
-    "ms office", "latex", "google workspace"
-}
-
 def extract_skills_from_resume(skills_text: str, full_text: str):
+    """
+    Skills as written in the resume, one per skill id: the skills section
+    item by item (unknown tech-looking items are kept too), then every
+    dictionary skill found anywhere else in the text. Spellings that are
+    also plain words ("react", "go") only count inside the skills section.
+    """
     text = (skills_text or "").strip()
 
     # fallback: try to find skills block in whole text
@@ -511,9 +541,6 @@ def extract_skills_from_resume(skills_text: str, full_text: str):
         if m:
             text = m.group(1).strip()
 
-    if not text:
-        return []
-
     # normalize bullets and separators
     text = text.replace("•", "\n").replace("\u2022", "\n")
     text = text.replace("|", ",").replace(" / ", ",")
@@ -535,6 +562,8 @@ def extract_skills_from_resume(skills_text: str, full_text: str):
         else:
             parts.append(p)
 
+    # known skills and their spellings come from the canonical skill dictionary
+    dictionary = get_dictionary()
     out, seen = [], set()
 
     for p in parts:
@@ -552,24 +581,29 @@ def extract_skills_from_resume(skills_text: str, full_text: str):
         if low in STOPWORDS:
             continue
 
-        # normalize some common forms
-        low = low.replace("reactjs", "react").replace("nodejs", "node.js")
-        low = low.replace("nextjs", "next.js")
-        low = low.strip()
-
-        # keep if looks like a tech token or in dictionary
+        # keep if in dictionary or looks like a tech token
+        skill_id = dictionary.lookup(low)
         ok = (
-            low in COMMON_SKILLS
+            skill_id is not None
             or re.match(r"^[A-Za-z][A-Za-z0-9\+\#\.\- ]{1,30}$", s) is not None
         )
         if not ok:
             continue
 
-        key = low
+        # "ReactJS" and "React" are the same skill
+        key = skill_id if skill_id is not None else normalize_skill(low)
         if key not in seen:
             seen.add(key)
             out.append(s)
 
+    # dictionary skills inside longer section lines, then in the whole resume
+    automaton = get_automaton()
+    for source, skip_ambiguous in ((text, False), (full_text, True)):
+        for start, end, skill_id in automaton.find_all(source, skip_ambiguous):
+            if skill_id not in seen:
+                seen.add(skill_id)
+                out.append(source[start:end])
+
     return out[:50]
 
 
@@ -577,52 +611,139 @@ def extract_skills_from_resume(skills_text: str, full_text: str):
 # SAVE SKILLS IN DB
 # =========================
 def save_skills(user_id, skills):
+    """
+    Diff-based write keyed on canonical skill ids: only skills that
+    disappeared are deleted and only new ones inserted, in one transaction.
+    Re-uploading the same resume (or "ReactJS" instead of "React") writes
+    nothing. Returns (added, removed) skill names as stored.
+    """
+    wanted = list(dict.fromkeys(s.strip() for s in (skills or []) if s and s.strip()))
+    # one id per distinct skill; unknown skills become new dictionary entries
+    wanted_ids = {}
+    for s in wanted:
+        ids = skill_ids([s], create=True)
+        if ids and ids[0] not in wanted_ids:
+            wanted_ids[ids[0]] = s
+
     conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS user_skills (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            skill TEXT NOT NULL,
-            added_at TEXT,
-            FOREIGN KEY (user_id) REFERENCES users(id)
-        )
-    """)
+    try:
+        existing = {
+            r[0]: r[1] for r in conn.execute(
+                "SELECT skill_id, skill FROM user_skills WHERE user_id=?", (user_id,)
+            ).fetchall()
+        }
+        removed_ids = [i for i in existing if i not in wanted_ids]
+        added_ids = [i for i in wanted_ids if i not in existing]
+
+        if removed_ids:
+            conn.executemany(
+                "DELETE FROM user_skills WHERE user_id=? AND skill_id IS ?",
+                [(user_id, i) for i in removed_ids],
+            )
+        if added_ids:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            conn.executemany(
+                "INSERT OR IGNORE INTO user_skills (user_id, skill, skill_id, added_at) VALUES (?, ?, ?, ?)",
+                [(user_id, wanted_ids[i], i, now) for i in added_ids],
+            )
+        if added_ids or removed_ids:
+            save_user_bits(conn, user_id, wanted_ids)
+        conn.commit()
+    finally:
+        conn.close()
+
+    added = [wanted_ids[i] for i in added_ids]
+    removed = sorted(existing[i] for i in removed_ids)
+    if added or removed:
+        emit(SKILLS_CHANGED, user_id=user_id, added=added, removed=removed)
+    return added, removed
+
 
-    cur.execute("DELETE FROM user_skills WHERE user_id=?", (user_id,))
+# =========================
+# PARSE CACHE
+# =========================
+# Bump when extraction rules change so old parsed_resumes rows stop matching.
+# spaCy changes extract_name, so it is part of the key too, and so is the
+# skill vocabulary the automaton was built from (see _cache_version).
+PARSER_VERSION = "2" + ("+spacy" if _NLP else "")
 
-    for skill in skills:
-        cur.execute("""
-            INSERT INTO user_skills (user_id, skill, added_at)
-            VALUES (?, ?, ?)
-        """, (user_id, skill, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
 
-    conn.commit()
+def _cache_version():
+    return f"{PARSER_VERSION}:{get_automaton().version}"
+
+
+def file_hash(file_path: str) -> str:
+    """SHA-256 of the file contents (same digest as candidate_dashboard._file_hash)."""
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+_CACHED_PARSE_SQL = hot_query(
+    "parsed_resume",
+    "SELECT result FROM parsed_resumes WHERE content_hash=? AND parser_version=?",
+    ("0" * 64, "1"),
+)
+
+
+def get_cached_parse(content_hash):
+    conn = get_connection()
+    row = conn.execute(_CACHED_PARSE_SQL, (content_hash, _cache_version())).fetchone()
     conn.close()
+    return json.loads(row[0]) if row else None
+
+
+def save_cached_parse(content_hash, parsed):
+    conn = get_connection()
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO parsed_resumes (content_hash, parser_version, result, parsed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (content_hash, _cache_version(), json.dumps(parsed), datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+        conn.commit()
+    finally:
+        conn.close()
 
 
 # =========================
 # MAIN PARSER
 # =========================
-def parse_resume(user_id, resume_path):
+def parse_resume(user_id, resume_path, content_hash=None):
     """
     Returns a dict used by candidate_dashboard.py
     Must keep keys:
       name,email,phone,gender,nationality,address,summary,education,experience,linkedin,github,skills
+
+    Results are cached in parsed_resumes by content hash, so an unchanged
+    file is parsed once per PARSER_VERSION and skill vocabulary. Pass content_hash when the caller
+    already hashed the upload.
     """
     if not resume_path or not os.path.exists(resume_path):
         return None
 
+    content_hash = content_hash or file_hash(resume_path)
+    parsed = get_cached_parse(content_hash)
+    if parsed is not None:
+        # same file can belong to another user; save_skills writes nothing when unchanged
+        save_skills(user_id, parsed["skills"])
+        return parsed
+
+    parsed = _parse_text(user_id, resume_path)
+    if parsed is not None:
+        save_cached_parse(content_hash, parsed)
+    return parsed
+
+
+def _parse_text(user_id, resume_path):
     text = extract_text(resume_path)
     if not text:
         return None
 
-    email = extract_email(text)
-    phone = extract_phone(text)
-
+    fields = extract_fields(text)
     sections = extract_sections(text)
-    linkedin, github = extract_links(text)
 
     # Clean education + experience
     edu_courses = clean_education_only_courses(sections.get("education"))
@@ -636,19 +757,19 @@ def parse_resume(user_id, resume_path):
     save_skills(user_id, skills)
 
     return {
-        "name": extract_name(text, email),
-        "email": email,
-        "phone": phone,
+        "name": extract_name(text, fields["email"]),
+        "email": fields["email"],
+        "phone": fields["phone"],
 
-        "gender": extract_gender(text),
-        "nationality": extract_nationality(text),
-        "address": extract_address(text),
+        "gender": fields["gender"],
+        "nationality": fields["nationality"],
+        "address": fields["address"],
 
         "summary": sections.get("summary") or None,
         "education": education_clean,
         "experience": experience_clean,
 
-        "linkedin": linkedin,
-        "github": github,
+        "linkedin": fields["linkedin"],
+        "github": fields["github"],
         "skills": skills,
     }
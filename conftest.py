@@ -0,0 +1,116 @@
+# conftest.py
+# Shared fixtures. Run: python -m pytest -q
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+import pytest
+
+# importing db must never touch the real trusthire.db
+os.environ.setdefault("TRUSTHIRE_DB_PATH", os.path.join(tempfile.gettempdir(), "trusthire-pytest.db"))
+os.environ.setdefault("TRUSTHIRE_DB_PROFILE", "test")
+
+import db
+
+# a manual script (prints one user's match against one job of trusthire.db), not a test
+collect_ignore = ["jobmatch/test_match_score.py"]
+
+# process-wide state built from the database: (module, attribute, fresh value)
+_PROCESS_STATE = [
+    ("jobmatch.skill_dictionary", "_dictionary", lambda m: None),
+    ("jobmatch.skill_automaton", "_automaton", lambda m: None),
+    ("jobmatch.skill_automaton", "_built_for", lambda m: None),
+    ("jobmatch.skill_index", "_index", lambda m: m.SkillIndex()),
+    ("jobmatch.skill_index", "_built", lambda m: False),
+    ("jobmatch.batch_score", "_jobs_matrix", lambda m: None),
+    ("jobmatch.minhash_lsh", "_candidates", lambda m: None),
+    ("jobmatch.minhash_lsh", "_jobs", lambda m: None),
+    ("jobmatch.tfidf_match", "_model", lambda m: None),
+]
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch):
+    """A migrated, empty database behind db.get_connection(); returns its path."""
+    path = str(tmp_path / "trusthire.db")
+    monkeypatch.setenv("TRUSTHIRE_DB_PATH", path)  # for spawned workers
+    pool = db.ConnectionPool(path, profile="test")
+    monkeypatch.setattr(db, "_pool", pool)
+    conn = pool.acquire()
+    db.run_migrations(conn)
+    conn.close()
+
+    from utils import cache
+    for c in cache._registry.values():
+        c.invalidate()
+    for name, attr, fresh in _PROCESS_STATE:
+        module = sys.modules.get(name)
+        if module is not None:
+            monkeypatch.setattr(module, attr, fresh(module))
+    yield path
+    pool.close_all()
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.fixture
+def make_candidate(app_db):
+    """make_candidate("Asha") -> user id of a verified candidate."""
+    def make(name="Candidate"):
+        with db.connection() as conn:
+            cur = conn.execute(
+                "INSERT INTO users (name, email, password, role, status, created_at) "
+                "VALUES (?, ?, 'x', 'candidate', 'active', ?)",
+                (name, f"{name.lower()}.{os.urandom(4).hex()}@example.com", _now()),
+            )
+            return cur.lastrowid
+    return make
+
+
+@pytest.fixture
+def make_company(app_db):
+    """make_company("Acme") -> (company_id, hr_user_id)."""
+    def make(name="Acme"):
+        with db.connection() as conn:
+            company_id = conn.execute(
+                "INSERT INTO companies (name, domain, status, created_at) VALUES (?, ?, 'approved', ?)",
+                (name, f"{name.lower()}.example.com", _now()),
+            ).lastrowid
+            hr_id = conn.execute(
+                "INSERT INTO users (name, email, password, role, company_id, status, created_at) "
+                "VALUES (?, ?, 'x', 'hr', ?, 'active', ?)",
+                (f"{name} HR", f"hr.{os.urandom(4).hex()}@example.com", company_id, _now()),
+            ).lastrowid
+        return company_id, hr_id
+    return make
+
+
+@pytest.fixture
+def make_job(make_company):
+    """make_job("Python, SQL") -> id of an open job, posted the way hr/post_job.py does."""
+    from jobmatch.store_data import create_job
+
+    company = []
+
+    def make(skills, role="Engineer"):
+        if not company:
+            company.append(make_company())
+        company_id, hr_id = company[0]
+        return create_job(company_id, hr_id, role, "Remote", skills)
+    return make
+
+
+@pytest.fixture
+def resume(tmp_path):
+    """Path of a small .docx resume: Asha Menon, asha.menon@example.com, Python/SQL/Docker."""
+    from docx import Document
+
+    path = str(tmp_path / "resume.docx")
+    doc = Document()
+    for line in ["Asha Menon", "asha.menon@example.com", "Skills", "Python, SQL, Docker"]:
+        doc.add_paragraph(line)
+    doc.save(path)
+    return path
@@ -1,20 +1,245 @@
 import sqlite3
 import hashlib
+import re
 from datetime import datetime
+from contextlib import contextmanager
 import secrets
+import threading
+import time
 import os
 
+from utils import query_log
+
 # ---------- DATABASE PATH ----------
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_NAME = os.path.join(BASE_DIR, "trusthire.db")
+DB_NAME = os.environ.get("TRUSTHIRE_DB_PATH") or os.path.join(BASE_DIR, "trusthire.db")
+
+# max idle connections kept warm for reuse
+POOL_SIZE = int(os.environ.get("TRUSTHIRE_DB_POOL_SIZE", "4"))
 
 print("📂 USING DATABASE:", DB_NAME)
 
+
+# ---------- PRAGMA PROFILES ----------
+# journal_mode is stored in the database file, so it is applied once at startup;
+# everything else is per-connection and applied when a pooled handle is opened.
+PRAGMA_PROFILES = {
+    # WAL lets readers keep going while a candidate applies / uploads a resume
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -65536,       # 64 MB
+        "mmap_size": 268435456,     # 256 MB
+        "temp_store": "MEMORY",
+    },
+    "development": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -16384,       # 16 MB
+        "mmap_size": 67108864,      # 64 MB
+        "temp_store": "MEMORY",
+    },
+    # throwaway databases (seeding, benchmarks): durability does not matter
+    "test": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "busy_timeout": 5000,
+        "cache_size": -65536,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+    },
+    # old behaviour (rollback journal), kept for before/after benchmarks
+    "legacy": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 10000,
+    },
+}
+
+DB_PROFILE = os.environ.get("TRUSTHIRE_DB_PROFILE", "production")
+
+
+def _profile_pragmas(profile):
+    if profile not in PRAGMA_PROFILES:
+        raise ValueError(f"Unknown database profile: {profile}")
+    return PRAGMA_PROFILES[profile]
+
+
+# ---------- CONNECTION POOL ----------
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3 connection whose close() hands the handle back to its pool
+    instead of closing it, so existing `conn.close()` call sites keep working.
+    """
+    _pool = None
+    _checked_out = False
+
+    def close(self):
+        if self._pool is None:
+            super().close()
+        elif self._checked_out:
+            self._pool.release(self)
+
+    def _close_for_real(self):
+        self._pool = None
+        super().close()
+
+
+class TracedConnection(PooledConnection):
+    """Pooled connection that routes every statement through utils.query_log."""
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or query_log.TracingCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+class ConnectionPool:
+    """
+    Keeps up to `size` idle connections warm for reuse.
+    A checked-out handle is owned by the calling thread until it is closed,
+    so pragmas are paid once per handle instead of once per query.
+
+    Idle handles are shared by all threads rather than kept per thread:
+    Streamlit runs every rerun on a new ScriptRunner thread, so a
+    thread-local handle would be opened once per rerun and then left behind
+    with the dead thread, which is the cost the pool is there to avoid.
+    """
+
+    def __init__(self, db_path, size=POOL_SIZE, profile=DB_PROFILE):
+        self.db_path = db_path
+        self.size = max(0, int(size))
+        self.pragmas = _profile_pragmas(profile)
+        self.profile = profile
+        self._idle = []
+        self._lock = threading.Lock()
+        self._journal_applied = False
+        self.stats = {"opened": 0, "reused": 0, "released": 0, "discarded": 0, "in_use": 0}
+
+    def _open(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=10,
+            factory=TracedConnection if query_log.enabled() else PooledConnection,
+        )
+        if not self._journal_applied:
+            self.apply_journal_mode(conn)
+        conn.execute("PRAGMA foreign_keys=ON;")  # enforce foreign keys
+        for name, value in self.pragmas.items():
+            if name != "journal_mode":
+                conn.execute(f"PRAGMA {name}={value};")
+        return conn
+
+    def apply_journal_mode(self, conn=None):
+        mode = self.pragmas.get("journal_mode")
+        if mode:
+            own = conn is None
+            if own:
+                conn = sqlite3.connect(self.db_path, timeout=10)
+            try:
+                conn.execute(f"PRAGMA journal_mode={mode};")
+            finally:
+                if own:
+                    conn.close()
+        self._journal_applied = True
+
+    def acquire(self):
+        conn = None
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                self.stats["reused"] += 1
+            else:
+                self.stats["opened"] += 1
+            self.stats["in_use"] += 1
+
+        if conn is None:
+            conn = self._open()
+
+        conn._pool = self
+        conn._checked_out = True
+        return conn
+
+    def release(self, conn):
+        conn._checked_out = False
+        try:
+            # same semantics as close(): uncommitted work is discarded
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            with self._lock:
+                self.stats["in_use"] -= 1
+                self.stats["discarded"] += 1
+            conn._close_for_real()
+            return
+
+        with self._lock:
+            self.stats["in_use"] -= 1
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                self.stats["released"] += 1
+                return
+            self.stats["discarded"] += 1
+        conn._close_for_real()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn._close_for_real()
+
+
+_pool = ConnectionPool(DB_NAME)
+
+
 # ---------- CONNECTION ----------
 def get_connection():
-    conn = sqlite3.connect(DB_NAME, check_same_thread=False, timeout=10)
-    conn.execute("PRAGMA foreign_keys=ON;")  # enforce foreign keys
-    return conn
+    return _pool.acquire()
+
+
+def database_path():
+    """File behind get_connection() (DB_NAME unless the pool was swapped)."""
+    return _pool.db_path
+
+
+@contextmanager
+def connection():
+    """
+    with connection() as conn:
+        conn.execute(...)
+    Commits on success, rolls back on error, always returns the handle to the pool.
+    """
+    conn = _pool.acquire()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def apply_database_profile():
+    """Called once at startup so WAL is in place before the first page render."""
+    _pool.apply_journal_mode()
+    return _pool.profile
+
+
+def get_pool_stats():
+    """Counters for connections opened vs reused (handy to verify pooling)."""
+    with _pool._lock:
+        stats = dict(_pool.stats)
+        stats["idle"] = len(_pool._idle)
+    return stats
 
 # ---------- PASSWORD ----------
 def hash_password(password: str):
@@ -36,11 +261,16 @@ def _add_column_if_missing(cur, table, column_def):
         cur.execute(f"ALTER TABLE {table} ADD COLUMN {column_def}")
         print(f"➕ Added column {col_name} to {table}")
 
-# ---------- CREATE TABLES ----------
-def create_tables():
-    conn = get_connection()
-    cur = conn.cursor()
 
+# ---------- SCHEMA MIGRATIONS ----------
+# Each migration runs exactly once per database, in order, inside its own
+# transaction. Add new schema changes as a new numbered function at the end
+# of MIGRATIONS; never edit one that has already shipped. Migrations carry
+# their own data and SQL instead of importing application code, so changing
+# the app later cannot change what an old migration does.
+
+def _migration_001_base_schema(cur):
+    """Tables that used to be created by create_tables() on every render."""
     # ---------- COMPANIES ----------
     cur.execute("""
         CREATE TABLE IF NOT EXISTS companies (
@@ -164,5 +394,858 @@ def create_tables():
     _add_column_if_missing(cur, "candidate_profile", "linkedin TEXT")
     _add_column_if_missing(cur, "candidate_profile", "github TEXT")
 
-    conn.commit()
-    conn.close()
+    # ---------- JOB APPLICATIONS ----------
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS job_applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id INTEGER NOT NULL,
+            candidate_id INTEGER NOT NULL,
+            applied_at TEXT,
+            UNIQUE(job_id, candidate_id),
+            FOREIGN KEY(job_id) REFERENCES job_posts(id),
+            FOREIGN KEY(candidate_id) REFERENCES users(id)
+        )
+    """)
+
+
+def _migration_002_hot_query_indexes(cur):
+    """Secondary indexes for the queries every page render runs (see HOT_QUERIES)."""
+    # browse / available jobs: WHERE status='open' ORDER BY created_at DESC
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_job_posts_status_created ON job_posts(status, created_at DESC)")
+    # HR posted jobs + applicants: WHERE company_id=? ORDER BY created_at DESC
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_job_posts_company_created ON job_posts(company_id, created_at DESC)")
+    # applied jobs: WHERE candidate_id=? ORDER BY applied_at DESC
+    # ((job_id, candidate_id) is already covered by the UNIQUE constraint)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_job_applications_candidate ON job_applications(candidate_id, applied_at DESC)"
+    )
+    # UNIQUE(user_id, skill) so save_skills can write only the diff
+    cur.execute("""
+        DELETE FROM user_skills
+        WHERE id NOT IN (SELECT MIN(id) FROM user_skills GROUP BY user_id, skill)
+    """)
+    cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_user_skills_user_skill ON user_skills(user_id, skill)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_certificates_user ON certificates(user_id)")
+    # admin approval queue: WHERE role='hr' AND status='pending_approval'
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_users_role_status ON users(role, status)")
+    # signup duplicate check + company lookup compare normalised values
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_users_email_norm ON users(LOWER(TRIM(email)))")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_companies_domain_norm ON companies(LOWER(domain))")
+    cur.execute("ANALYZE")
+
+
+# Curated skill vocabulary seeded by migration 003 (canonical name -> aliases).
+# Frozen with the migration: new skills go in a new migration, never here.
+# Kept small on purpose (see jobmatch.skill_dictionary): every entry is
+# searched for in every resume.
+_SKILLS_V3 = {
+    # programming
+    "python": ["python3", "py"],
+    "java": ["core java"],
+    "c": [],
+    "c++": ["cpp"],
+    "c#": ["csharp", "c sharp"],
+    "javascript": ["js", "java script", "es6"],
+    "typescript": ["ts"],
+    "go": ["golang"],
+    "rust": [],
+    "kotlin": [],
+    "swift": [],
+    "php": [],
+    "ruby": [],
+    "scala": [],
+    "r": [],
+    "matlab": [],
+    "html": ["html5"],
+    "css": ["css3"],
+    "sass": ["scss"],
+    "bash": ["shell scripting", "shell"],
+    # frameworks
+    "react": ["react.js", "reactjs", "react js"],
+    "angular": ["angularjs", "angular.js"],
+    "vue": ["vue.js", "vuejs"],
+    "next.js": ["next", "nextjs", "next js"],
+    "node.js": ["node", "nodejs", "node js"],
+    "express": ["express.js", "expressjs"],
+    "django": [],
+    "flask": [],
+    "fastapi": [],
+    "spring": [],
+    "spring boot": ["springboot"],
+    "laravel": [],
+    "rails": ["ruby on rails", "ror"],
+    ".net": ["dotnet", "asp.net"],
+    "flutter": [],
+    "android": [],
+    "ios": [],
+    # databases
+    "sql": [],
+    "mysql": [],
+    "postgresql": ["postgres", "psql"],
+    "sqlite": ["sqlite3"],
+    "mongodb": ["mongo"],
+    "redis": [],
+    "elasticsearch": ["elastic search"],
+    "cassandra": [],
+    # tools / infra
+    "git": [],
+    "github": [],
+    "gitlab": [],
+    "docker": [],
+    "kubernetes": ["k8s"],
+    "terraform": [],
+    "ansible": [],
+    "jenkins": [],
+    "kafka": ["apache kafka"],
+    "rabbitmq": [],
+    "linux": ["unix"],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "vscode": ["visual studio code", "vs code"],
+    "eclipse": [],
+    "jira": [],
+    "figma": [],
+    "photoshop": ["adobe photoshop"],
+    "selenium": [],
+    "junit": [],
+    "pytest": [],
+    "graphql": [],
+    "rest api": ["rest", "restful api", "rest apis", "restful apis"],
+    "microservices": ["microservice"],
+    "agile": [],
+    "scrum": [],
+    # data / ai
+    "machine learning": ["ml"],
+    "deep learning": [],
+    "nlp": ["natural language processing"],
+    "computer vision": ["opencv"],
+    "pandas": [],
+    "numpy": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "tensorflow": [],
+    "pytorch": ["torch"],
+    "power bi": ["powerbi"],
+    "tableau": [],
+    "excel": ["ms excel", "microsoft excel"],
+    "dax": [],
+    "spark": ["apache spark", "pyspark"],
+    "hadoop": [],
+    "airflow": ["apache airflow"],
+    # misc
+    "ms office": ["microsoft office"],
+    "latex": [],
+    "google workspace": [],
+    # programming
+    "perl": [],
+    "lua": [],
+    "haskell": [],
+    "elixir": [],
+    "erlang": [],
+    "clojure": [],
+    "f#": ["fsharp"],
+    "objective-c": ["objective c", "objc"],
+    "dart": [],
+    "julia": [],
+    "groovy": [],
+    "fortran": [],
+    "cobol": [],
+    "assembly": ["assembly language", "asm"],
+    "vba": ["excel vba"],
+    "powershell": [],
+    "solidity": [],
+    "webassembly": ["wasm"],
+    "visual basic": ["vb.net"],
+    "pl/sql": ["plsql"],
+    "t-sql": ["tsql", "transact-sql"],
+    "nosql": [],
+    "xml": [],
+    "json": [],
+    "yaml": [],
+    "regex": ["regular expressions"],
+    "oop": ["object oriented programming", "object-oriented programming"],
+    "data structures": ["data structures and algorithms", "dsa"],
+    "algorithms": [],
+    "design patterns": [],
+    "multithreading": ["concurrency"],
+    "functional programming": [],
+    # web / frontend
+    "jquery": [],
+    "bootstrap": [],
+    "tailwind css": ["tailwind", "tailwindcss"],
+    "material ui": ["mui", "material-ui"],
+    "redux": [],
+    "svelte": [],
+    "nuxt.js": ["nuxt", "nuxtjs"],
+    "gatsby": [],
+    "webpack": [],
+    "vite": [],
+    "babel": [],
+    "npm": [],
+    "yarn": [],
+    "react native": [],
+    "ionic": [],
+    "xamarin": [],
+    "electron": [],
+    "three.js": ["threejs"],
+    "d3.js": ["d3", "d3js"],
+    "chart.js": ["chartjs"],
+    "ajax": [],
+    "websockets": ["websocket"],
+    "responsive design": ["responsive web design"],
+    "web accessibility": ["wcag", "a11y"],
+    "seo": ["search engine optimization"],
+    "wordpress": [],
+    "shopify": [],
+    "magento": [],
+    "drupal": [],
+    "jsp": [],
+    "thymeleaf": [],
+    "blazor": [],
+    # backend
+    "nestjs": ["nest.js"],
+    "koa": [],
+    "hibernate": [],
+    "jpa": [],
+    "struts": [],
+    "maven": [],
+    "gradle": [],
+    "asp.net core": [".net core", "dotnet core"],
+    "entity framework": [],
+    "gin": [],
+    "fiber": [],
+    "phoenix": [],
+    "symfony": [],
+    "codeigniter": [],
+    "celery": [],
+    "grpc": [],
+    "soap": [],
+    "oauth": ["oauth2", "oauth 2.0"],
+    "jwt": ["json web tokens"],
+    "nginx": [],
+    "apache": ["apache http server"],
+    "tomcat": ["apache tomcat"],
+    "iis": [],
+    "swagger": ["openapi"],
+    "postman": [],
+    "socket.io": [],
+    "serverless": [],
+    "event-driven architecture": ["event driven architecture"],
+    "system design": [],
+    # databases
+    "oracle": ["oracle database", "oracle db"],
+    "sql server": ["mssql", "ms sql", "microsoft sql server"],
+    "mariadb": [],
+    "dynamodb": [],
+    "firebase": ["firestore"],
+    "neo4j": [],
+    "couchdb": [],
+    "couchbase": [],
+    "influxdb": [],
+    "snowflake": [],
+    "bigquery": ["google bigquery"],
+    "redshift": ["amazon redshift"],
+    "clickhouse": [],
+    "supabase": [],
+    "prisma": [],
+    "sqlalchemy": [],
+    "mongoose": [],
+    "memcached": [],
+    "solr": ["apache solr"],
+    "database design": [],
+    "data modeling": ["data modelling"],
+    "stored procedures": [],
+    # cloud / devops
+    "aws lambda": ["lambda functions"],
+    "ec2": ["aws ec2"],
+    "s3": ["aws s3", "amazon s3"],
+    "cloudformation": [],
+    "azure devops": [],
+    "heroku": [],
+    "netlify": [],
+    "vercel": [],
+    "digitalocean": [],
+    "openshift": [],
+    "helm": [],
+    "istio": [],
+    "prometheus": [],
+    "grafana": [],
+    "elk stack": ["elk"],
+    "kibana": [],
+    "logstash": [],
+    "splunk": [],
+    "datadog": [],
+    "new relic": [],
+    "nagios": [],
+    "puppet": [],
+    "chef": [],
+    "vagrant": [],
+    "packer": [],
+    "ci/cd": ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "github actions": [],
+    "gitlab ci": [],
+    "circleci": [],
+    "travis ci": [],
+    "bitbucket": [],
+    "svn": ["subversion"],
+    "devops": [],
+    "sre": ["site reliability engineering"],
+    "docker compose": ["docker-compose"],
+    "virtualization": [],
+    "vmware": [],
+    "networking": ["computer networking"],
+    "tcp/ip": [],
+    "dns": [],
+    "load balancing": [],
+    "cybersecurity": ["cyber security", "information security"],
+    "penetration testing": ["pen testing", "pentesting"],
+    "owasp": [],
+    "cryptography": [],
+    "iam": ["identity and access management"],
+    "siem": [],
+    "firewalls": ["firewall"],
+    "windows server": [],
+    "active directory": [],
+    # testing
+    "unit testing": [],
+    "integration testing": [],
+    "test automation": ["automation testing"],
+    "manual testing": [],
+    "tdd": ["test driven development", "test-driven development"],
+    "bdd": ["behavior driven development"],
+    "cypress": [],
+    "playwright": [],
+    "jest": [],
+    "mocha": [],
+    "chai": [],
+    "testng": [],
+    "cucumber": [],
+    "mockito": [],
+    "appium": [],
+    "jmeter": ["apache jmeter"],
+    "loadrunner": [],
+    "sonarqube": [],
+    "qa": ["quality assurance"],
+    # data / ai
+    "data analysis": ["data analytics"],
+    "data science": [],
+    "data engineering": [],
+    "data visualization": ["data visualisation"],
+    "data mining": [],
+    "data warehousing": ["data warehouse"],
+    "etl": [],
+    "big data": [],
+    "statistics": ["statistical analysis"],
+    "predictive modeling": ["predictive modelling"],
+    "time series analysis": ["time series"],
+    "a/b testing": ["ab testing"],
+    "feature engineering": [],
+    "neural networks": ["neural network"],
+    "cnn": ["convolutional neural networks"],
+    "rnn": ["recurrent neural networks"],
+    "lstm": [],
+    "transformers": [],
+    "generative ai": ["genai", "gen ai"],
+    "llm": ["large language models", "llms"],
+    "prompt engineering": [],
+    "langchain": [],
+    "hugging face": ["huggingface"],
+    "reinforcement learning": [],
+    "keras": [],
+    "xgboost": [],
+    "lightgbm": [],
+    "scipy": [],
+    "matplotlib": [],
+    "seaborn": [],
+    "plotly": [],
+    "jupyter": ["jupyter notebook", "jupyter notebooks"],
+    "mlops": [],
+    "mlflow": [],
+    "kubeflow": [],
+    "databricks": [],
+    "dbt": [],
+    "apache flink": ["flink"],
+    "apache beam": [],
+    "hive": ["apache hive"],
+    "sas": [],
+    "spss": ["ibm spss"],
+    "stata": [],
+    "looker": [],
+    "qlik": ["qlikview", "qlik sense"],
+    "google analytics": [],
+    "alteryx": [],
+    "ssis": [],
+    "ssrs": [],
+    "informatica": [],
+    "talend": [],
+    # design
+    "ui design": ["ui"],
+    "ux design": ["ux", "user experience"],
+    "ui/ux": ["ui ux", "ui/ux design"],
+    "adobe xd": [],
+    "sketch": [],
+    "illustrator": ["adobe illustrator"],
+    "indesign": ["adobe indesign"],
+    "after effects": ["adobe after effects"],
+    "premiere pro": ["adobe premiere pro", "adobe premiere"],
+    "canva": [],
+    "blender": [],
+    "autocad": [],
+    "solidworks": [],
+    "revit": [],
+    "wireframing": ["wireframes"],
+    "prototyping": [],
+    "graphic design": [],
+    "user research": [],
+    # embedded / systems
+    "embedded systems": ["embedded c"],
+    "arduino": [],
+    "raspberry pi": [],
+    "rtos": [],
+    "fpga": [],
+    "verilog": [],
+    "vhdl": [],
+    "plc": [],
+    "iot": ["internet of things"],
+    "unity": ["unity3d"],
+    "unreal engine": [],
+    "opengl": [],
+    "blockchain": [],
+    "web3": [],
+    # enterprise / business tools
+    "salesforce": [],
+    "sap": [],
+    "servicenow": [],
+    "dynamics 365": ["microsoft dynamics"],
+    "tally": ["tally erp"],
+    "quickbooks": [],
+    "confluence": [],
+    "trello": [],
+    "asana": [],
+    "slack": [],
+    "notion": [],
+    "ms word": ["microsoft word"],
+    "powerpoint": ["ms powerpoint", "microsoft powerpoint"],
+    "outlook": ["ms outlook"],
+    "google sheets": [],
+    "sharepoint": [],
+    "kanban": [],
+    "waterfall": [],
+    "sdlc": ["software development life cycle"],
+    "project management": [],
+    "product management": [],
+    "business analysis": [],
+    "requirements gathering": [],
+    "stakeholder management": [],
+    "risk management": [],
+    "pmp": [],
+    "prince2": [],
+    "itil": [],
+    "six sigma": ["lean six sigma"],
+    "crm": [],
+    "erp": [],
+    # business / finance / marketing
+    "accounting": [],
+    "bookkeeping": [],
+    "financial analysis": [],
+    "financial modeling": ["financial modelling"],
+    "budgeting": [],
+    "forecasting": [],
+    "auditing": ["audit"],
+    "taxation": [],
+    "payroll": [],
+    "gst": [],
+    "digital marketing": [],
+    "social media marketing": [],
+    "content writing": [],
+    "copywriting": [],
+    "email marketing": [],
+    "google ads": ["adwords", "google adwords"],
+    "sem": ["search engine marketing"],
+    "market research": [],
+    "sales": [],
+    "lead generation": [],
+    "customer service": ["customer support"],
+    "recruitment": ["recruiting", "talent acquisition"],
+    "technical writing": [],
+    # soft skills
+    "communication": ["communication skills"],
+    "teamwork": ["team work"],
+    "leadership": [],
+    "problem solving": ["problem-solving"],
+    "critical thinking": [],
+    "time management": [],
+    "public speaking": [],
+    "negotiation": [],
+    "mentoring": [],
+}
+
+_SKILL_SPACES_V3 = re.compile(r"\s+")
+
+
+def _normalize_skill_v3(text):
+    """jobmatch.skill_dictionary.normalize_skill as migration 003 shipped it."""
+    if not text:
+        return ""
+    return _SKILL_SPACES_V3.sub(" ", text.strip(" \t\r\n-•,;:|").lower()).strip()
+
+
+def _migration_003_canonical_skills(cur):
+    """skills + skill_aliases, canonical ids on user_skills, and job_skills rows for job_posts.skills."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            curated INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS skill_aliases (
+            alias TEXT PRIMARY KEY,
+            skill_id INTEGER NOT NULL,
+            curated INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (skill_id) REFERENCES skills(id)
+        )
+    """)
+    # curated=1: the hand-written vocabulary; skills learned from typed input stay 0
+    cur.executemany("INSERT OR IGNORE INTO skills (name, curated) VALUES (?, 1)", [(name,) for name in _SKILLS_V3])
+    cur.executemany(
+        "INSERT OR IGNORE INTO skill_aliases (alias, skill_id, curated) SELECT ?, id, 1 FROM skills WHERE name=?",
+        [(alias, name) for name, aliases in _SKILLS_V3.items() for alias in aliases],
+    )
+
+    ids = {}
+    for skill_id, name in cur.execute("SELECT id, name FROM skills").fetchall():
+        ids[_normalize_skill_v3(name)] = skill_id
+    for alias, skill_id in cur.execute("SELECT alias, skill_id FROM skill_aliases").fetchall():
+        ids[_normalize_skill_v3(alias)] = skill_id
+
+    def skill_id_for(text):
+        # unknown skills become new (uncurated) rows, so nothing typed is lost
+        key = _normalize_skill_v3(text)
+        if not key:
+            return None
+        if key not in ids:
+            cur.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (key,))
+            ids[key] = cur.execute("SELECT id FROM skills WHERE name=?", (key,)).fetchone()[0]
+        return ids[key]
+
+    # ---------- user_skills.skill_id ----------
+    _add_column_if_missing(cur, "user_skills", "skill_id INTEGER")
+    rows = cur.execute("SELECT id, skill FROM user_skills WHERE skill_id IS NULL").fetchall()
+    cur.executemany(
+        "UPDATE user_skills SET skill_id=? WHERE id=?",
+        [(skill_id_for(skill), row_id) for row_id, skill in rows],
+    )
+    # "React" and "react.js" on one user are now the same skill
+    cur.execute("""
+        DELETE FROM user_skills
+        WHERE id NOT IN (SELECT MIN(id) FROM user_skills GROUP BY user_id, skill_id)
+    """)
+    cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_user_skills_user_skill_id ON user_skills(user_id, skill_id)")
+    # "which candidates have this skill" (match score refresh per job)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_user_skills_skill ON user_skills(skill_id, user_id)")
+
+    # ---------- job_skills (parsed once, at save time) ----------
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS job_skills (
+            job_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+            skill TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (job_id, skill_id),
+            FOREIGN KEY (job_id) REFERENCES job_posts(id) ON DELETE CASCADE,
+            FOREIGN KEY (skill_id) REFERENCES skills(id)
+        ) WITHOUT ROWID
+    """)
+    # "which jobs need this skill" (match score refresh, skill index)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill_id, job_id)")
+    rows = []
+    for job_id, skills in cur.execute("SELECT id, skills FROM job_posts").fetchall():
+        seen = set()
+        # comma-separated, like store_data.parse_skills at the time
+        for skill in (s.strip().lower() for s in (skills or "").split(",") if s.strip()):
+            skill_id = skill_id_for(skill)
+            if skill_id is not None and skill_id not in seen:
+                seen.add(skill_id)
+                rows.append((job_id, skill_id, skill, len(seen) - 1))
+    cur.executemany(
+        "INSERT OR IGNORE INTO job_skills (job_id, skill_id, skill, position) VALUES (?, ?, ?, ?)", rows
+    )
+
+
+# jobmatch.match_scores._SCORE_SELECT as migration 004 shipped it: one row for
+# every (candidate, open job) pair sharing at least one skill
+_MATCH_SCORES_V4_SQL = """
+    INSERT OR REPLACE INTO job_match_scores (user_id, job_id, score, missing_count)
+    SELECT user_id, job_id, ROUND(matched * 100.0 / n, 2), n - matched
+    FROM (
+        SELECT us.user_id, js.job_id, COUNT(*) AS matched,
+               (SELECT COUNT(*) FROM job_skills x WHERE x.job_id = js.job_id) AS n
+        FROM user_skills us
+        JOIN job_skills js ON js.skill_id = us.skill_id
+        JOIN job_posts jp ON jp.id = js.job_id
+        WHERE jp.status = 'open'
+        GROUP BY us.user_id, js.job_id
+    )
+"""
+
+
+def _migration_004_job_match_scores(cur):
+    """Materialised (user, job) skill match scores, kept current by jobmatch.match_scores."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS job_match_scores (
+            user_id INTEGER NOT NULL,
+            job_id INTEGER NOT NULL,
+            score REAL NOT NULL,
+            missing_count INTEGER NOT NULL,
+            PRIMARY KEY (user_id, job_id)
+        ) WITHOUT ROWID
+    """)
+    # candidate reads: WHERE user_id=? ORDER BY score DESC
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_job_match_scores_user_score ON job_match_scores(user_id, score DESC)")
+    # per-job refresh: DELETE ... WHERE job_id=?
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_job_match_scores_job ON job_match_scores(job_id)")
+    cur.execute(_MATCH_SCORES_V4_SQL)
+
+
+def _migration_005_match_matrix(cur):
+    """Output table of the offline full match matrix (python -m jobmatch.match_matrix --format db)."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS match_matrix (
+            user_id INTEGER NOT NULL,
+            job_id INTEGER NOT NULL,
+            score REAL NOT NULL,
+            missing_count INTEGER NOT NULL,
+            PRIMARY KEY (user_id, job_id)
+        ) WITHOUT ROWID
+    """)
+
+
+def _migration_006_skill_bits(cur):
+    """Skill bitsets stored next to the rows, over dense skills.bit positions (see jobmatch.skill_bits)."""
+    _add_column_if_missing(cur, "skills", "bit INTEGER")
+    cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_skills_bit ON skills(bit)")
+    _add_column_if_missing(cur, "job_posts", "skill_bits BLOB")
+    _add_column_if_missing(cur, "users", "skill_bits BLOB")
+    # curated skills first, then the other skills some job asks for; learned
+    # skills no job uses get no position
+    rows = cur.execute("""
+        SELECT id FROM skills
+        WHERE curated=1 OR id IN (SELECT skill_id FROM job_skills)
+        ORDER BY curated DESC, id
+    """).fetchall()
+    cur.executemany("UPDATE skills SET bit=? WHERE id=?", [(bit, skill_id) for bit, (skill_id,) in enumerate(rows)])
+    # little-endian blobs, as jobmatch.skill_bits wrote them at the time
+    for table, sql in (
+        ("job_posts", "SELECT js.job_id, s.bit FROM job_skills js JOIN skills s ON s.id = js.skill_id"),
+        ("users", """
+            SELECT us.user_id, s.bit FROM user_skills us JOIN skills s ON s.id = us.skill_id
+            WHERE s.bit IS NOT NULL
+        """),
+    ):
+        bits = {}
+        for key, bit in cur.execute(sql).fetchall():
+            bits[key] = bits.get(key, 0) | 1 << bit
+        cur.executemany(
+            f"UPDATE {table} SET skill_bits=? WHERE id=?",
+            [(b.to_bytes((b.bit_length() + 7) // 8, "little"), key) for key, b in bits.items()],
+        )
+
+
+def _migration_007_parsed_resumes(cur):
+    """parse_resume results by file content hash and parser version."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS parsed_resumes (
+            content_hash TEXT NOT NULL,
+            parser_version TEXT NOT NULL,
+            result TEXT NOT NULL,
+            parsed_at TEXT NOT NULL,
+            PRIMARY KEY (content_hash, parser_version)
+        ) WITHOUT ROWID
+    """)
+
+
+def _migration_008_parse_jobs(cur):
+    """Resume parse queue drained by candidate.parse_queue workers."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS parse_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            resume_path TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker TEXT,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    """)
+    # workers: oldest queued / stale running job
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_parse_jobs_status ON parse_jobs(status, id)")
+    # dashboard polling: newest job of the candidate
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_parse_jobs_user ON parse_jobs(user_id, id)")
+
+
+MIGRATIONS = [
+    (1, "base schema", _migration_001_base_schema),
+    (2, "hot query indexes", _migration_002_hot_query_indexes),
+    (3, "canonical skills", _migration_003_canonical_skills),
+    (4, "job match scores", _migration_004_job_match_scores),
+    (5, "match matrix", _migration_005_match_matrix),
+    (6, "skill bitsets", _migration_006_skill_bits),
+    (7, "parsed resumes cache", _migration_007_parsed_resumes),
+    (8, "parse job queue", _migration_008_parse_jobs),
+]
+
+
+# ---------- QUERY PLANS ----------
+# The queries behind every page render, registered where they are run with
+# hot_query(). test_query_plans.py fails if any of them walks a whole table or
+# index; wrap new hot queries in hot_query() and list their module below.
+HOT_QUERIES = {}
+
+# modules that register their SQL with hot_query(); importing them fills HOT_QUERIES
+HOT_QUERY_MODULES = [
+    "jobmatch.store_data",
+    "jobmatch.applicant_ranking",
+    "jobmatch.match_scores",
+    "candidate.resume_parser",
+    "candidate.parse_queue",
+    "candidate.candidate_dashboard",
+    "hr.view_jobs",
+    "auth.login",
+    "auth.signup",
+    "auth.verify_email",
+    "admin.admin_dashboard",
+]
+
+
+def hot_query(name, sql, params=(), allow=()):
+    """Register `sql` as a query page renders run, for the plan tests; returns `sql`.
+
+    `params` are sample values for EXPLAIN QUERY PLAN and `allow` lists plan-step
+    prefixes (e.g. "SCAN jp USING INDEX") that are expected and not a regression.
+    """
+    if name in HOT_QUERIES and HOT_QUERIES[name][0] != sql:
+        raise ValueError(f"hot query {name!r} registered twice with different SQL")
+    HOT_QUERIES[name] = (sql, params, tuple(allow))
+    return sql
+
+
+def explain_query_plan(conn, sql, params=()):
+    """Detail strings from EXPLAIN QUERY PLAN, e.g. 'SEARCH jp USING INDEX ...'."""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+
+
+def full_scans(conn, sql, params=(), allow=()):
+    """Plan steps that walk a whole table or index instead of searching it.
+
+    'SCAN t USING INDEX i' still reads every entry, so it counts unless a step
+    starts with one of the `allow` prefixes.
+    """
+    return [
+        step for step in explain_query_plan(conn, sql, params)
+        if step.startswith("SCAN ") and not step.startswith(tuple(allow))
+    ]
+
+# startup is expected to finish well inside this; slower runs are reported
+MIGRATION_BUDGET_MS = int(os.environ.get("TRUSTHIRE_MIGRATION_BUDGET_MS", "2000"))
+
+_migrate_lock = threading.Lock()
+_migrated = False
+last_migration_report = None
+
+
+def _current_schema_version(cur):
+    cur.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    return cur.fetchone()[0]
+
+
+def run_migrations(conn):
+    """Apply pending MIGRATIONS on `conn`. Returns the list of applied versions."""
+    cur = conn.cursor()
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT,
+            duration_ms REAL
+        )
+    """)
+
+    applied = []
+    for version, name, fn in MIGRATIONS:
+        if version <= _current_schema_version(cur):
+            continue
+
+        # IMMEDIATE: another process starting at the same time waits here,
+        # then sees the bumped version and skips the migration
+        cur.execute("BEGIN IMMEDIATE")
+        if version <= _current_schema_version(cur):
+            conn.rollback()
+            continue
+
+        t0 = time.perf_counter()
+        try:
+            fn(cur)
+        except Exception:
+            conn.rollback()
+            raise
+        took = (time.perf_counter() - t0) * 1000
+        cur.execute(
+            "INSERT INTO schema_version (version, name, applied_at, duration_ms) VALUES (?, ?, ?, ?)",
+            (version, name, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), round(took, 2))
+        )
+        conn.commit()
+        applied.append(version)
+        print(f"🧱 Applied migration {version:03d} ({name}) in {took:.1f} ms")
+
+    return applied
+
+
+def migrate():
+    """
+    Bring the database up to the latest schema version.
+    Runs once per process; later calls return immediately, so it is safe to
+    call from main.py on every rerun.
+    """
+    global _migrated, last_migration_report
+    if _migrated:
+        return last_migration_report
+
+    with _migrate_lock:
+        if _migrated:
+            return last_migration_report
+
+        start = time.perf_counter()
+        apply_database_profile()
+
+        conn = get_connection()
+        try:
+            applied = run_migrations(conn)
+            version = _current_schema_version(conn.cursor())
+        finally:
+            conn.close()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        last_migration_report = {
+            "version": version,
+            "applied": applied,
+            "elapsed_ms": round(elapsed, 2),
+            "budget_ms": MIGRATION_BUDGET_MS,
+        }
+        if elapsed > MIGRATION_BUDGET_MS:
+            print(f"⚠️ Schema migration took {elapsed:.0f} ms (budget {MIGRATION_BUDGET_MS} ms)")
+
+        _migrated = True
+        return last_migration_report
+
+
+# ---------- CREATE TABLES ----------
+def create_tables():
+    """Kept for older callers; the schema is versioned now, see migrate()."""
+    return migrate()
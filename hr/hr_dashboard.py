@@ -1,8 +1,7 @@
 # hr/hr_dashboard.py
 
 import streamlit as st
-from db import get_connection
-from datetime import datetime
+from jobmatch.store_data import get_company
 
 # ---------- HELPER FUNCTIONS ----------
 def set_page(page: str):
@@ -80,14 +79,7 @@ def hr_dashboard(user):
     st.markdown(f"<p style='text-align:center;color:#475569;font-weight:600;'>{user['name']} · {user['email']}</p>", unsafe_allow_html=True)
 
     # ---------------- COMPANY INFO ----------------
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT name, address, city, state, country, website, status
-        FROM companies WHERE id=?
-    """, (user["company_id"],))
-    row = cur.fetchone()
-    conn.close()
+    row = get_company(user["company_id"])  # cached, shared across sessions
 
     st.markdown("<div class='card-wrap'>", unsafe_allow_html=True)
     st.markdown("<h3>🏢 Company Information</h3>", unsafe_allow_html=True)
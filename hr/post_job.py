@@ -1,7 +1,7 @@
 # hr/post_job.py
 import streamlit as st
-from db import get_connection
-from datetime import datetime
+from jobmatch.store_data import create_job
+from jobmatch import match_scores  # noqa: F401  (keeps job_match_scores in step with JOB_CHANGED)
 
 def post_job_page(user):
     st.title("📝 Post a New Job")
@@ -24,24 +24,7 @@ def post_job_page(user):
                 return
 
             try:
-                conn = get_connection()
-                cur = conn.cursor()
-
-                cur.execute("""
-                    INSERT INTO job_posts (
-                        company_id,
-                        hr_id,
-                        role,
-                        location,
-                        skills,
-                        experience,
-                        salary,
-                        description,
-                        status,
-                        created_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'open', ?)
-                """, (
+                create_job(
                     user["company_id"],
                     user["id"],
                     title.strip(),        # mapped to role
@@ -50,14 +33,9 @@ def post_job_page(user):
                     experience.strip() if experience else None,
                     salary.strip() if salary else None,
                     description.strip() if description else None,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                ))
-
-                conn.commit()
-                st.success("✅ Job posted successfully")
-                st.rerun()
-
+                )
             except Exception as e:
                 st.error(f"Failed to post job: {e}")
-            finally:
-                conn.close()
+            else:
+                st.success("✅ Job posted successfully")
+                st.rerun()
@@ -1,42 +1,87 @@
+import math
+
 import streamlit as st
-from db import get_connection
+from jobmatch.store_data import get_company_applicants
+from jobmatch.minhash_lsh import similar_candidates
+from jobmatch.applicant_ranking import (
+    PAGE_SIZE, get_company_jobs_with_counts, get_ranked_applicants, get_ranked_applicants_page,
+)
+
+ALL_JOBS = "All jobs (newest applications first)"
+
 
 def view_applicants_page(user):
     st.header("👥 Applied Candidates")
 
-    conn = get_connection()
-    conn.row_factory = lambda cursor, row: {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
-    
-    # Fetch candidates who applied to HR's jobs
-    candidates = conn.execute("""
-        SELECT ja.id as app_id, u.name, u.email, jp.role
-        FROM job_applications ja
-        JOIN users u ON ja.candidate_id = u.id
-        JOIN job_posts jp ON ja.job_id = jp.id
-        WHERE jp.company_id=?
-        ORDER BY ja.applied_at DESC
-    """, (user["company_id"],)).fetchall()
-    conn.close()
+    jobs = get_company_jobs_with_counts(user["company_id"])
+    labels = {f"{role} (#{job_id}, {status}) — {count} applicants": job_id for job_id, role, status, count in jobs}
+    choice = st.selectbox("Job", [ALL_JOBS] + list(labels))
+
+    if choice == ALL_JOBS:
+        show_all_applicants(user)
+    else:
+        show_ranked_applicants(labels[choice])
+
+
+def show_ranked_applicants(job_id):
+    """Applicants to one job, best match first, one page at a time."""
+    total = len(get_ranked_applicants(job_id))
+    if not total:
+        st.info("No candidates have applied to this job yet.")
+        return
+
+    total_pages = math.ceil(total / PAGE_SIZE)
+    page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, key=f"applicants_page_{job_id}")
+    rows, total = get_ranked_applicants_page(job_id, page)
+    st.caption(f"{total} applicants ranked by skill match")
+
+    for rank, candidate in enumerate(rows, start=(page - 1) * PAGE_SIZE + 1):
+        with st.expander(f"#{rank} {candidate['name']} — {candidate['score']}% match", expanded=False):
+            st.write(f"**Email:** {candidate['email']}")
+            st.write(f"**Applied on:** {candidate['applied_at']}")
+            if candidate["missing"]:
+                st.write(f"**Missing skills:** {', '.join(candidate['missing'])}")
+            resume_button(candidate, f"ranked_{job_id}")
+            if st.button("🔎 Similar applicants", key=f"similar_{job_id}_{candidate['app_id']}"):
+                show_similar_applicants(job_id, candidate["candidate_id"])
+
+
+def show_similar_applicants(job_id, candidate_id, k=5):
+    """Applicants to the same job with the closest skill sets (MinHash LSH)."""
+    applicants = {r["candidate_id"]: r for r in get_ranked_applicants(job_id)}
+    similar = [
+        (applicants[uid], sim) for uid, sim in similar_candidates(candidate_id, k=200)
+        if uid in applicants
+    ][:k]
+    if not similar:
+        st.info("No applicants with a similar skill set.")
+        return
+    for other, sim in similar:
+        st.write(f"• {other['name']} — {sim:.0%} skill overlap, {other['score']}% match")
+
+
+def show_all_applicants(user):
+    # Fetch candidates who applied to HR's jobs (resume path comes with the row)
+    candidates = get_company_applicants(user["company_id"])
 
     if not candidates:
         st.info("No candidates have applied yet.")
         return
 
     for idx, candidate in enumerate(candidates):
-        app_id = candidate["app_id"]
         with st.expander(f"{candidate['name']} — {candidate['role']}", expanded=False):
             st.write(f"**Email:** {candidate['email']}")
             st.write(f"**Applied for:** {candidate['role']}")
+            resume_button(candidate, idx)
+
+
+def resume_button(candidate, key_suffix):
+    # Example action: View Resume (if resume_path exists)
+    resume_path = candidate["resume_path"]
 
-            # Example action: View Resume (if resume_path exists)
-            conn = get_connection()
-            resume_row = conn.execute("SELECT resume_path FROM users WHERE id=?", (candidate["app_id"],)).fetchone()
-            conn.close()
-            resume_path = resume_row[0] if resume_row else None
-
-            if resume_path:
-                try:
-                    with open(resume_path, "rb") as f:
-                        st.download_button("View Resume", f, file_name=f"{candidate['name']}_resume.pdf", key=f"resume_{app_id}_{idx}")
-                except:
-                    st.warning("Resume file missing or deleted.")
+    if resume_path:
+        try:
+            with open(resume_path, "rb") as f:
+                st.download_button("View Resume", f, file_name=f"{candidate['name']}_resume.pdf", key=f"resume_{candidate['app_id']}_{key_suffix}")
+        except:
+            st.warning("Resume file missing or deleted.")
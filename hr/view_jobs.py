@@ -1,5 +1,16 @@
 import streamlit as st
-from db import get_connection
+from db import connection, get_connection, hot_query
+from jobmatch.store_data import update_job
+from jobmatch import match_scores  # noqa: F401  (keeps job_match_scores in step with JOB_CHANGED)
+from utils.events import emit, JOB_CHANGED
+
+_COMPANY_JOBS_SQL = hot_query("company_jobs", """
+    SELECT id, role, skills, salary, experience, status
+    FROM job_posts
+    WHERE company_id=?
+    ORDER BY created_at DESC
+""", (1,))
+
 
 def view_jobs_page(user):
     st.markdown(
@@ -29,12 +40,7 @@ def view_jobs_page(user):
         col[0]: row[idx] for idx, col in enumerate(cursor.description)
     }
 
-    jobs = conn.execute("""
-        SELECT id, role, skills, salary, experience, status
-        FROM job_posts
-        WHERE company_id=?
-        ORDER BY created_at DESC
-    """, (user["company_id"],)).fetchall()
+    jobs = conn.execute(_COMPANY_JOBS_SQL, (user["company_id"],)).fetchall()
     conn.close()
 
     if not jobs:
@@ -68,12 +74,12 @@ def view_jobs_page(user):
             with col1:
                 if job["status"] == "open":
                     if st.button("🔒 Close Job", key=f"close_{job_id}", use_container_width=True):
-                        with get_connection() as conn2:
+                        with connection() as conn2:
                             conn2.execute(
                                 "UPDATE job_posts SET status='closed' WHERE id=?",
                                 (job_id,)
                             )
-                            conn2.commit()
+                        emit(JOB_CHANGED, job_id=job_id, action="closed")
                         st.success("Job closed successfully")
                         st.rerun()
 
@@ -85,12 +91,12 @@ def view_jobs_page(user):
             # ---- DELETE JOB ----
             with col3:
                 if st.button("🗑️ Delete Job", key=f"delete_{job_id}", use_container_width=True):
-                    with get_connection() as conn2:
+                    with connection() as conn2:
                         conn2.execute(
                             "DELETE FROM job_posts WHERE id=?",
                             (job_id,)
                         )
-                        conn2.commit()
+                    emit(JOB_CHANGED, job_id=job_id, action="deleted")
                     st.error("Job deleted")
                     st.rerun()
 
@@ -114,17 +120,14 @@ def view_jobs_page(user):
                         cancel = st.form_submit_button("❌ Cancel")
 
                     if submit:
-                        with get_connection() as conn3:
-                            conn3.execute("""
-                                UPDATE job_posts
-                                SET role=?, skills=?, salary=?, experience=?
-                                WHERE id=?
-                            """, (role, skills, salary, experience, job_id))
-                            conn3.commit()
-
-                        st.success("Job updated successfully")
-                        st.session_state.pop(f"edit_mode_{job_id}")
-                        st.rerun()
+                        try:
+                            update_job(job_id, role, skills, salary, experience)
+                        except Exception as e:
+                            st.error(f"Failed to update job: {e}")
+                        else:
+                            st.success("Job updated successfully")
+                            st.session_state.pop(f"edit_mode_{job_id}")
+                            st.rerun()
 
                     if cancel:
                         st.session_state.pop(f"edit_mode_{job_id}")
@@ -0,0 +1,105 @@
+# jobmatch/applicant_ranking.py
+"""
+Applicants to one job ranked by match score, for the HR applicants page.
+
+The whole ranking is computed once per job (one query for the applicants,
+one for their skills, one batch score) and cached; pages are slices of it.
+A new application or a change to the job drops that job's cached ranking;
+a candidate's new skills drop the rankings of every job they applied to.
+"""
+from db import get_connection, hot_query
+from jobmatch.batch_score import load_applicant_skills, score_candidates_against_job
+from jobmatch.skill_dictionary import skill_names
+from jobmatch.store_data import get_applied_job_ids, get_job_skill_ids
+from utils.cache import TTLCache
+from utils.events import subscribe, JOB_CHANGED, APPLICATION_CREATED, SKILLS_CHANGED
+
+ranking_cache = TTLCache("applicant_rankings", maxsize=500)
+
+PAGE_SIZE = 25
+
+
+_COMPANY_JOBS_WITH_COUNTS_SQL = hot_query("company_jobs_with_counts", """
+    SELECT jp.id, jp.role, jp.status, COUNT(ja.id)
+    FROM job_posts jp
+    LEFT JOIN job_applications ja ON ja.job_id = jp.id
+    WHERE jp.company_id=?
+    GROUP BY jp.id
+    ORDER BY jp.created_at DESC
+""", (1,))
+
+
+def get_company_jobs_with_counts(company_id):
+    """[(job_id, role, status, applicants), ...] newest job first."""
+    conn = get_connection()
+    rows = conn.execute(_COMPANY_JOBS_WITH_COUNTS_SQL, (company_id,)).fetchall()
+    conn.close()
+    return rows
+
+
+_JOB_APPLICANTS_SQL = hot_query("job_applicants", """
+    SELECT ja.id, ja.candidate_id, u.name, u.email, u.resume_path, ja.applied_at
+    FROM job_applications ja
+    JOIN users u ON ja.candidate_id = u.id
+    WHERE ja.job_id=?
+""", (1,))
+
+
+def _load_ranking(job_id):
+    conn = get_connection()
+    job = conn.execute("SELECT 1 FROM job_posts WHERE id=?", (job_id,)).fetchone()
+    rows = conn.execute(_JOB_APPLICANTS_SQL, (job_id,)).fetchall()
+    conn.close()
+    if not job or not rows:
+        return []
+
+    job_skills = get_job_skill_ids(job_id)
+    result = score_candidates_against_job(job_skills, load_applicant_skills(job_id))
+    position = {uid: i for i, uid in enumerate(result["user_ids"].tolist())}
+    scores = result["scores"].tolist()
+
+    ranked = []
+    for app_id, candidate_id, name, email, resume_path, applied_at in rows:
+        i = position.get(candidate_id)
+        ranked.append({
+            "app_id": app_id,
+            "candidate_id": candidate_id,
+            "name": name,
+            "email": email,
+            "resume_path": resume_path,
+            "applied_at": applied_at,
+            "score": scores[i] if i is not None else 0.0,
+            "missing": skill_names(result["missing"][i] if i is not None else job_skills),
+        })
+    # best match first; earlier application wins a tie
+    ranked.sort(key=lambda r: (-r["score"], r["applied_at"] or ""))
+    return ranked
+
+
+def get_ranked_applicants(job_id):
+    """Every applicant to job_id, best match first. Shared and cached: read-only."""
+    return ranking_cache.get_or_load(job_id, lambda: _load_ranking(job_id))
+
+
+def get_ranked_applicants_page(job_id, page=1, page_size=PAGE_SIZE):
+    """(rows for 1-based page, total applicants)."""
+    ranked = get_ranked_applicants(job_id)
+    start = max(page - 1, 0) * page_size
+    return ranked[start:start + page_size], len(ranked)
+
+
+def _invalidate(job_id=None, **_):
+    ranking_cache.invalidate(job_id)
+
+
+def _on_skills_changed(user_id=None, **_):
+    if user_id is None:
+        ranking_cache.invalidate()
+        return
+    for job_id in get_applied_job_ids(user_id):
+        ranking_cache.invalidate(job_id)
+
+
+subscribe(JOB_CHANGED, _invalidate)
+subscribe(APPLICATION_CREATED, _invalidate)
+subscribe(SKILLS_CHANGED, _on_skills_changed)
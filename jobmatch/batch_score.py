@@ -0,0 +1,185 @@
+# jobmatch/batch_score.py
+"""
+Batch match scoring with sparse skill matrices.
+
+Same scoring rule as match_score / missing_skills (matched job skills /
+job skills * 100, missing = job skills the candidate lacks), but one sparse
+matrix-vector product scores a candidate against every job at once (or every
+applicant against one job) instead of a Python loop of set operations.
+
+The matrices work on any hashable skill key. The app uses canonical skill ids
+(jobmatch.skill_dictionary), so "missing" holds ids; turn them into names
+with skill_names().
+"""
+import threading
+
+import numpy as np
+from scipy import sparse
+
+from db import get_connection
+from jobmatch.store_data import get_candidate_skill_ids, get_open_jobs, get_job_skill_ids
+from utils.events import subscribe, JOB_CHANGED
+
+
+class SkillMatrix:
+    """Rows = jobs or candidates, columns = skills, 1 where the row has the skill."""
+
+    def __init__(self, row_ids, row_skills, vocabulary=None):
+        if vocabulary is None:
+            vocabulary = {}
+            for skills in row_skills:
+                for s in skills:
+                    if s not in vocabulary:
+                        vocabulary[s] = len(vocabulary)
+        self.vocabulary = vocabulary
+        self.skill_names = np.empty(len(vocabulary), dtype=object)
+        for s, col in vocabulary.items():
+            self.skill_names[col] = s
+
+        indptr = [0]
+        indices = []
+        for skills in row_skills:
+            cols = sorted({vocabulary[s] for s in skills if s in vocabulary})
+            indices.extend(cols)
+            indptr.append(len(indices))
+
+        self.row_ids = np.asarray(row_ids)
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+            shape=(len(row_ids), len(vocabulary)),
+        )
+        self.row_sizes = np.diff(self.matrix.indptr)
+
+    def vector(self, skills):
+        """Dense 0/1 vector over this matrix's vocabulary (unknown skills are dropped)."""
+        v = np.zeros(len(self.vocabulary), dtype=np.float32)
+        cols = [self.vocabulary[s] for s in skills if s in self.vocabulary]
+        v[cols] = 1.0
+        return v
+
+
+def _scores(overlap, sizes):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(sizes > 0, overlap / sizes * 100, 0.0)
+    return np.round(scores, 2)
+
+
+def _missing_per_row(m: SkillMatrix, candidate_vector):
+    """For each row, the row's skills where candidate_vector is 0."""
+    mask = candidate_vector[m.matrix.indices] == 0
+    names = m.skill_names[m.matrix.indices[mask]]
+    running = np.concatenate(([0], np.cumsum(mask)))
+    bounds = running[m.matrix.indptr].tolist()
+    names = names.tolist()
+    return [names[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+# ---------- OPEN JOBS MATRIX (shared, rebuilt when jobs change) ----------
+_jobs_lock = threading.Lock()
+_jobs_matrix = None
+
+
+def open_jobs_matrix():
+    global _jobs_matrix
+    with _jobs_lock:
+        if _jobs_matrix is None:
+            jobs = get_open_jobs()
+            _jobs_matrix = SkillMatrix([j["id"] for j in jobs], [j["skill_ids"] for j in jobs])
+        return _jobs_matrix
+
+
+def _on_job_changed(**_):
+    global _jobs_matrix
+    with _jobs_lock:
+        _jobs_matrix = None
+
+
+subscribe(JOB_CHANGED, _on_job_changed)
+
+
+# ---------- ONE CANDIDATE vs ALL JOBS ----------
+def score_candidate_against_jobs(candidate_skills, jobs: SkillMatrix = None, with_missing=True):
+    """
+    Returns {"job_ids", "scores", "missing"} as arrays aligned by row;
+    missing is a list of skill-name lists (None when with_missing=False).
+    """
+    jobs = jobs or open_jobs_matrix()
+    c = jobs.vector(candidate_skills)
+    overlap = jobs.matrix @ c
+    scores = _scores(overlap, jobs.row_sizes)
+    return {
+        "job_ids": jobs.row_ids,
+        "scores": scores,
+        "missing": _missing_per_row(jobs, c) if with_missing else None,
+    }
+
+
+def score_user_against_open_jobs(user_id, with_missing=True):
+    return score_candidate_against_jobs(get_candidate_skill_ids(user_id), with_missing=with_missing)
+
+
+# ---------- MANY CANDIDATES vs ONE JOB ----------
+def load_candidate_skills(user_ids):
+    """{user_id: [skill_id, ...]} for many users, in chunks of one IN (...) query."""
+    out = {uid: [] for uid in user_ids}
+    ids = list(out)
+    conn = get_connection()
+    for i in range(0, len(ids), 900):
+        chunk = ids[i : i + 900]
+        marks = ",".join("?" * len(chunk))
+        for uid, skill_id in conn.execute(
+            f"SELECT user_id, skill_id FROM user_skills WHERE user_id IN ({marks}) AND skill_id IS NOT NULL", chunk
+        ).fetchall():
+            out[uid].append(skill_id)
+    conn.close()
+    return out
+
+
+def load_applicant_skills(job_id):
+    """{candidate_id: [skill_id, ...]} for everyone who applied to job_id, in one query."""
+    conn = get_connection()
+    rows = conn.execute("""
+        SELECT ja.candidate_id, us.skill_id
+        FROM job_applications ja
+        LEFT JOIN user_skills us ON us.user_id = ja.candidate_id
+        WHERE ja.job_id = ?
+    """, (job_id,)).fetchall()
+    conn.close()
+
+    out = {}
+    for uid, skill_id in rows:
+        skills = out.setdefault(uid, [])
+        if skill_id is not None:
+            skills.append(skill_id)
+    return out
+
+
+def score_candidates_against_job(job_skills, candidates: dict, with_missing=True):
+    """
+    candidates: {user_id: [skill key, ...]}. Returns {"user_ids", "scores", "missing"}
+    aligned by row, same shape as score_candidate_against_jobs.
+    """
+    job_skills = list(dict.fromkeys(job_skills))
+    vocab = {s: i for i, s in enumerate(job_skills)}
+    m = SkillMatrix(list(candidates), list(candidates.values()), vocabulary=vocab)
+
+    j = np.ones(len(vocab), dtype=np.float32)
+    overlap = m.matrix @ j
+    scores = _scores(overlap, np.full(len(m.row_ids), len(vocab)))
+
+    missing = None
+    if with_missing:
+        has = m.matrix.toarray().astype(bool)          # candidates x job skills (small)
+        names = np.asarray(job_skills, dtype=object)
+        missing = [names[~row].tolist() for row in has]
+
+    return {"user_ids": m.row_ids, "scores": scores, "missing": missing}
+
+
+def score_job_applicants(job_id, with_missing=True):
+    conn = get_connection()
+    row = conn.execute("SELECT 1 FROM job_posts WHERE id=?", (job_id,)).fetchone()
+    conn.close()
+    if not row:
+        return {"user_ids": np.array([]), "scores": np.array([]), "missing": [] if with_missing else None}
+    return score_candidates_against_job(get_job_skill_ids(job_id), load_applicant_skills(job_id), with_missing)
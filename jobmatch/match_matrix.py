@@ -0,0 +1,220 @@
+# jobmatch/match_matrix.py
+"""
+Offline full match matrix: every candidate scored against every open job.
+
+    python -m jobmatch.match_matrix --out reports/matrix --format parquet
+    python -m jobmatch.match_matrix --out reports/matrix --format csv --workers 8
+    python -m jobmatch.match_matrix --format db            # -> match_matrix table
+    python -m jobmatch.match_matrix --out reports/matrix --resume
+
+Candidates are split into fixed chunks (sorted by id) and scored in a process
+pool with the batch scorer (jobmatch.batch_score): one sparse
+candidates x jobs product per chunk. The main process reads skills and writes
+results, workers only compute. Workers are spawned, not forked: a forked child
+would inherit the parent's pooled SQLite handles and its lock state, so they
+start from a fresh interpreter and get the job skills through the initializer.
+
+Each finished chunk is written on its own (a part file, or one transaction
+in the database) and then recorded in a checkpoint file, so --resume skips
+finished chunks after a crash. The checkpoint sits next to the output
+(<out>/_checkpoint.json, or <database>.match_matrix.checkpoint.json for
+--format db) and is deleted once every chunk is done. Pairs sharing no skill
+score 0 and are not written; --min-score drops more.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from db import get_connection, connection, database_path
+from jobmatch.batch_score import SkillMatrix, load_candidate_skills
+from jobmatch.store_data import load_open_jobs
+
+CHUNK_SIZE = 500
+
+# set in each worker by _init_worker
+_jobs = None
+
+
+def _init_worker(job_ids, job_skills):
+    global _jobs
+    _jobs = SkillMatrix(job_ids, job_skills)
+
+
+def score_chunk(jobs: SkillMatrix, candidates: dict, min_score=0.0):
+    """DataFrame(user_id, job_id, score, missing_count) for pairs sharing a skill."""
+    cands = SkillMatrix(list(candidates), list(candidates.values()), vocabulary=jobs.vocabulary)
+    overlap = (cands.matrix @ jobs.matrix.T).tocoo()
+    sizes = jobs.row_sizes[overlap.col]
+    scores = np.round(overlap.data / sizes * 100, 2)
+    keep = scores >= min_score if min_score > 0 else slice(None)
+    return pd.DataFrame({
+        "user_id": cands.row_ids[overlap.row][keep],
+        "job_id": jobs.row_ids[overlap.col][keep],
+        "score": scores[keep].astype(np.float32),
+        "missing_count": (sizes - overlap.data)[keep].astype(np.int16),
+    })
+
+
+def _work(task):
+    index, candidates, min_score = task
+    start = time.perf_counter()
+    df = score_chunk(_jobs, candidates, min_score)
+    return index, len(candidates), df, time.perf_counter() - start
+
+
+# ---------- OUTPUT ----------
+class PartFileWriter:
+    """One part-NNNNN.<ext> per chunk, written to a temp name and renamed."""
+
+    def __init__(self, out_dir, fmt):
+        self.out_dir = out_dir
+        self.fmt = fmt
+        os.makedirs(out_dir, exist_ok=True)
+
+    def write(self, index, df, user_ids):
+        path = os.path.join(self.out_dir, f"part-{index:05d}.{self.fmt}")
+        tmp = path + ".tmp"
+        if self.fmt == "parquet":
+            df.to_parquet(tmp, index=False)
+        else:
+            df.to_csv(tmp, index=False)
+        os.replace(tmp, path)
+
+
+class DatabaseWriter:
+    """Replaces the chunk's users' rows in match_matrix, one transaction per chunk."""
+
+    def write(self, index, df, user_ids):
+        with connection() as conn:
+            for i in range(0, len(user_ids), 900):
+                part = user_ids[i:i + 900]
+                conn.execute(
+                    f"DELETE FROM match_matrix WHERE user_id IN ({','.join('?' * len(part))})", part
+                )
+            conn.executemany(
+                "INSERT INTO match_matrix (user_id, job_id, score, missing_count) VALUES (?, ?, ?, ?)",
+                df.itertuples(index=False, name=None),
+            )
+
+
+# ---------- CHECKPOINT ----------
+def _load_checkpoint(path, params):
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("params") != params:
+        raise SystemExit(
+            f"❌ Checkpoint {path} was written for a different run "
+            f"({data.get('params')}); remove it or drop --resume"
+        )
+    return set(data.get("done", []))
+
+
+def _save_checkpoint(path, params, done):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"params": params, "done": sorted(done)}, f)
+    os.replace(tmp, path)
+
+
+def candidate_ids():
+    conn = get_connection()
+    rows = conn.execute("SELECT id FROM users WHERE role='candidate' ORDER BY id").fetchall()
+    conn.close()
+    return [r[0] for r in rows]
+
+
+def run(out=None, fmt="parquet", workers=None, chunk_size=CHUNK_SIZE, min_score=0.0,
+        resume=False, checkpoint=None):
+    jobs = load_open_jobs()
+    job_ids = [j["id"] for j in jobs]
+    job_skills = [j["skill_ids"] for j in jobs]
+    users = candidate_ids()
+    chunks = [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
+
+    if fmt == "db":
+        writer = DatabaseWriter()
+        checkpoint = checkpoint or database_path() + ".match_matrix.checkpoint.json"
+    else:
+        if not out:
+            raise SystemExit("❌ --out is required for csv/parquet output")
+        writer = PartFileWriter(out, fmt)
+        checkpoint = checkpoint or os.path.join(out, "_checkpoint.json")
+
+    # a resumed run must cut candidates and jobs exactly like the first one
+    params = {
+        "format": fmt,
+        "chunk_size": chunk_size,
+        "min_score": min_score,
+        "candidates": [len(users), users[-1] if users else 0],
+        "jobs": [len(job_ids), max(job_ids, default=0), sum(job_ids)],
+    }
+    done = _load_checkpoint(checkpoint, params) if resume else set()
+    if not resume and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    todo = [i for i in range(len(chunks)) if i not in done]
+    print(f"📊 {len(users):,} candidates x {len(job_ids):,} open jobs, "
+          f"{len(chunks)} chunks ({len(done)} already done)")
+
+    def tasks():
+        # runs in the pool's feeder thread: skills are read just ahead of the workers
+        for i in todo:
+            yield i, load_candidate_skills(chunks[i]), min_score
+
+    start = time.perf_counter()
+    pairs = rows = 0
+    workers = workers or os.cpu_count() or 1
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers, initializer=_init_worker, initargs=(job_ids, job_skills)) as pool:
+        for index, n_candidates, df, _ in pool.imap_unordered(_work, tasks()):
+            writer.write(index, df, chunks[index])
+            done.add(index)
+            _save_checkpoint(checkpoint, params, done)
+
+            pairs += n_candidates * len(job_ids)
+            rows += len(df)
+            elapsed = time.perf_counter() - start
+            print(f"  chunk {index:>5}  {len(done):>5}/{len(chunks)}  "
+                  f"{pairs / elapsed:>14,.0f} pairs/s  {rows:>12,} rows written")
+
+    # a finished run has nothing to resume; a stale file would only trip the next --resume
+    if len(done) == len(chunks) and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    elapsed = time.perf_counter() - start
+    rate = pairs / elapsed if elapsed else 0
+    print(f"✅ Scored {pairs:,} pairs in {elapsed:.1f}s ({rate:,.0f} pairs/s), wrote {rows:,} rows")
+    return {"pairs": pairs, "rows": rows, "seconds": elapsed, "pairs_per_s": rate}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", help="output directory (csv/parquet)")
+    parser.add_argument("--format", choices=["parquet", "csv", "db"], default="parquet")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="candidates per chunk")
+    parser.add_argument("--min-score", type=float, default=0.0, help="drop pairs scoring below this")
+    parser.add_argument("--resume", action="store_true", help="skip chunks recorded in the checkpoint")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: next to the output)")
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("parquet output needs pyarrow (pip install pyarrow) or use --format csv")
+
+    run(args.out, args.format, args.workers, args.chunk_size, args.min_score, args.resume, args.checkpoint)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,3 +4,11 @@ def calculate_match_score(matched_skills, job_skills):
     if not job_skills:
         return 0.0
     return round((len(matched_skills) / len(job_skills)) * 100, 2)
+
+
+def calculate_match_score_bits(candidate_bits, job_bits):
+    """Same score over skill bitsets (jobmatch.skill_bits): two popcounts."""
+    total = job_bits.bit_count()
+    if not total:
+        return 0.0
+    return round(((candidate_bits & job_bits).bit_count() / total) * 100, 2)
@@ -0,0 +1,101 @@
+# jobmatch/match_scores.py
+"""
+Materialised match scores: job_match_scores(user_id, job_id, score, missing_count).
+
+Every (candidate, open job) pair sharing at least one skill has a row, so a
+missing row means no shared skill: score 0, every job skill missing. Pairs
+with nothing in common are the bulk of the cross product and are never
+written. Rows are recomputed in SQL, one slice at a time:
+
+    SKILLS_CHANGED (save_skills)        -> that user's rows
+    JOB_CHANGED (post / edit / close)   -> that job's rows
+
+so reading a candidate's scores is one indexed query sorted by score, and
+pages never score a job card themselves.
+"""
+from db import get_connection, hot_query
+from utils.events import subscribe, JOB_CHANGED, SKILLS_CHANGED
+
+# matched = candidate skill ids ∩ job skill ids (job_skills rows)
+_SCORE_SELECT = """
+    SELECT user_id, job_id, ROUND(matched * 100.0 / n, 2), n - matched
+    FROM (
+        SELECT us.user_id, js.job_id, COUNT(*) AS matched,
+               (SELECT COUNT(*) FROM job_skills x WHERE x.job_id = js.job_id) AS n
+        FROM user_skills us
+        JOIN job_skills js ON js.skill_id = us.skill_id
+        JOIN job_posts jp ON jp.id = js.job_id
+        WHERE jp.status = 'open' {where}
+        GROUP BY us.user_id, js.job_id
+    )
+"""
+
+
+def _insert_scores(cur, where="", params=()):
+    cur.execute(
+        "INSERT OR REPLACE INTO job_match_scores (user_id, job_id, score, missing_count) "
+        + _SCORE_SELECT.format(where=where),
+        params,
+    )
+
+
+def rebuild_all(cur):
+    """Recompute every row (benchmarks.seed_data after a bulk load)."""
+    cur.execute("DELETE FROM job_match_scores")
+    _insert_scores(cur)
+
+
+def refresh_user(user_id):
+    conn = get_connection()
+    try:
+        conn.execute("DELETE FROM job_match_scores WHERE user_id=?", (user_id,))
+        _insert_scores(conn, "AND us.user_id = ?", (user_id,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def refresh_job(job_id):
+    """Closed or deleted jobs simply lose their rows (the SELECT only sees open jobs)."""
+    conn = get_connection()
+    try:
+        conn.execute("DELETE FROM job_match_scores WHERE job_id=?", (job_id,))
+        _insert_scores(conn, "AND js.job_id = ?", (job_id,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ---------- READS ----------
+_MATCH_SCORES_SQL = hot_query("match_scores_for_user", """
+    SELECT job_id, score, missing_count FROM job_match_scores
+    WHERE user_id=? ORDER BY score DESC
+""", (1,))
+
+
+def get_match_scores(user_id, limit=None):
+    """[(job_id, score, missing_count), ...] best match first."""
+    conn = get_connection()
+    sql = _MATCH_SCORES_SQL
+    params = (user_id,)
+    if limit:
+        sql += " LIMIT ?"
+        params += (limit,)
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+
+# ---------- EVENTS ----------
+def _on_skills_changed(user_id=None, **_):
+    if user_id is not None:
+        refresh_user(user_id)
+
+
+def _on_job_changed(job_id=None, **_):
+    if job_id is not None:
+        refresh_job(job_id)
+
+
+subscribe(SKILLS_CHANGED, _on_skills_changed)
+subscribe(JOB_CHANGED, _on_job_changed)
@@ -0,0 +1,220 @@
+# jobmatch/minhash_lsh.py
+"""
+Approximate "similar candidates" / "similar jobs" with MinHash + LSH.
+
+Every skill set (canonical skill ids) gets a MinHash signature of NUM_PERM
+values; the probability that two signatures agree at one position is the
+Jaccard similarity of the sets. Signatures are cut into `bands` of `rows`
+values and each band is hashed into a bucket, so a query only looks at keys
+that share at least one bucket instead of every other candidate or job.
+Those are then re-ranked by exact Jaccard.
+
+More bands (fewer rows each) -> higher recall, more candidates to re-rank:
+a pair with similarity s becomes a candidate with probability
+1 - (1 - s**rows) ** bands. See benchmarks/lsh_recall.py.
+
+The shared indexes are built on first use and patched from SKILLS_CHANGED
+(candidates) and JOB_CHANGED (jobs).
+"""
+import os
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from db import get_connection
+from jobmatch.store_data import get_open_jobs, get_job_skill_ids
+from utils.events import subscribe, JOB_CHANGED, SKILLS_CHANGED
+
+NUM_PERM = int(os.environ.get("TRUSTHIRE_LSH_PERM", "64"))
+BANDS = int(os.environ.get("TRUSTHIRE_LSH_BANDS", "32"))
+
+_PRIME = (1 << 31) - 1
+
+
+def jaccard(a, b):
+    a, b = set(a), set(b)
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Universal hashing (a*x + b) mod p over integer skill ids."""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, ids):
+        ids = np.fromiter(set(ids), dtype=np.uint64)
+        if not len(ids):
+            return None
+        return ((np.outer(self.a, ids) + self.b[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+class LSHIndex:
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, seed=1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets = [defaultdict(set) for _ in range(bands)]
+        self.sets = {}           # key -> frozenset of skill ids
+        self.band_keys = {}      # key -> [bucket key per band]
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.sets)
+
+    def _band_keys(self, sig):
+        r = self.rows
+        return [sig[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def add(self, key, ids):
+        """Insert or replace one candidate / job."""
+        ids = frozenset(i for i in ids if i is not None)
+        sig = self.hasher.signature(ids)
+        with self._lock:
+            self.remove(key)
+            if sig is None:
+                return
+            bks = self._band_keys(sig)
+            for band, bk in zip(self.buckets, bks):
+                band[bk].add(key)
+            self.sets[key] = ids
+            self.band_keys[key] = bks
+
+    def remove(self, key):
+        with self._lock:
+            bks = self.band_keys.pop(key, None)
+            self.sets.pop(key, None)
+            if bks is None:
+                return
+            for band, bk in zip(self.buckets, bks):
+                keys = band.get(bk)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del band[bk]
+
+    def candidates(self, ids):
+        sig = self.hasher.signature(ids)
+        if sig is None:
+            return set()
+        found = set()
+        with self._lock:
+            for band, bk in zip(self.buckets, self._band_keys(sig)):
+                found |= band.get(bk, set())
+        return found
+
+    def query(self, ids, k=10, exclude=None, min_similarity=0.0):
+        """[(key, jaccard), ...] best first among keys sharing a bucket with ids."""
+        ids = set(ids)
+        found = self.candidates(ids)
+        found.discard(exclude)
+        with self._lock:
+            scored = [(jaccard(ids, self.sets[key]), key) for key in found if key in self.sets]
+        scored = [(s, key) for s, key in scored if s >= min_similarity]
+        scored.sort(key=lambda t: (-t[0], t[1]))
+        return [(key, round(s, 4)) for s, key in scored[:k]]
+
+    def query_key(self, key, k=10, min_similarity=0.0):
+        ids = self.sets.get(key)
+        if not ids:
+            return []
+        return self.query(ids, k, exclude=key, min_similarity=min_similarity)
+
+
+def exact_top_k(sets, ids, k=10, exclude=None):
+    """Brute-force reference: Jaccard against every set."""
+    ids = set(ids)
+    scored = [(jaccard(ids, other), key) for key, other in sets.items() if key != exclude]
+    scored = [t for t in scored if t[0] > 0]
+    scored.sort(key=lambda t: (-t[0], t[1]))
+    return [(key, round(s, 4)) for s, key in scored[:k]]
+
+
+# ---------- SHARED INDEXES ----------
+_candidates = None
+_jobs = None
+_build_lock = threading.Lock()
+
+
+def load_all_candidate_skill_ids():
+    conn = get_connection()
+    rows = conn.execute(
+        "SELECT user_id, skill_id FROM user_skills WHERE skill_id IS NOT NULL"
+    ).fetchall()
+    conn.close()
+    out = defaultdict(list)
+    for user_id, skill_id in rows:
+        out[user_id].append(skill_id)
+    return out
+
+
+def candidate_index():
+    global _candidates
+    with _build_lock:
+        if _candidates is None:
+            index = LSHIndex()
+            for user_id, ids in load_all_candidate_skill_ids().items():
+                index.add(user_id, ids)
+            _candidates = index
+        return _candidates
+
+
+def job_index():
+    global _jobs
+    with _build_lock:
+        if _jobs is None:
+            index = LSHIndex()
+            for job in get_open_jobs():
+                index.add(job["id"], job["skill_ids"])
+            _jobs = index
+        return _jobs
+
+
+def _on_skills_changed(user_id=None, **_):
+    if _candidates is None or user_id is None:
+        return
+    conn = get_connection()
+    rows = conn.execute(
+        "SELECT skill_id FROM user_skills WHERE user_id=? AND skill_id IS NOT NULL", (user_id,)
+    ).fetchall()
+    conn.close()
+    _candidates.add(user_id, [r[0] for r in rows])
+
+
+def _on_job_changed(job_id=None, action=None, **_):
+    global _jobs
+    if _jobs is None:
+        return
+    if job_id is None:
+        _jobs = None
+        return
+    conn = get_connection()
+    row = conn.execute("SELECT status FROM job_posts WHERE id=?", (job_id,)).fetchone()
+    conn.close()
+    if row and row[0] == "open":
+        _jobs.add(job_id, get_job_skill_ids(job_id))
+    else:
+        _jobs.remove(job_id)
+
+
+subscribe(SKILLS_CHANGED, _on_skills_changed)
+subscribe(JOB_CHANGED, _on_job_changed)
+
+
+# ---------- QUERIES ----------
+def similar_candidates(user_id, k=10):
+    """[(user_id, jaccard), ...] candidates with the most similar skill sets."""
+    return candidate_index().query_key(user_id, k)
+
+
+def similar_jobs(job_id, k=10):
+    """[(job_id, jaccard), ...] open jobs asking for the most similar skills."""
+    return job_index().query_key(job_id, k)
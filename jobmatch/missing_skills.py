@@ -2,3 +2,8 @@
 
 def find_missing_skills(candidate_skills, job_skills):
     return list(set(job_skills) - set(candidate_skills))
+
+
+def find_missing_skill_bits(candidate_bits, job_bits):
+    """Job skills the candidate lacks, as a bitset (jobmatch.skill_bits.skill_ids_from_bits for ids)."""
+    return job_bits & ~candidate_bits
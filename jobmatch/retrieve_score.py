@@ -1,30 +1,50 @@
-from jobmatch.match_score import calculate_match_score
-from jobmatch.missing_skills import find_missing_skills
+from jobmatch.match_score import calculate_match_score, calculate_match_score_bits
+from jobmatch.missing_skills import find_missing_skills, find_missing_skill_bits
+from jobmatch.skill_bits import from_blob, skill_ids_from_bits
+from jobmatch.skill_dictionary import skill_names
+from jobmatch.store_data import get_candidate_skills, get_candidate_skill_bits
 from db import get_connection
 
 
+def score_skills(candidate_skills, job_skills):
+    """(score, missing) for already-normalised skill lists, no DB access."""
+    missing = find_missing_skills(candidate_skills, job_skills)
+    candidate_set = set(candidate_skills)
+    score = calculate_match_score(
+        [s for s in job_skills if s in candidate_set],
+        job_skills
+    )
+    return score, missing
+
+
+def score_skill_ids(candidate_ids, job_ids):
+    """(score, missing ids) for canonical skill ids: plain integer set intersection."""
+    if not job_ids:
+        return 0.0, []
+    have = set(candidate_ids)
+    missing = [i for i in job_ids if i not in have]
+    return round((len(job_ids) - len(missing)) / len(job_ids) * 100, 2), missing
+
+
+def score_skill_bits(candidate_bits, job_bits):
+    """(score, missing bits) for skill bitsets: popcounts and masks, nothing allocated per skill."""
+    return calculate_match_score_bits(candidate_bits, job_bits), find_missing_skill_bits(candidate_bits, job_bits)
+
+
 def retrieve_match_result(user_id, job_id):
     conn = get_connection()
 
     job = conn.execute(
-        "SELECT skills FROM job_posts WHERE id=?",
+        "SELECT skill_bits FROM job_posts WHERE id=?",
         (job_id,)
     ).fetchone()
 
-    # TEMP SKILLS (until resume parsing works)
-    candidate_skills = ["c", "java"]
-
     conn.close()
 
     if not job:
         return 0, [], []
 
-    job_skills = [s.strip().lower() for s in job[0].split(",")]
-
-    missing = find_missing_skills(candidate_skills, job_skills)
-    score = calculate_match_score(
-        [s for s in job_skills if s in candidate_skills],
-        job_skills
-    )
+    candidate_skills = get_candidate_skills(user_id)
+    score, missing = score_skill_bits(get_candidate_skill_bits(user_id), from_blob(job[0]))
 
-    return score, candidate_skills, missing
\ No newline at end of file
+    return score, candidate_skills, skill_names(skill_ids_from_bits(missing))
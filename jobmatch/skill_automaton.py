@@ -0,0 +1,172 @@
+# jobmatch/skill_automaton.py
+"""
+Aho-Corasick automaton over the curated spellings of the skill dictionary.
+
+Finds every known skill anywhere in a text in one left-to-right pass, so the
+cost grows with the length of the resume and not with the number of skills
+and aliases. Only curated spellings are compiled (skill_dictionary.curated_spellings):
+whatever SkillDictionary.ensure learns from typed input ("the", "english")
+would otherwise be found in every resume.
+
+    get_automaton().find_all("Built pipelines in Python and PySpark")
+    -> [(19, 25, <python id>), (30, 37, <spark id>)]
+
+Matching is case-insensitive, any run of whitespace counts as one space, a
+match must sit on word boundaries ("java" is not found inside "javascript")
+and matches never overlap: the leftmost, then longest spelling wins, so
+"c++" beats "c" and "machine learning" beats "learning".
+"""
+import hashlib
+import threading
+from collections import deque
+
+from db import get_connection
+from jobmatch.skill_dictionary import curated_spellings, get_dictionary
+
+# Spellings that are ordinary English words (or names): outside a skills
+# section "react to feedback" or "spring 2023" are not skills. Spellings of
+# one or two characters ("r", "go", "ml") are treated the same way.
+AMBIGUOUS = frozenset({
+    "react", "angular", "express", "next", "node", "spring", "rails", "ruby",
+    "rust", "swift", "go", "dart", "julia", "perl", "lua", "elixir", "groovy",
+    "shell", "bash", "rest", "agile", "excel", "spark", "flutter", "flask",
+    "torch", "pandas", "latex", "azure", "eclipse", "airflow", "tableau",
+    "cassandra", "jenkins", "kafka", "oracle", "apache", "phoenix", "gin",
+    "fiber", "koa", "jest", "mocha", "chai", "cucumber", "electron", "babel",
+    "vite", "gatsby", "helm", "hive", "chef", "puppet", "packer", "sketch",
+    "notion", "slack", "unity", "blender", "tally", "sales", "audit",
+    "assembly", "bootstrap", "struts", "hibernate", "ionic", "soap",
+    "snowflake", "waterfall", "outlook", "transformers", "statistics",
+    "algorithms", "networking", "communication", "leadership", "teamwork",
+    "budgeting", "forecasting", "mentoring", "negotiation", "prototyping",
+    "sem", "sas", "sap", "iam", "plc", "dns", "android", "ios",
+})
+
+
+def is_ambiguous(spelling):
+    return len(spelling) <= 2 or spelling in AMBIGUOUS
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+class SkillAutomaton:
+    def __init__(self, spellings):
+        """spellings: {normalised spelling: skill id} (curated_spellings)."""
+        # changes whenever the vocabulary does; part of the resume parse cache key
+        self.version = hashlib.blake2b(
+            "\n".join(f"{k}\t{v}" for k, v in sorted(spellings.items())).encode(), digest_size=6
+        ).hexdigest()
+        self.goto = [{}]
+        self.fail = [0]
+        # per state: (length, skill_id, spelling) of every spelling ending there
+        self.out = [()]
+        for spelling, skill_id in spellings.items():
+            if spelling:
+                self._add(spelling, skill_id)
+        self._link()
+
+    def _add(self, spelling, skill_id):
+        state = 0
+        for ch in spelling:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(())
+            state = nxt
+        self.out[state] = ((len(spelling), skill_id, spelling),)
+
+    def _link(self):
+        """Failure links breadth first; outputs inherit their suffix states' outputs."""
+        goto, fail, out = self.goto, self.fail, self.out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(ch, 0)
+                fail[nxt] = f
+                if out[f]:
+                    out[nxt] = out[nxt] + out[f]
+
+    def find_all(self, text, skip_ambiguous=False):
+        """[(start, end, skill_id), ...] in text order; text[start:end] is the match as written."""
+        if not text:
+            return []
+        low = text.lower()
+        if len(low) != len(text):
+            # "İ".lower() is two characters; keep offsets aligned with text
+            low = "".join(c.lower()[:1] for c in text)
+
+        goto, fail, out = self.goto, self.fail, self.out
+        n = len(low)
+        found = []
+        starts = []  # offset in text of each character fed to the automaton
+        state = 0
+        in_space = True
+        for i, ch in enumerate(low):
+            if ch.isspace():
+                if in_space:
+                    continue
+                in_space = True
+                ch = " "
+            else:
+                in_space = False
+            starts.append(i)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            if i + 1 < n and _is_word_char(low[i + 1]):
+                continue
+            fed = len(starts)
+            for length, skill_id, spelling in out[state]:
+                start = starts[fed - length]
+                if start and _is_word_char(low[start - 1]):
+                    continue
+                if skip_ambiguous and is_ambiguous(spelling):
+                    continue
+                found.append((start, i + 1, skill_id))
+
+        # leftmost-longest, non-overlapping
+        found.sort(key=lambda m: (m[0], -m[1]))
+        matches, end = [], 0
+        for m in found:
+            if m[0] >= end:
+                matches.append(m)
+                end = m[1]
+        return matches
+
+
+# ---------- PROCESS-WIDE AUTOMATON ----------
+_automaton = None
+_built_for = None
+_lock = threading.Lock()
+
+
+def get_automaton():
+    """
+    Automaton for the curated vocabulary, built once per loaded dictionary.
+    Learned skills do not rebuild it; a dictionary reload (another process
+    may have migrated) does.
+    """
+    global _automaton, _built_for
+    dictionary = get_dictionary()
+    if _built_for is not dictionary:
+        with _lock:
+            if _built_for is not dictionary:
+                conn = get_connection()
+                try:
+                    _automaton = SkillAutomaton(curated_spellings(conn))
+                finally:
+                    conn.close()
+                _built_for = dictionary
+    return _automaton
@@ -0,0 +1,127 @@
+# jobmatch/skill_bits.py
+"""
+Skill sets as bitsets over the canonical skill vocabulary.
+
+Each skill that can take part in a match has a dense bit position,
+skills.bit: curated skills first, then any other skill the first time a job
+asks for it. Bitsets are plain Python ints, so one candidate against one job is
+
+    matched = (candidate & job).bit_count()
+    missing = job & ~candidate
+
+with no sets or lists built. Skill ids are not used as positions: every
+unknown string a resume contains gets an id (SkillDictionary.ensure), and
+those would keep widening every bitset. A candidate skill no job asks for
+has no bit and is left out, which changes no score; when a job first asks
+for it, it gets a bit and the bitsets of candidates holding it are rewritten.
+
+Bitsets are stored as little-endian blobs in job_posts.skill_bits (written
+by store_data.save_job_skills) and users.skill_bits (written by
+resume_parser.save_skills), so reruns and cache reloads read them instead of
+rebuilding them from job_skills / user_skills.
+"""
+from jobmatch.skill_dictionary import get_dictionary
+
+
+def to_bits(ids):
+    bits = 0
+    for i in ids:
+        if i is not None:
+            bits |= 1 << i
+    return bits
+
+
+def from_bits(bits):
+    """Set bit positions (skill ids), lowest first."""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+def to_blob(bits):
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def from_blob(blob):
+    return int.from_bytes(blob, "little") if blob else 0
+
+
+def skill_ids_from_bits(bits):
+    """Skill ids of a bitset's set positions, lowest position first."""
+    d = get_dictionary()
+    positions = from_bits(bits)
+    if any(p not in d.bit_ids for p in positions):
+        # assigned by another process since we loaded
+        d = get_dictionary(reload=True)
+    return [d.bit_ids[p] for p in positions if p in d.bit_ids]
+
+
+# ---------- STORAGE ----------
+def _positions(cur, ids):
+    """{skill id: bit} for the ids that have a bit."""
+    ids = [i for i in ids if i is not None]
+    if not ids:
+        return {}
+    return dict(cur.execute(
+        f"SELECT id, bit FROM skills WHERE bit IS NOT NULL AND id IN ({','.join('?' * len(ids))})", ids
+    ).fetchall())
+
+
+def _rebuild_user_bits(cur, where="", params=()):
+    bits = {}
+    for user_id, bit in cur.execute(f"""
+        SELECT us.user_id, s.bit FROM user_skills us JOIN skills s ON s.id = us.skill_id
+        WHERE s.bit IS NOT NULL {where}
+    """, params).fetchall():
+        bits[user_id] = bits.get(user_id, 0) | 1 << bit
+    cur.executemany("UPDATE users SET skill_bits=? WHERE id=?", [(to_blob(b), k) for k, b in bits.items()])
+
+
+def assign_bits(cur, ids):
+    """
+    Give each skill in ids a bit position if it has none yet, and add the new
+    bits to the bitsets of candidates who already have those skills. Runs in
+    the caller's write transaction, which serialises position numbering.
+    """
+    have = _positions(cur, ids)
+    new = [i for i in dict.fromkeys(ids) if i is not None and i not in have]
+    if not new:
+        return
+    next_bit = cur.execute("SELECT COALESCE(MAX(bit) + 1, 0) FROM skills").fetchone()[0]
+    cur.executemany("UPDATE skills SET bit=? WHERE id=?", [(next_bit + n, i) for n, i in enumerate(new)])
+    marks = ",".join("?" * len(new))
+    _rebuild_user_bits(
+        cur, f"AND us.user_id IN (SELECT user_id FROM user_skills WHERE skill_id IN ({marks}))", new
+    )
+
+
+def save_job_bits(conn, job_id, ids):
+    assign_bits(conn, ids)
+    bits = to_bits(_positions(conn, ids).values())
+    conn.execute("UPDATE job_posts SET skill_bits=? WHERE id=?", (to_blob(bits), job_id))
+
+
+def save_user_bits(conn, user_id, ids):
+    bits = to_bits(_positions(conn, ids).values())
+    conn.execute("UPDATE users SET skill_bits=? WHERE id=?", (to_blob(bits), user_id))
+
+
+def backfill(cur):
+    """Recompute every stored bitset from job_skills / user_skills."""
+    new = [r[0] for r in cur.execute(
+        "SELECT id FROM skills WHERE bit IS NULL AND id IN (SELECT skill_id FROM job_skills) ORDER BY id"
+    ).fetchall()]
+    next_bit = cur.execute("SELECT COALESCE(MAX(bit) + 1, 0) FROM skills").fetchone()[0]
+    cur.executemany("UPDATE skills SET bit=? WHERE id=?", [(next_bit + n, i) for n, i in enumerate(new)])
+    bits = {}
+    for job_id, bit in cur.execute(
+        "SELECT js.job_id, s.bit FROM job_skills js JOIN skills s ON s.id = js.skill_id"
+    ).fetchall():
+        bits[job_id] = bits.get(job_id, 0) | 1 << bit
+    cur.execute("UPDATE job_posts SET skill_bits=NULL")
+    cur.executemany("UPDATE job_posts SET skill_bits=? WHERE id=?", [(to_blob(b), k) for k, b in bits.items()])
+    cur.execute("UPDATE users SET skill_bits=NULL")
+    _rebuild_user_bits(cur)
@@ -0,0 +1,154 @@
+# jobmatch/skill_dictionary.py
+"""
+Canonical skills: one integer id per skill, many spellings per id.
+
+The skills / skill_aliases tables (migration 003) are compiled once per
+process into a single dict from every normalised spelling to its id, so
+"ReactJS", "react.js" and "React" all resolve with one lookup. user_skills
+and job_skills store skill_id, which turns matching into integer set
+intersection.
+
+Skills that are not in the dictionary yet are added on write (a new row in
+skills) so nothing a candidate or HR typed is lost. Those learned rows can be
+anything ("the", "good team player"), so only the hand-written vocabulary
+(curated=1, seeded by db migrations; new skills need a new migration) is
+searched for in free text; see curated_spellings.
+
+The curated list is kept to about 420 skills (some 620 spellings) on
+purpose, not the thousands a scraped taxonomy would give: every curated
+spelling is looked for in every resume, so each one has to be a skill that
+is unmistakable in running text or listed in skill_automaton.AMBIGUOUS.
+Anything else still gets an id the first time someone types it.
+"""
+import re
+import threading
+
+from db import get_connection
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_skill(text):
+    """'  React.JS ' -> 'react.js' (case, outer punctuation and spacing only)."""
+    if not text:
+        return ""
+    return _SPACES.sub(" ", text.strip(" \t\r\n-•,;:|").lower()).strip()
+
+
+def format_ids(ids):
+    return ",".join(str(i) for i in ids)
+
+
+def parse_ids(text):
+    """'3,17,42' -> [3, 17, 42]"""
+    if not text:
+        return []
+    return [int(x) for x in text.split(",") if x]
+
+
+class SkillDictionary:
+    """Every known spelling -> skill id, plus id -> canonical name and bit position -> id."""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = {}
+        self.bit_ids = {}
+        self._lock = threading.Lock()
+
+    def load(self, cur):
+        for skill_id, name, bit in cur.execute("SELECT id, name, bit FROM skills").fetchall():
+            self.names[skill_id] = name
+            self.ids[normalize_skill(name)] = skill_id
+            if bit is not None:
+                self.bit_ids[bit] = skill_id
+        for alias, skill_id in cur.execute("SELECT alias, skill_id FROM skill_aliases").fetchall():
+            self.ids[normalize_skill(alias)] = skill_id
+        return self
+
+    def lookup(self, text):
+        return self.ids.get(normalize_skill(text))
+
+    def ensure(self, cur, text):
+        """Id for text, adding it as a new canonical skill when unknown."""
+        key = normalize_skill(text)
+        if not key:
+            return None
+        skill_id = self.ids.get(key)
+        if skill_id is None:
+            cur.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (key,))
+            skill_id = cur.execute("SELECT id FROM skills WHERE name=?", (key,)).fetchone()[0]
+            with self._lock:
+                self.ids[key] = skill_id
+                self.names[skill_id] = key
+        return skill_id
+
+
+def curated_spellings(cur):
+    """Normalised spelling -> id for curated skills and aliases only (no learned rows)."""
+    rows = cur.execute("""
+        SELECT name, id FROM skills WHERE curated=1
+        UNION ALL
+        SELECT alias, skill_id FROM skill_aliases WHERE curated=1
+    """).fetchall()
+    return {normalize_skill(spelling): skill_id for spelling, skill_id in rows}
+
+
+# ---------- PROCESS-WIDE DICTIONARY ----------
+_dictionary = None
+_load_lock = threading.Lock()
+
+
+def get_dictionary(reload=False):
+    global _dictionary
+    if _dictionary is None or reload:
+        with _load_lock:
+            if _dictionary is None or reload:
+                conn = get_connection()
+                try:
+                    _dictionary = SkillDictionary().load(conn)
+                finally:
+                    conn.close()
+    return _dictionary
+
+
+def skill_ids(texts, create=False):
+    """
+    Distinct ids for texts, in order. Unknown skills are dropped, or added to
+    the dictionary (committed right away) when create=True.
+    """
+    texts = list(texts or [])
+    d = get_dictionary()
+    out = []
+    unknown = []
+    for t in texts:
+        skill_id = d.lookup(t)
+        if skill_id is None:
+            unknown.append(t)
+        out.append(skill_id)
+
+    if unknown and create:
+        conn = get_connection()
+        try:
+            cur = conn.cursor()
+            new = {normalize_skill(t): d.ensure(cur, t) for t in unknown}
+            conn.commit()
+        finally:
+            conn.close()
+        out = [i if i is not None else new.get(normalize_skill(t)) for i, t in zip(out, texts)]
+
+    return list(dict.fromkeys(i for i in out if i is not None))
+
+
+def skill_names(ids):
+    names = get_dictionary().names
+    if any(i not in names for i in ids):
+        # added by another process since we loaded
+        names = get_dictionary(reload=True).names
+    return [names.get(i, str(i)) for i in ids]
+
+
+def canonical(text):
+    """Canonical name for text, or its normalised form when unknown."""
+    d = get_dictionary()
+    skill_id = d.lookup(text)
+    return d.names[skill_id] if skill_id is not None else normalize_skill(text)
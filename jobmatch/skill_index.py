@@ -0,0 +1,138 @@
+# jobmatch/skill_index.py
+"""
+In-memory inverted index over open job skills for top-K recommendations.
+
+    skill_id -> {job_id, ...}       (posting lists)
+    job_id -> (skill_id, ...)       (distinct skills, gives the per-job count)
+
+A top-K query only walks the posting lists of the candidate's own skills, so
+jobs sharing no skill with the candidate are never looked at. The index is
+built from the open jobs on first use and then patched one job at a time from
+the JOB_CHANGED events sent by hr/post_job.py and hr/view_jobs.py.
+"""
+import heapq
+import threading
+from collections import defaultdict
+
+from db import get_connection
+from jobmatch.store_data import get_candidate_skill_ids, get_open_jobs, get_job_skill_ids
+from utils.events import subscribe, JOB_CHANGED
+
+
+class SkillIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.postings = defaultdict(set)
+        self.job_skills = {}
+
+    def __len__(self):
+        return len(self.job_skills)
+
+    def clear(self):
+        with self._lock:
+            self.postings.clear()
+            self.job_skills.clear()
+
+    def add(self, job_id, skills):
+        """Insert or replace one job."""
+        skills = tuple(dict.fromkeys(s for s in skills if s is not None))
+        with self._lock:
+            self.remove(job_id)
+            if not skills:
+                return
+            self.job_skills[job_id] = skills
+            for s in skills:
+                self.postings[s].add(job_id)
+
+    def remove(self, job_id):
+        with self._lock:
+            for s in self.job_skills.pop(job_id, ()):
+                ids = self.postings.get(s)
+                if ids is None:
+                    continue
+                ids.discard(job_id)
+                if not ids:
+                    del self.postings[s]
+
+    def top_k(self, candidate_skills, k=10):
+        """
+        [(job_id, score, matched), ...] best first, over jobs sharing at least
+        one skill with the candidate. score is the usual match percentage;
+        ties go to more matched skills, then the newer (higher id) job.
+        """
+        matched = defaultdict(int)
+        with self._lock:
+            for s in set(candidate_skills):
+                for job_id in self.postings.get(s, ()):
+                    matched[job_id] += 1
+            ranked = [
+                (round(n / len(self.job_skills[job_id]) * 100, 2), n, job_id)
+                for job_id, n in matched.items()
+            ]
+        best = heapq.nlargest(k, ranked)
+        return [(job_id, score, n) for score, n, job_id in best]
+
+
+# ---------- SHARED INDEX (built lazily, patched on JOB_CHANGED) ----------
+_index = SkillIndex()
+_built = False
+_build_lock = threading.Lock()
+
+
+def get_skill_index():
+    global _built
+    if not _built:
+        with _build_lock:
+            if not _built:
+                for job in get_open_jobs():
+                    _index.add(job["id"], job["skill_ids"])
+                _built = True
+    return _index
+
+
+def _on_job_changed(job_id=None, action=None, **_):
+    if not _built:
+        return
+    if job_id is None:
+        # unknown scope: rebuild on next use
+        _rebuild()
+        return
+    if action in ("closed", "deleted"):
+        _index.remove(job_id)
+        return
+
+    conn = get_connection()
+    row = conn.execute("SELECT status FROM job_posts WHERE id=?", (job_id,)).fetchone()
+    conn.close()
+    if row and row[0] == "open":
+        _index.add(job_id, get_job_skill_ids(job_id))
+    else:
+        _index.remove(job_id)
+
+
+def _rebuild():
+    global _built
+    with _build_lock:
+        _index.clear()
+        _built = False
+
+
+subscribe(JOB_CHANGED, _on_job_changed)
+
+
+# ---------- QUERIES ----------
+def top_jobs_for_skills(candidate_skills, k=10):
+    return get_skill_index().top_k(candidate_skills, k)
+
+
+def recommend_jobs(user_id, k=10):
+    """Top-K open job dicts for this candidate, each with "score" and "matched"."""
+    hits = top_jobs_for_skills(get_candidate_skill_ids(user_id), k)
+    if not hits:
+        return []
+    jobs = {job["id"]: job for job in get_open_jobs()}
+    return [
+        {**jobs[job_id], "score": score, "matched": n}
+        for job_id, score, n in hits
+        if job_id in jobs
+    ]
@@ -1,5 +1,24 @@
 # jobmatch/store_data.py
-from db import get_connection
+from contextlib import contextmanager
+from datetime import datetime
+
+from db import get_connection, connection, hot_query
+from jobmatch.skill_bits import from_blob, save_job_bits
+from jobmatch.skill_dictionary import get_dictionary
+from utils.cache import TTLCache
+from utils.events import emit, subscribe, JOB_CHANGED
+
+# shared by every session; invalidated by the HR write paths (JOB_CHANGED)
+open_jobs_cache = TTLCache("open_jobs", maxsize=1)
+company_cache = TTLCache("companies", ttl=600, maxsize=5000)
+
+
+def parse_skills(skills_text):
+    """'Python, SQL ,react' -> ['python', 'sql', 'react']"""
+    if not skills_text:
+        return []
+    return [s.strip().lower() for s in skills_text.split(",") if s.strip()]
+
 
 def get_candidate_skills(user_id):
     conn = get_connection()
@@ -10,15 +29,275 @@ def get_candidate_skills(user_id):
     conn.close()
     return [r[0].strip().lower() for r in rows]
 
+
+_USER_SKILL_IDS_SQL = hot_query(
+    "user_skill_ids",
+    "SELECT skill_id FROM user_skills WHERE user_id=? AND skill_id IS NOT NULL",
+    (1,),
+)
+
+
+def get_candidate_skill_ids(user_id):
+    """Canonical skill ids of the candidate (see jobmatch.skill_dictionary)."""
+    conn = get_connection()
+    rows = conn.execute(_USER_SKILL_IDS_SQL, (user_id,)).fetchall()
+    conn.close()
+    return [r[0] for r in rows]
+
+
+_USER_SKILL_BITS_SQL = hot_query("user_skill_bits", "SELECT skill_bits FROM users WHERE id=?", (1,))
+
+
+def get_candidate_skill_bits(user_id):
+    """The candidate's skills as a bitset (see jobmatch.skill_bits)."""
+    conn = get_connection()
+    row = conn.execute(_USER_SKILL_BITS_SQL, (user_id,)).fetchone()
+    conn.close()
+    return from_blob(row[0]) if row else 0
+
+
+# ---------- JOB SKILLS (parsed once, when HR saves the job) ----------
+def save_job_skills(conn, job_id, skills_text):
+    """
+    Replace job_skills rows for job_id from the free-text skills field.
+    Runs inside the caller's transaction (post / update job): new skills are
+    added to the dictionary on the same connection, since a second one would
+    wait on the write lock this transaction already holds.
+    """
+    dictionary = get_dictionary()
+    rows, seen = [], set()
+    for skill in parse_skills(skills_text):
+        skill_id = dictionary.ensure(conn, skill)
+        if skill_id is not None and skill_id not in seen:
+            seen.add(skill_id)
+            rows.append((job_id, skill_id, skill, len(rows)))
+    conn.execute("DELETE FROM job_skills WHERE job_id=?", (job_id,))
+    conn.executemany(
+        "INSERT INTO job_skills (job_id, skill_id, skill, position) VALUES (?, ?, ?, ?)", rows
+    )
+    save_job_bits(conn, job_id, seen)
+
+
+@contextmanager
+def _job_transaction():
+    """connection() that also drops dictionary entries added by a rolled-back write."""
+    try:
+        with connection() as conn:
+            yield conn
+    except Exception:
+        get_dictionary(reload=True)
+        raise
+
+
+def create_job(company_id, hr_id, role, location, skills, experience=None, salary=None, description=None):
+    """Insert an open job and its job_skills rows in one transaction; returns the job id."""
+    with _job_transaction() as conn:
+        job_id = conn.execute("""
+            INSERT INTO job_posts (
+                company_id, hr_id, role, location, skills, experience, salary, description, status, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'open', ?)
+        """, (
+            company_id, hr_id, role, location, skills, experience, salary, description,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )).lastrowid
+        save_job_skills(conn, job_id, skills)
+    emit(JOB_CHANGED, job_id=job_id, action="created")
+    return job_id
+
+
+def update_job(job_id, role, skills, salary, experience):
+    with _job_transaction() as conn:
+        conn.execute("""
+            UPDATE job_posts
+            SET role=?, skills=?, salary=?, experience=?
+            WHERE id=?
+        """, (role, skills, salary, experience, job_id))
+        save_job_skills(conn, job_id, skills)
+    emit(JOB_CHANGED, job_id=job_id, action="updated")
+
+
 def get_job_skills(job_id):
     conn = get_connection()
-    row = conn.execute(
-        "SELECT skills FROM job_posts WHERE id=?",
+    rows = conn.execute(
+        "SELECT skill FROM job_skills WHERE job_id=? ORDER BY position",
         (job_id,)
-    ).fetchone()
+    ).fetchall()
     conn.close()
+    return [r[0] for r in rows]
+
+
+_JOB_SKILL_IDS_SQL = hot_query(
+    "job_skill_ids",
+    "SELECT skill_id FROM job_skills WHERE job_id=? ORDER BY position",
+    (1,),
+)
+
+
+def get_job_skill_ids(job_id):
+    conn = get_connection()
+    rows = conn.execute(_JOB_SKILL_IDS_SQL, (job_id,)).fetchall()
+    conn.close()
+    return [r[0] for r in rows]
+
+
+_OPEN_JOB_SKILLS_SQL = hot_query("open_job_skills", """
+    SELECT js.job_id, js.skill, js.skill_id
+    FROM job_skills js
+    JOIN job_posts jp ON jp.id = js.job_id
+    WHERE jp.status = 'open'
+    ORDER BY js.job_id, js.position
+""")
+
+
+def _load_open_job_skills(conn):
+    """{job_id: ([skill, ...], [skill_id, ...])} for every open job, in one query."""
+    out = {}
+    for job_id, skill, skill_id in conn.execute(_OPEN_JOB_SKILLS_SQL):
+        names, ids = out.setdefault(job_id, ([], []))
+        names.append(skill)
+        ids.append(skill_id)
+    return out
+
+
+_OPEN_JOBS_SQL = hot_query("open_jobs", """
+    SELECT
+        jp.id,
+        jp.role,
+        jp.location,
+        jp.experience,
+        jp.skills,
+        jp.salary,
+        jp.description,
+        jp.status,
+        jp.company_id,
+        c.name,
+        jp.skill_bits
+    FROM job_posts jp
+    JOIN companies c ON jp.company_id = c.id
+    WHERE jp.status = 'open'
+    ORDER BY jp.created_at DESC
+""")
+
+
+def load_open_jobs():
+    """Open jobs straight from the database, bypassing open_jobs_cache.
+
+    For batch jobs and benchmarks that need a fresh read; pages use get_open_jobs().
+    """
+    conn = get_connection()
+    rows = conn.execute(_OPEN_JOBS_SQL).fetchall()
+    skills = _load_open_job_skills(conn)
+    conn.close()
+
+    return [
+        {
+            "id": r[0],
+            "role": r[1],
+            "location": r[2],
+            "experience": r[3],
+            "skills": r[4],
+            "salary": r[5],
+            "description": r[6],
+            "status": r[7],
+            "company_id": r[8],
+            "company": r[9],
+            "skill_list": skills.get(r[0], ([], []))[0],
+            "skill_ids": skills.get(r[0], ([], []))[1],
+            "skill_bits": from_blob(r[10]),
+        }
+        for r in rows
+    ]
+
+
+def get_open_jobs():
+    """Open jobs (newest first) with company name and parsed skills. Read-only, shared."""
+    return open_jobs_cache.get_or_load("all", load_open_jobs)
+
+
+_APPLIED_JOB_IDS_SQL = hot_query(
+    "applied_job_ids",
+    "SELECT job_id FROM job_applications WHERE candidate_id=?",
+    (1,),
+)
+
+
+def get_applied_job_ids(user_id):
+    conn = get_connection()
+    rows = conn.execute(_APPLIED_JOB_IDS_SQL, (user_id,)).fetchall()
+    conn.close()
+    return {r[0] for r in rows}
+
+
+def get_open_jobs_for_candidate(user_id):
+    """
+    Everything the browse page needs: the shared open-jobs listing (with
+    parsed skills) plus whether this candidate already applied, instead of
+    one match query + one applied check per job card.
+    """
+    applied = get_applied_job_ids(user_id)
+    return [{**job, "applied": job["id"] in applied} for job in get_open_jobs()]
+
+
+_APPLIED_JOBS_SQL = hot_query("applied_jobs", """
+    SELECT
+        ja.id,
+        jp.role,
+        c.name,
+        jp.experience,
+        jp.skills,
+        jp.salary,
+        ja.applied_at
+    FROM job_applications ja
+    JOIN job_posts jp ON ja.job_id = jp.id
+    JOIN companies c ON jp.company_id = c.id
+    WHERE ja.candidate_id = ?
+    ORDER BY ja.applied_at DESC
+""", (1,))
+
+
+def get_applied_jobs(user_id):
+    """Rows for the candidate's Applied Jobs page, newest application first."""
+    conn = get_connection()
+    rows = conn.execute(_APPLIED_JOBS_SQL, (user_id,)).fetchall()
+    conn.close()
+    return rows
+
+
+_COMPANY_APPLICANTS_SQL = hot_query("company_applicants", """
+    SELECT ja.id as app_id, ja.candidate_id, u.name, u.email, u.resume_path, jp.role
+    FROM job_applications ja
+    JOIN users u ON ja.candidate_id = u.id
+    JOIN job_posts jp ON ja.job_id = jp.id
+    WHERE jp.company_id=?
+    ORDER BY ja.applied_at DESC
+""", (1,))
+
+
+def get_company_applicants(company_id):
+    """Everyone who applied to any of this company's jobs, newest first."""
+    conn = get_connection()
+    conn.row_factory = lambda cursor, row: {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+    rows = conn.execute(_COMPANY_APPLICANTS_SQL, (company_id,)).fetchall()
+    conn.close()
+    return rows
+
+
+def get_company(company_id):
+    def load():
+        conn = get_connection()
+        row = conn.execute("""
+            SELECT name, address, city, state, country, website, status
+            FROM companies WHERE id=?
+        """, (company_id,)).fetchone()
+        conn.close()
+        return row
+
+    return company_cache.get_or_load(company_id, load)
+
+
+def _on_job_changed(**_):
+    open_jobs_cache.invalidate()
 
-    if not row or not row[0]:
-        return []
 
-    return [s.strip().lower() for s in row[0].split(",")]
+subscribe(JOB_CHANGED, _on_job_changed)
@@ -0,0 +1,297 @@
+# jobmatch/tfidf_match.py
+"""
+TF-IDF / cosine similarity match mode.
+
+Instead of counting shared skills, each open job becomes a document (role +
+skills + description) and the candidate's resume text is scored against all
+of them with one sparse matrix-vector product.
+
+The fitted vectorizer and job matrix are saved to MODEL_DIR and loaded on
+start. JOB_CHANGED patches single rows with the existing vocabulary instead
+of refitting; a full refit only happens when the saved model does not match
+the database (jobs posted, edited or closed while the app was down) or after
+REFIT_AFTER incremental changes, since the IDF weights drift as jobs come
+and go. Patched models are written back at most once per SAVE_DELAY seconds,
+from a timer thread, so a burst of edits costs one dump and scoring never
+waits on the disk.
+"""
+import hashlib
+import os
+import threading
+import time
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from db import get_connection
+from utils.cache import TTLCache
+from utils.events import subscribe, JOB_CHANGED
+
+MODEL_DIR = os.environ.get(
+    "TRUSTHIRE_MODEL_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models"),
+)
+MODEL_PATH = os.path.join(MODEL_DIR, "tfidf_jobs.joblib")
+
+# incremental row updates before the next full refit
+REFIT_AFTER = int(os.environ.get("TRUSTHIRE_TFIDF_REFIT_AFTER", "200"))
+# seconds between a JOB_CHANGED patch and writing the model to disk
+SAVE_DELAY = float(os.environ.get("TRUSTHIRE_TFIDF_SAVE_DELAY", "5"))
+
+resume_text_cache = TTLCache("resume_text", ttl=3600, maxsize=500)
+
+
+def job_document(role, skills, description):
+    # skills twice: they matter more than description boilerplate
+    return " ".join(filter(None, [role, skills, skills, description]))
+
+
+def _make_vectorizer():
+    return TfidfVectorizer(
+        lowercase=True,
+        stop_words="english",
+        ngram_range=(1, 2),
+        min_df=1,
+        sublinear_tf=True,
+        token_pattern=r"(?u)\b[\w][\w\+\#\.]*[\w\+\#]|\b\w\b",
+        dtype=np.float32,
+    )
+
+
+def _document_hash(job_id, document):
+    digest = hashlib.blake2b(f"{job_id}\x1f{document}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _combine(hashes):
+    """Order-independent summary of {job_id: document hash}."""
+    return (len(hashes), sum(hashes.values()) % (1 << 64))
+
+
+def _load_open_documents(conn):
+    rows = conn.execute("""
+        SELECT id, role, skills, description FROM job_posts
+        WHERE status='open' ORDER BY id
+    """).fetchall()
+    return [(r[0], job_document(*r[1:])) for r in rows]
+
+
+def _fingerprint(conn):
+    """Summary of the open jobs' text; a mismatch means the saved model is stale."""
+    return _combine({job_id: _document_hash(job_id, doc) for job_id, doc in _load_open_documents(conn)})
+
+
+class TfidfJobModel:
+    def __init__(self):
+        self.vectorizer = None
+        self.matrix = None           # jobs x terms, L2-normalised rows
+        self.job_ids = []
+        self.row_of = {}
+        self.doc_hashes = {}         # job_id -> _document_hash, gives the fingerprint
+        self.pending_updates = 0
+        self.fitted_at = None
+
+    @property
+    def fingerprint(self):
+        return _combine(self.doc_hashes)
+
+    # ---------- BUILD / PERSIST ----------
+    def fit(self):
+        conn = get_connection()
+        rows = _load_open_documents(conn)
+        conn.close()
+
+        vectorizer = _make_vectorizer()
+        docs = [doc for _, doc in rows]
+        if docs:
+            try:
+                matrix = vectorizer.fit_transform(docs).tocsr()
+            except ValueError:
+                # only stop words: nothing to match on
+                vectorizer, matrix = None, None
+        else:
+            vectorizer, matrix = None, None
+
+        self.vectorizer = vectorizer
+        self.matrix = matrix
+        self.job_ids = [r[0] for r in rows]
+        self.row_of = {job_id: i for i, job_id in enumerate(self.job_ids)}
+        self.doc_hashes = {job_id: _document_hash(job_id, doc) for job_id, doc in rows}
+        self.pending_updates = 0
+        self.fitted_at = time.time()
+        return self
+
+    def state(self):
+        """Picklable snapshot; the matrix is replaced, never changed in place, so it is shared."""
+        return {
+            "vectorizer": self.vectorizer,
+            "matrix": self.matrix,
+            "job_ids": list(self.job_ids),
+            "doc_hashes": dict(self.doc_hashes),
+            "pending_updates": self.pending_updates,
+            "fitted_at": self.fitted_at,
+        }
+
+    def save(self, path=None):
+        _dump(self.state(), path or MODEL_PATH)
+
+    @classmethod
+    def load(cls, path=None):
+        data = joblib.load(path or MODEL_PATH)
+        m = cls()
+        m.vectorizer = data["vectorizer"]
+        m.matrix = data["matrix"]
+        m.job_ids = list(data["job_ids"])
+        m.row_of = {job_id: i for i, job_id in enumerate(m.job_ids)}
+        # models saved before doc_hashes existed never match and get refit
+        m.doc_hashes = dict(data.get("doc_hashes", {}))
+        m.pending_updates = data["pending_updates"]
+        m.fitted_at = data["fitted_at"]
+        return m
+
+    # ---------- INCREMENTAL ----------
+    def upsert(self, job_id, document):
+        """Add or replace one job row using the fitted vocabulary."""
+        row = self.vectorizer.transform([document]).tocsr()
+        if job_id in self.row_of:
+            i = self.row_of[job_id]
+            self.matrix = sparse.vstack([self.matrix[:i], row, self.matrix[i + 1:]]).tocsr()
+        else:
+            self.matrix = sparse.vstack([self.matrix, row]).tocsr()
+            self.row_of[job_id] = len(self.job_ids)
+            self.job_ids.append(job_id)
+        self.doc_hashes[job_id] = _document_hash(job_id, document)
+        self.pending_updates += 1
+
+    def remove(self, job_id):
+        i = self.row_of.pop(job_id, None)
+        if i is None:
+            return
+        keep = np.ones(len(self.job_ids), dtype=bool)
+        keep[i] = False
+        self.matrix = self.matrix[keep]
+        self.job_ids.pop(i)
+        self.row_of = {jid: n for n, jid in enumerate(self.job_ids)}
+        self.doc_hashes.pop(job_id, None)
+        self.pending_updates += 1
+
+    # ---------- SCORING ----------
+    def score_text(self, text):
+        """{"job_ids", "scores"}: cosine similarity x 100 against every job."""
+        if self.vectorizer is None or not text:
+            return {"job_ids": np.asarray(self.job_ids), "scores": np.zeros(len(self.job_ids))}
+        q = self.vectorizer.transform([text])
+        scores = (self.matrix @ q.T).toarray().ravel().astype(np.float64) * 100
+        return {"job_ids": np.asarray(self.job_ids), "scores": np.round(scores, 2)}
+
+
+def _dump(state, path):
+    with _save_lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        joblib.dump(state, tmp)
+        os.replace(tmp, path)
+
+
+# ---------- SHARED MODEL ----------
+_model = None
+_lock = threading.Lock()
+_save_lock = threading.Lock()
+_save_timer = None
+
+
+def get_model():
+    """The persisted model, refit if missing or out of date with the database."""
+    global _model
+    with _lock:
+        if _model is not None:
+            return _model
+        conn = get_connection()
+        fingerprint = _fingerprint(conn)
+        conn.close()
+
+        model = None
+        if os.path.exists(MODEL_PATH):
+            try:
+                model = TfidfJobModel.load(MODEL_PATH)
+            except Exception as e:
+                print(f"⚠️ Could not load TF-IDF model ({e}); refitting")
+        if model is None or model.fingerprint != fingerprint or model.pending_updates >= REFIT_AFTER:
+            model = TfidfJobModel().fit()
+            model.save()
+        _model = model
+        return _model
+
+
+def _on_job_changed(job_id=None, action=None, **_):
+    global _model
+    with _lock:
+        model = _model
+        if model is None:
+            return          # nothing loaded yet; get_model() will check the fingerprint
+        if job_id is None or model.vectorizer is None or model.pending_updates >= REFIT_AFTER:
+            _model = None   # refit on next use
+            return
+
+        conn = get_connection()
+        row = conn.execute(
+            "SELECT role, skills, description, status FROM job_posts WHERE id=?", (job_id,)
+        ).fetchone()
+        if row and row[3] == "open":
+            model.upsert(job_id, job_document(*row[:3]))
+        else:
+            model.remove(job_id)
+        conn.close()
+        _schedule_save()
+
+
+def _schedule_save():
+    """Called with _lock held: write the model once SAVE_DELAY seconds from now."""
+    global _save_timer
+    if _save_timer is None:
+        _save_timer = threading.Timer(SAVE_DELAY, save_model)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def save_model():
+    """Write the shared model to MODEL_PATH; the dump runs without holding _lock."""
+    global _save_timer
+    with _lock:
+        _save_timer = None
+        state = _model.state() if _model is not None else None
+    if state is not None:
+        _dump(state, MODEL_PATH)
+
+
+subscribe(JOB_CHANGED, _on_job_changed)
+
+
+# ---------- CANDIDATES ----------
+def candidate_text(user_id):
+    """Resume text of the candidate (cached per file version), else their skills."""
+    conn = get_connection()
+    row = conn.execute("SELECT resume_path FROM users WHERE id=?", (user_id,)).fetchone()
+    skills = conn.execute("SELECT skill FROM user_skills WHERE user_id=?", (user_id,)).fetchall()
+    conn.close()
+
+    resume_path = row[0] if row else None
+    if resume_path and os.path.exists(resume_path):
+        from candidate.resume_parser import extract_text
+        key = (resume_path, os.path.getmtime(resume_path))
+        text = resume_text_cache.get_or_load(key, lambda: extract_text(resume_path))
+        if text:
+            return text
+    return ", ".join(s[0] for s in skills)
+
+
+def score_text_against_jobs(text):
+    return get_model().score_text(text)
+
+
+def score_user_against_jobs(user_id):
+    """{job_id: similarity 0-100} for every open job."""
+    result = score_text_against_jobs(candidate_text(user_id))
+    return dict(zip(result["job_ids"].tolist(), result["scores"].tolist()))
@@ -1,6 +1,6 @@
 import streamlit as st
 import base64
-from db import create_tables, get_connection   # ✅ added get_connection
+from db import migrate, get_connection   # ✅ added get_connection
 from auth.signup import signup_page
 from auth.login import login_page
 from auth.admin_login import admin_login_page
@@ -14,6 +14,7 @@ from auth.resend_verification import resend_verification_page
 
 import pages.about as about_page
 import pages.contact as contact_page
+from utils import query_log
 
 # ---------- STREAMLIT CONFIG ----------
 st.set_page_config(page_title="TrustHire", page_icon="💼", layout="wide")
@@ -25,9 +26,12 @@ if "user" not in st.session_state:
     st.session_state.user = None
 if "admin" not in st.session_state:
     st.session_state.admin = None
-if "db_initialized" not in st.session_state:
-    create_tables()
-    st.session_state.db_initialized = True
+
+# ---------- DATABASE (schema migrations run once per process) ----------
+migrate()
+
+# ---------- SQL TRACING (no-op unless TRUSTHIRE_SQL_TRACE=1) ----------
+query_log.begin_rerun(st.session_state.page)
 
 def load_css():
     with open("assets/style.css") as f:
@@ -194,4 +198,6 @@ elif st.session_state.user:
         if user["role"] == "candidate":
             candidate_dashboard(user)
         elif user["role"] == "hr":
-            hr_dashboard(user)  
\ No newline at end of file
+            hr_dashboard(user)
+
+query_log.end_rerun()
@@ -0,0 +1,53 @@
+# test_applicant_ranking.py
+# jobmatch.applicant_ranking: cached per-job ranking follows the write paths.
+# Run: python -m pytest -q test_applicant_ranking.py
+import db
+from candidate.resume_parser import save_skills
+from jobmatch.applicant_ranking import get_ranked_applicants
+from utils.events import emit, APPLICATION_CREATED
+
+
+def _apply(job_id, candidate_id):
+    with db.connection() as conn:
+        conn.execute(
+            "INSERT INTO job_applications (job_id, candidate_id, applied_at) VALUES (?, ?, datetime('now'))",
+            (job_id, candidate_id),
+        )
+    emit(APPLICATION_CREATED, job_id=job_id, candidate_id=candidate_id)
+
+
+def _scores(job_id):
+    return {r["candidate_id"]: r["score"] for r in get_ranked_applicants(job_id)}
+
+
+def test_best_match_first(make_job, make_candidate):
+    job_id = make_job("Python, SQL, Docker, AWS")
+    weak, strong = make_candidate("Weak"), make_candidate("Strong")
+    save_skills(weak, ["Python"])
+    save_skills(strong, ["Python", "SQL", "Docker"])
+    _apply(job_id, weak)
+    _apply(job_id, strong)
+    ranked = get_ranked_applicants(job_id)
+    assert [r["candidate_id"] for r in ranked] == [strong, weak]
+    assert ranked[0]["score"] == 75.0 and ranked[0]["missing"] == ["aws"]
+
+
+def test_new_application_shows_up(make_job, make_candidate):
+    job_id = make_job("Python")
+    first = make_candidate("First")
+    _apply(job_id, first)
+    assert list(_scores(job_id)) == [first]
+    second = make_candidate("Second")
+    _apply(job_id, second)
+    assert set(_scores(job_id)) == {first, second}
+
+
+def test_skill_change_refreshes_cached_ranking(make_job, make_candidate):
+    job_id = make_job("Python, SQL")
+    uid = make_candidate()
+    save_skills(uid, ["Python"])
+    _apply(job_id, uid)
+    assert _scores(job_id) == {uid: 50.0}
+    # candidate re-uploads a resume with more skills
+    save_skills(uid, ["Python", "SQL"])
+    assert _scores(job_id) == {uid: 100.0}
@@ -0,0 +1,52 @@
+# test_batch_score.py
+# jobmatch.batch_score gives the same scores / missing skills as the
+# one-pair functions (compare_skills + calculate_match_score, find_missing_skills).
+# Run: python -m pytest -q test_batch_score.py
+import random
+
+import pytest
+
+from jobmatch.batch_score import SkillMatrix, score_candidate_against_jobs, score_candidates_against_job
+from jobmatch.compare_skills import compare_skills
+from jobmatch.match_score import calculate_match_score
+from jobmatch.missing_skills import find_missing_skills
+
+
+def _random_sets(rng, n, vocab=40, lo=0, hi=10):
+    return [rng.sample(range(vocab), rng.randint(lo, hi)) for _ in range(n)]
+
+
+def _reference(candidate, job):
+    return calculate_match_score(compare_skills(candidate, job), job), set(find_missing_skills(candidate, job))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_one_candidate_against_jobs_matches_reference(seed):
+    rng = random.Random(seed)
+    jobs = _random_sets(rng, 60)
+    matrix = SkillMatrix(list(range(len(jobs))), jobs)
+    for candidate in _random_sets(rng, 10, vocab=50):   # some skills no job has
+        result = score_candidate_against_jobs(candidate, matrix)
+        for job_id, score, missing in zip(result["job_ids"].tolist(), result["scores"].tolist(), result["missing"]):
+            expected_score, expected_missing = _reference(candidate, jobs[job_id])
+            assert score == pytest.approx(expected_score, abs=0.005)
+            assert set(missing) == expected_missing
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_candidates_against_one_job_matches_reference(seed):
+    rng = random.Random(seed)
+    job = rng.sample(range(40), rng.randint(1, 10))
+    candidates = dict(enumerate(_random_sets(rng, 30)))
+    result = score_candidates_against_job(job, candidates)
+    assert result["user_ids"].tolist() == list(candidates)
+    for uid, score, missing in zip(result["user_ids"].tolist(), result["scores"].tolist(), result["missing"]):
+        expected_score, expected_missing = _reference(candidates[uid], job)
+        assert score == pytest.approx(expected_score, abs=0.005)
+        assert set(missing) == expected_missing
+
+
+def test_job_without_skills_scores_zero():
+    matrix = SkillMatrix([1, 2], [[], [3]])
+    result = score_candidate_against_jobs([3], matrix)
+    assert result["scores"].tolist() == [0.0, 100.0]
@@ -0,0 +1,51 @@
+# test_cache.py
+# utils.cache.TTLCache: read-through, invalidation and TTL.
+# Run: python -m pytest -q test_cache.py
+from utils.cache import TTLCache
+
+
+def _counting_loader(values):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return values[len(calls) - 1]
+    return load, calls
+
+
+def test_second_read_is_a_hit():
+    cache = TTLCache("test_hit")
+    load, calls = _counting_loader(["a"])
+    assert cache.get_or_load("k", load) == "a"
+    assert cache.get_or_load("k", load) == "a"
+    assert len(calls) == 1
+    assert cache.info()["hits"] == 1 and cache.info()["misses"] == 1
+
+
+def test_invalidate_reloads():
+    cache = TTLCache("test_invalidate")
+    load, calls = _counting_loader(["old", "new"])
+    cache.get_or_load("k", load)
+    cache.invalidate("k")
+    assert cache.get_or_load("k", load) == "new"
+    assert len(calls) == 2
+
+
+def test_invalidate_during_load_is_not_lost():
+    cache = TTLCache("test_racing_load")
+
+    def stale_load():
+        # a JOB_CHANGED lands while this loader is still reading
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_load("k", stale_load) == "stale"
+    assert cache.get_or_load("k", lambda: "fresh") == "fresh"
+
+
+def test_expired_entry_is_reloaded():
+    cache = TTLCache("test_ttl", ttl=0)
+    load, calls = _counting_loader(["a", "b"])
+    cache.get_or_load("k", load)
+    assert cache.get_or_load("k", load) == "b"
+    assert len(calls) == 2
@@ -0,0 +1,100 @@
+# test_extract_fields.py
+# candidate.resume_parser.extract_fields: the anchored rule table gives the same
+# answers as searching each pattern over the whole text.
+# Run: python -m pytest -q test_extract_fields.py
+import re
+
+import pytest
+
+from candidate import resume_parser
+from candidate.resume_parser import (FIELD_RULES, extract_address, extract_email, extract_fields, extract_gender,
+                                     extract_links, extract_nationality, extract_phone)
+
+RESUME = """ASHA MENON
+Email: asha.menon@example.com   Mob: +91 98765-43210
+LinkedIn: https://www.linkedin.com/in/asha-menon
+GitHub: github.com/asha-m
+Gender: female
+Nationality: Indian
+Address: 12 MG Road,  Kochi    Pin 682001
+Skills
+Python, SQL
+"""
+
+PERSONAL_BLOCK = """Ravi K
+ravi@example.org
+PERSONAL DETAILS
+Address Eriyattuparambil (H)
+Locality Malappuram ,Kerala
+Gender Male
+Nationality India
+Education
+B.Tech
+"""
+
+
+def test_labeled_resume():
+    assert extract_fields(RESUME) == {
+        "email": "asha.menon@example.com",
+        "phone": "+919876543210",
+        "gender": "Male",            # "female" contains "male": long-standing behaviour of _gender_value
+        "nationality": "Indian",
+        "address": "12 MG Road,",  # a double space starts the next field on the line
+        "linkedin": "https://www.linkedin.com/in/asha-menon",
+        "github": "https://github.com/asha-m",
+    }
+
+
+def test_personal_details_block():
+    # labels without a colon still count as labels, so the block's first values win
+    fields = extract_fields(PERSONAL_BLOCK)
+    assert fields["gender"] == "Male"
+    assert fields["nationality"] == "India"
+    assert fields["address"] == "Eriyattuparambil (H)"
+    assert fields["phone"] is None and fields["linkedin"] is None and fields["github"] is None
+
+
+@pytest.mark.parametrize("text, phone", [
+    ("call 9876543210 today", "9876543210"),
+    ("+91-98765 43210", "+919876543210"),
+    ("ref 1234567890", None),            # mobiles start with 6-9
+    ("98765 4321", None),                # nine digits
+])
+def test_phone(text, phone):
+    assert extract_fields(text)["phone"] == phone
+
+
+def test_short_linkedin_and_first_address_label_wins():
+    fields = extract_fields("in/asha-menon\nLocation: Kochi\nAddress:\nsomewhere")
+    assert fields["linkedin"] == "https://www.linkedin.com/in/asha-menon"
+    # "Address" is the first label present; its value is the next line's text via \s*
+    assert fields["address"] == "somewhere"
+
+
+@pytest.mark.parametrize("text", [
+    RESUME,
+    PERSONAL_BLOCK,
+    "Gendered roles\nGENDER - Other\nnationality:indian",
+    "see LINKEDIN.COM/in/x and www.github.com/y/z",
+    "address-book\nAddress : 4 Main St",
+    # characters where lower() and (?i) disagree: the table falls back to re.search
+    "İstanbul Gender: Female ſkill Address: Izmir",
+])
+def test_rules_agree_with_plain_search(text):
+    for name, rule, anchor, back in resume_parser._RULES:
+        lowered = text.lower()
+        low = lowered if len(lowered) == len(text) and not any(c in text for c in resume_parser._FIND_UNSAFE) else None
+        fast = resume_parser._first_rule_match(rule, text, low, anchor, back)
+        slow = re.search(FIELD_RULES[name][0], text)
+        assert (fast and fast.span()) == (slow and slow.span()), name
+
+
+def test_single_field_wrappers():
+    assert extract_email(RESUME) == "asha.menon@example.com"
+    assert extract_phone(RESUME) == "+919876543210"
+    assert extract_gender(PERSONAL_BLOCK) == "Male"
+    assert extract_nationality(RESUME) == "Indian"
+    assert extract_address(PERSONAL_BLOCK) == "Eriyattuparambil (H)"
+    assert extract_links(RESUME) == ("https://www.linkedin.com/in/asha-menon", "https://github.com/asha-m")
+    assert extract_fields("") == dict.fromkeys(
+        ["email", "phone", "gender", "nationality", "address", "linkedin", "github"])
@@ -0,0 +1,38 @@
+# test_job_skills.py
+# Posting / editing a job writes its job_skills rows in the same transaction.
+# Run: python -m pytest -q test_job_skills.py
+import pytest
+
+from db import get_connection
+from jobmatch.skill_dictionary import get_dictionary
+from jobmatch.store_data import get_job_skills, update_job
+
+
+def _skill_row(name):
+    conn = get_connection()
+    row = conn.execute("SELECT id FROM skills WHERE name=?", (name,)).fetchone()
+    conn.close()
+    return row
+
+
+def test_post_job_with_new_skill(make_job):
+    # a skill the dictionary has never seen is added on the posting connection
+    job_id = make_job("Python, Quantum Basket Weaving, python3")
+    assert get_job_skills(job_id) == ["python", "quantum basket weaving"]
+    assert _skill_row("quantum basket weaving") is not None
+    assert get_dictionary().lookup("Quantum Basket Weaving") is not None
+
+
+def test_update_job_with_new_skill(make_job):
+    job_id = make_job("Python")
+    update_job(job_id, "Engineer", "Rust, Zig Build Systems", None, None)
+    assert get_job_skills(job_id) == ["rust", "zig build systems"]
+
+
+def test_failed_write_forgets_new_skills(make_job):
+    make_job("Python")
+    # no such job: the job_skills insert fails after the skill was added
+    with pytest.raises(Exception):
+        update_job(999, "Engineer", "Cobol Wrangling", None, None)
+    assert _skill_row("cobol wrangling") is None
+    assert get_dictionary().lookup("cobol wrangling") is None
@@ -0,0 +1,45 @@
+# test_match_matrix.py
+# jobmatch.match_matrix: spawned workers score every candidate/job pair and clean up the checkpoint.
+# Run: python -m pytest -q test_match_matrix.py
+import os
+
+import pandas as pd
+
+from candidate.resume_parser import save_skills
+from db import connection, database_path
+from jobmatch import match_matrix
+
+
+def _populate(make_candidate, make_job):
+    make_job("Python, SQL")
+    make_job("Docker, Kubernetes, Python")
+    make_job("Figma")
+    for name, skills in [("Asha", ["Python", "SQL"]), ("Ben", ["Docker"]), ("Chen", ["Excel"])]:
+        save_skills(make_candidate(name), skills)
+
+
+def test_csv_run_writes_parts_and_removes_checkpoint(make_candidate, make_job, tmp_path):
+    _populate(make_candidate, make_job)
+    out = str(tmp_path / "matrix")
+    result = match_matrix.run(out, "csv", workers=1, chunk_size=2)
+    assert result["pairs"] == 9
+    parts = sorted(f for f in os.listdir(out) if f.startswith("part-"))
+    assert parts == ["part-00000.csv", "part-00001.csv"]
+    df = pd.concat(pd.read_csv(os.path.join(out, f)) for f in parts)
+    assert sorted(df["score"].tolist()) == [33.33, 33.33, 100.0]
+    assert not os.path.exists(os.path.join(out, "_checkpoint.json"))
+
+
+def test_db_run_keeps_checkpoint_next_to_the_database(make_candidate, make_job, tmp_path, monkeypatch):
+    _populate(make_candidate, make_job)
+    monkeypatch.chdir(tmp_path)
+    seen = []
+    save = match_matrix._save_checkpoint
+    monkeypatch.setattr(match_matrix, "_save_checkpoint",
+                        lambda path, params, done: (seen.append(path), save(path, params, done)))
+    match_matrix.run(fmt="db", workers=1, chunk_size=2)
+    with connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM match_matrix").fetchone()[0] == 3
+    assert set(seen) == {database_path() + ".match_matrix.checkpoint.json"}
+    assert not os.path.exists(seen[0])
+    assert not any(f.endswith("checkpoint.json") for f in os.listdir(tmp_path))
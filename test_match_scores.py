@@ -0,0 +1,61 @@
+# test_match_scores.py
+# jobmatch.match_scores: job_match_scores follows job posts / edits / closes and save_skills.
+# Run: python -m pytest -q test_match_scores.py
+from candidate.resume_parser import save_skills
+from db import connection
+from jobmatch import match_scores
+from jobmatch.store_data import update_job
+from utils.events import emit, JOB_CHANGED
+
+
+def _rows():
+    with connection() as conn:
+        return conn.execute(
+            "SELECT user_id, job_id, score, missing_count FROM job_match_scores ORDER BY user_id, job_id"
+        ).fetchall()
+
+
+def test_rows_follow_jobs_and_skills(make_candidate, make_job):
+    asha, ben = make_candidate("Asha"), make_candidate("Ben")
+    save_skills(asha, ["Python", "SQL"])
+    save_skills(ben, ["Docker"])
+    assert _rows() == []
+
+    # post: every candidate sharing a skill gets a row, however low the score
+    job = make_job("Python, Docker, Kubernetes, Go")
+    assert _rows() == [(asha, job, 25.0, 3), (ben, job, 25.0, 3)]
+    other = make_job("Figma")
+    assert _rows() == [(asha, job, 25.0, 3), (ben, job, 25.0, 3)]
+
+    # edit: the job's rows are recomputed
+    update_job(job, "Engineer", "Python, SQL, Docker", None, None)
+    assert _rows() == [(asha, job, 66.67, 1), (ben, job, 33.33, 2)]
+
+    # save_skills: only that user's rows change
+    save_skills(ben, ["Figma", "Excel"])
+    assert _rows() == [(asha, job, 66.67, 1), (ben, other, 100.0, 0)]
+
+    # close: rows go away with the job
+    with connection() as conn:
+        conn.execute("UPDATE job_posts SET status='closed' WHERE id=?", (job,))
+    emit(JOB_CHANGED, job_id=job, action="closed")
+    assert _rows() == [(ben, other, 100.0, 0)]
+
+
+def test_reads_are_best_first(make_candidate, make_job):
+    uid = make_candidate()
+    low, high = make_job("Python, Go, Rust, Java"), make_job("Python")
+    save_skills(uid, ["Python"])
+    assert match_scores.get_match_scores(uid) == [(high, 100.0, 0), (low, 25.0, 3)]
+    assert match_scores.get_match_scores(uid, limit=1) == [(high, 100.0, 0)]
+
+
+def test_rebuild_all_matches_incremental_rows(make_candidate, make_job):
+    for name, skills in [("A", ["Python"]), ("B", ["SQL", "Docker"]), ("C", ["Go"])]:
+        save_skills(make_candidate(name), skills)
+    make_job("Python, SQL")
+    make_job("Docker, Kubernetes")
+    incremental = _rows()
+    with connection() as conn:
+        match_scores.rebuild_all(conn.cursor())
+    assert _rows() == incremental and len(incremental) == 3
@@ -0,0 +1,76 @@
+# test_migrations.py
+# db.run_migrations: each migration is recorded once and upgrades backfill derived tables.
+# Run: python -m pytest -q test_migrations.py
+import inspect
+import re
+import sqlite3
+
+import pytest
+
+import db
+
+ALL_MIGRATIONS = db.MIGRATIONS
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "migrated.db")
+    db.run_migrations(conn)
+    yield conn
+    conn.close()
+
+
+def test_migrations_are_recorded_once(conn):
+    assert db.run_migrations(conn) == []
+    versions = [row[0] for row in conn.execute("SELECT version FROM schema_version ORDER BY version")]
+    assert versions == [v for v, _, _ in db.MIGRATIONS]
+
+
+def _migrate_to(conn, monkeypatch, version):
+    monkeypatch.setattr(db, "MIGRATIONS", [m for m in ALL_MIGRATIONS if m[0] <= version])
+    db.run_migrations(conn)
+
+
+def test_upgrade_backfills_skill_ids_and_match_scores(tmp_path, monkeypatch):
+    conn = sqlite3.connect(tmp_path / "old.db")
+    # a database from before canonical skills: free-text skills only
+    _migrate_to(conn, monkeypatch, 2)
+    conn.execute("INSERT INTO companies (id, name, domain) VALUES (1, 'Acme', 'acme.example.com')")
+    conn.execute("INSERT INTO users (id, name, email, password, role) VALUES (1, 'A', 'a@x', 'x', 'candidate')")
+    conn.executemany("INSERT INTO user_skills (user_id, skill) VALUES (1, ?)", [("React",), ("reactjs",), ("Python",)])
+    conn.execute(
+        "INSERT INTO job_posts (id, company_id, role, skills, status) "
+        "VALUES (1, 1, 'Dev', 'Python, SQL, Quantum Knitting', 'open')"
+    )
+    conn.commit()
+
+    _migrate_to(conn, monkeypatch, 3)
+    ids = dict(conn.execute("SELECT name, id FROM skills").fetchall())
+    assert sorted(r[0] for r in conn.execute("SELECT skill_id FROM user_skills")) == sorted([ids["react"], ids["python"]])
+    assert conn.execute("SELECT skill, skill_id FROM job_skills WHERE job_id=1 ORDER BY position").fetchall() == [
+        ("python", ids["python"]), ("sql", ids["sql"]), ("quantum knitting", ids["quantum knitting"])
+    ]
+    # learned from typed input, so never searched for in resumes
+    assert conn.execute("SELECT curated FROM skills WHERE name='quantum knitting'").fetchone() == (0,)
+    assert conn.execute("SELECT curated FROM skills WHERE name='python'").fetchone() == (1,)
+
+    _migrate_to(conn, monkeypatch, 4)
+    assert conn.execute("SELECT * FROM job_match_scores").fetchall() == [(1, 1, 33.33, 2)]
+
+    _migrate_to(conn, monkeypatch, ALL_MIGRATIONS[-1][0])
+    assert conn.execute("SELECT * FROM job_match_scores").fetchall() == [(1, 1, 33.33, 2)]
+    bits = conn.execute("SELECT skill_bits FROM job_posts WHERE id=1").fetchone()[0]
+    positions = dict(conn.execute("SELECT id, bit FROM skills WHERE bit IS NOT NULL").fetchall())
+    assert int.from_bytes(bits, "little") == sum(1 << positions[ids[n]] for n in ("python", "sql", "quantum knitting"))
+    # curated skills take the first positions, then skills some job asks for
+    curated = conn.execute("SELECT COUNT(*) FROM skills WHERE curated=1").fetchone()[0]
+    assert sorted(positions.values()) == list(range(curated + 1))
+    assert positions[ids["quantum knitting"]] == curated
+    conn.close()
+
+
+def test_migrations_import_no_application_code():
+    source = inspect.getsource(db)
+    start = source.index("# ---------- SCHEMA MIGRATIONS ----------")
+    end = source.index("MIGRATIONS = [")
+    assert not re.search(r"^\s+(from \S+ )?import ", source[start:end], re.MULTILINE)
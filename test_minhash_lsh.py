@@ -0,0 +1,47 @@
+# test_minhash_lsh.py
+# jobmatch.minhash_lsh: LSH answers are exact Jaccard and find (almost) all true neighbours.
+# Run: python -m pytest -q test_minhash_lsh.py
+import random
+import statistics
+
+from benchmarks.lsh_recall import make_sets, recall
+from jobmatch.minhash_lsh import LSHIndex, exact_top_k, jaccard
+
+
+def test_recall_at_10_with_default_bands():
+    sets = make_sets(2000)
+    index = LSHIndex()
+    for key, ids in sets.items():
+        index.add(key, ids)
+    queries = random.Random(5).sample(list(sets), 100)
+    scores = [recall(index.query_key(q, 10), exact_top_k(sets, sets[q], 10, exclude=q), 10) for q in queries]
+    assert statistics.mean(scores) >= 0.95
+    # and it did not get there by scanning everything
+    assert statistics.mean(len(index.candidates(sets[q])) for q in queries) < len(sets) / 10
+
+
+def test_identical_sets_are_always_found():
+    index = LSHIndex()
+    index.add("a", [1, 2, 3, 4])
+    index.add("b", [4, 3, 2, 1])
+    index.add("c", [50, 51])
+    assert index.query_key("a") == [("b", 1.0)]
+
+
+def test_scores_are_exact_jaccard():
+    index = LSHIndex(num_perm=64, bands=64)   # one row per band: every overlap is a candidate
+    index.add(1, [1, 2, 3])
+    index.add(2, [2, 3, 4, 5])
+    assert index.query([1, 2, 3, 4], k=5) == [(1, round(jaccard([1, 2, 3, 4], [1, 2, 3]), 4)),
+                                              (2, round(jaccard([1, 2, 3, 4], [2, 3, 4, 5]), 4))]
+
+
+def test_replace_and_remove():
+    index = LSHIndex()
+    index.add(1, [1, 2, 3])
+    index.add(2, [1, 2, 3])
+    index.add(1, [70, 71, 72])          # replaced: no longer similar to 2
+    assert index.query_key(2) == []
+    index.remove(1)
+    assert len(index) == 1
+    assert all(1 not in keys for band in index.buckets for keys in band.values())
@@ -0,0 +1,66 @@
+# test_parse_cache.py
+# candidate.resume_parser.parse_resume: one parse per (file contents, PARSER_VERSION).
+# Run: python -m pytest -q test_parse_cache.py
+import pytest
+from docx import Document
+
+from candidate import resume_parser
+from jobmatch.store_data import get_candidate_skills
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    parse = resume_parser._parse_text
+
+    def counting(user_id, path):
+        calls.append(user_id)
+        return parse(user_id, path)
+    monkeypatch.setattr(resume_parser, "_parse_text", counting)
+    return calls
+
+
+def test_same_file_is_parsed_once(make_candidate, resume, parses):
+    uid = make_candidate()
+    first = resume_parser.parse_resume(uid, resume)
+    assert first["email"] == "asha.menon@example.com"
+    assert set(first["skills"]) >= {"Python", "SQL", "Docker"}
+    assert resume_parser.parse_resume(uid, resume) == first
+    assert resume_parser.parse_resume(uid, resume, resume_parser.file_hash(resume)) == first
+    assert parses == [uid]
+
+
+def test_cache_hit_still_saves_skills_for_another_user(make_candidate, resume, parses):
+    first, second = make_candidate("Asha"), make_candidate("Ben")
+    resume_parser.parse_resume(first, resume)
+    resume_parser.parse_resume(second, resume)
+    assert parses == [first]
+    assert set(get_candidate_skills(second)) == set(get_candidate_skills(first)) >= {"python", "sql", "docker"}
+
+
+def test_new_parser_version_misses(make_candidate, resume, parses, monkeypatch):
+    uid = make_candidate()
+    resume_parser.parse_resume(uid, resume)
+    monkeypatch.setattr(resume_parser, "PARSER_VERSION", resume_parser.PARSER_VERSION + "-next")
+    resume_parser.parse_resume(uid, resume)
+    assert parses == [uid, uid]
+
+
+def test_changed_file_misses(make_candidate, resume, parses):
+    uid = make_candidate()
+    resume_parser.parse_resume(uid, resume)
+    doc = Document(resume)
+    doc.add_paragraph("Kubernetes")
+    doc.save(resume)
+    assert "Kubernetes" in resume_parser.parse_resume(uid, resume)["skills"]
+    assert len(parses) == 2
+
+
+def test_new_skill_vocabulary_misses(make_candidate, resume, parses, monkeypatch):
+    from jobmatch.skill_automaton import get_automaton
+
+    uid = make_candidate()
+    resume_parser.parse_resume(uid, resume)
+    monkeypatch.setattr(get_automaton(), "version", "next-vocabulary")
+    resume_parser.parse_resume(uid, resume)
+    assert parses == [uid, uid]
@@ -0,0 +1,100 @@
+# test_parse_queue.py
+# candidate.parse_queue: inline by default, and enqueue -> worker -> parsed result when workers are on.
+# Run: python -m pytest -q test_parse_queue.py
+import multiprocessing
+import os
+import sys
+import time
+
+from candidate import parse_queue
+from candidate.resume_parser import file_hash, get_cached_parse
+from db import connection
+from jobmatch.store_data import get_candidate_skills
+
+
+def test_inline_by_default(make_candidate, resume, monkeypatch):
+    # nothing starts workers with the app, so queueing must be opted into
+    if "TRUSTHIRE_PARSE_WORKERS" not in os.environ:
+        assert parse_queue.WORKERS == 0
+    monkeypatch.setattr(parse_queue, "WORKERS", 0)
+    uid = make_candidate()
+    parsed, job_id = parse_queue.submit_parse(uid, resume, file_hash(resume))
+    assert job_id is None and parsed["email"] == "asha.menon@example.com"
+    assert parse_queue.latest_job(uid) is None
+
+
+def test_queued_job_is_parsed_by_claim_and_run(make_candidate, resume, monkeypatch):
+    monkeypatch.setattr(parse_queue, "WORKERS", 2)
+    uid = make_candidate()
+    content_hash = file_hash(resume)
+    parsed, job_id = parse_queue.submit_parse(uid, resume, content_hash)
+    assert parsed is None
+    # the same upload again reuses the pending job
+    assert parse_queue.enqueue(uid, resume, content_hash) == job_id
+    assert parse_queue.latest_job(uid)["status"] == "queued"
+
+    job = parse_queue.claim_next("test")
+    assert job == (job_id, uid, resume, content_hash)
+    assert parse_queue.claim_next("test") is None
+    parse_queue.run_job(job)
+
+    assert parse_queue.latest_job(uid)["status"] == "done"
+    assert get_cached_parse(content_hash)["email"] == "asha.menon@example.com"
+    assert {"python", "sql", "docker"} <= set(get_candidate_skills(uid))
+    # now cached: answered at once, nothing queued
+    parsed, job_id = parse_queue.submit_parse(uid, resume, content_hash)
+    assert job_id is None and parsed["email"] == "asha.menon@example.com"
+
+
+def test_worker_process_drains_the_queue(make_candidate, resume, monkeypatch):
+    monkeypatch.setattr(parse_queue, "WORKERS", 1)
+    uid = make_candidate()
+    _, job_id = parse_queue.submit_parse(uid, resume, file_hash(resume))
+
+    ctx = multiprocessing.get_context("spawn")
+    stop = ctx.Event()
+    worker = ctx.Process(target=parse_queue.worker_loop, args=(stop, 0.05))
+    worker.start()   # finds the test database through TRUSTHIRE_DB_PATH (app_db)
+    try:
+        deadline = time.monotonic() + 60
+        while parse_queue.latest_job(uid)["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.1)
+    finally:
+        stop.set()
+        worker.join(30)
+    assert parse_queue.latest_job(uid)["status"] == "done"
+    assert {"python", "sql", "docker"} <= set(get_candidate_skills(uid))
+    with connection() as conn:
+        assert conn.execute("SELECT worker FROM parse_jobs WHERE id=?", (job_id,)).fetchone()[0] == f"pid-{worker.pid}"
+
+
+def _poll_parse_status():
+    import streamlit as st
+    from candidate.candidate_dashboard import _parse_status
+    _parse_status(st.session_state.user_id)
+
+
+def test_done_job_without_cached_result_is_parsed_again(make_candidate, resume, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+    from candidate import resume_parser
+
+    monkeypatch.setattr(parse_queue, "WORKERS", 2)
+    uid = make_candidate()
+    content_hash = file_hash(resume)
+    _, job_id = parse_queue.submit_parse(uid, resume, content_hash)
+    parse_queue.run_job(parse_queue.claim_next("test"))
+    # e.g. the vocabulary grew after the worker ran: its cache entry no longer matches
+    monkeypatch.setattr(resume_parser, "PARSER_VERSION", resume_parser.PARSER_VERSION + "-next")
+    assert get_cached_parse(content_hash) is None
+
+    # AppTest installs its script as __main__; spawned workers in later tests re-run __main__
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])
+    at = AppTest.from_function(_poll_parse_status)
+    at.session_state["user_id"] = uid
+    at.session_state["parse_job_id"] = job_id
+    at.run()
+
+    assert not at.exception
+    assert "parse_job_id" not in at.session_state
+    assert at.session_state["parsed_data"]["email"] == "asha.menon@example.com"
+    assert get_cached_parse(content_hash)["email"] == "asha.menon@example.com"
@@ -0,0 +1,56 @@
+# test_pdf_pages.py
+# candidate.pdf_pages: the process pool returns the same text, in page order,
+# as serial extraction, and stays out of the way where it cannot help.
+# Run: python -m pytest -q test_pdf_pages.py
+import os
+
+import pytest
+
+from benchmarks.sample_pdfs import resume_pdf
+from candidate import pdf_pages
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Two workers, whatever this machine has; the pool is torn down afterwards."""
+    monkeypatch.setattr(pdf_pages, "WORKERS", 2)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    pdf_pages._reset_pool()
+    yield
+    if pdf_pages._pool is not None:
+        pdf_pages._pool.shutdown(wait=True)
+    pdf_pages._pool = None
+
+
+def test_parallel_matches_serial_in_page_order(pool, tmp_path):
+    path = resume_pdf(str(tmp_path / "resume.pdf"), 9)
+    pages = [pdf_pages.extract_page_range(path, i, i + 1)[0] for i in range(9)]
+    assert len(set(pages)) > 1
+
+    serial = pdf_pages.extract_pdf_text(path, parallel=False)
+    parallel = pdf_pages.extract_pdf_text(path, parallel=True)
+
+    assert pdf_pages._pool is not None
+    assert parallel == serial == "\n".join(pages)
+
+
+def test_long_documents_pick_the_pool(pool, tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_pages, "PARALLEL_PAGES", 6)
+    path = resume_pdf(str(tmp_path / "resume.pdf"), 6)
+    assert pdf_pages.extract_pdf_text(path) == pdf_pages.extract_pdf_text(path, parallel=False)
+    assert pdf_pages._pool is not None
+
+
+def test_one_cpu_stays_serial(pool, tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    path = resume_pdf(str(tmp_path / "resume.pdf"), 9)
+    assert pdf_pages.extract_pdf_text(path, parallel=True)
+    assert pdf_pages._pool is None
+
+
+def test_few_pages_stay_serial(pool, tmp_path):
+    assert pdf_pages._pool_workers(3) == 1
+    assert pdf_pages._pool_workers(5) == 2
+    path = resume_pdf(str(tmp_path / "resume.pdf"), 3)
+    assert pdf_pages.extract_pdf_text(path, parallel=True)
+    assert pdf_pages._pool is None
@@ -0,0 +1,120 @@
+# test_query_log.py
+# utils.query_log against a real pooled database: normalisation, row counts,
+# the slow-query threshold and per-rerun grouping.
+# Run: python -m pytest -q test_query_log.py
+import logging
+
+import pytest
+
+import db
+from jobmatch.store_data import get_applied_job_ids
+from utils import query_log
+
+
+@pytest.fixture
+def traced(app_db, monkeypatch, caplog):
+    """Tracing on, with a fresh pool so every connection is a TracedConnection."""
+    monkeypatch.setattr(query_log, "_enabled", True)
+    monkeypatch.setattr(db, "_pool", db.ConnectionPool(app_db, profile="test"))
+    monkeypatch.setattr(query_log, "_slow_logger", logging.getLogger("test.slow_sql"))
+    caplog.set_level(logging.INFO, logger="test.slow_sql")
+    query_log.reset()
+    yield caplog
+    query_log.end_rerun()
+    query_log.reset()
+    db._pool.close_all()
+
+
+def _stats(sql):
+    return next(s for s in query_log.top_statements(limit=100) if s["sql"] == sql)
+
+
+def test_normalize_sql():
+    sql = """
+        SELECT * FROM t1
+        WHERE name = 'O''Brien' AND id IN (1, 2, 3) AND score > 10.5
+        LIMIT 5
+    """
+    assert query_log.normalize_sql(sql) == (
+        "SELECT * FROM t1 WHERE name = ? AND id IN (?, ...) AND score > ? LIMIT ?"
+    )
+    assert query_log.normalize_sql("SELECT 1 WHERE a IN (?,?)") == "SELECT ? WHERE a IN (?, ...)"
+    assert query_log.normalize_sql(None) == ""
+
+
+def test_rows_are_counted_per_statement(traced, make_candidate):
+    for name in ("Asha", "Ravi", "Meera"):
+        make_candidate(name)
+
+    conn = db.get_connection()
+    assert len(conn.execute("SELECT id FROM users WHERE role='candidate'").fetchall()) == 3
+    assert conn.execute("SELECT id FROM users WHERE role='hr'").fetchall() == []
+    assert len(list(conn.execute("SELECT id FROM users WHERE role = 'candidate' "))) == 3
+    cur = conn.execute("SELECT id FROM users WHERE role='candidate' ORDER BY id")
+    assert cur.fetchmany(2) and cur.fetchmany(2) and not cur.fetchmany(2)
+    conn.execute("UPDATE users SET phone='1' WHERE role='candidate'")
+    conn.commit()
+    conn.close()
+
+    reads = _stats("SELECT id FROM users WHERE role=?")
+    assert reads["calls"] == 2 and reads["rows"] == 3
+    assert _stats("SELECT id FROM users WHERE role = ?")["rows"] == 3
+    assert _stats("SELECT id FROM users WHERE role=? ORDER BY id")["rows"] == 3
+    assert _stats("UPDATE users SET phone=? WHERE role=?")["rows"] == 3
+    # a VALUES list collapses the same way an IN list does
+    assert _stats("INSERT INTO users (name, email, password, role, status, created_at) "
+                  "VALUES (?, ...)")["calls"] == 3
+
+
+def test_statements_are_attributed_to_the_calling_page(traced, make_candidate):
+    get_applied_job_ids(make_candidate())
+    sql = query_log.normalize_sql("SELECT job_id FROM job_applications WHERE candidate_id=?")
+    assert _stats(sql)["callers"] == "jobmatch.store_data:get_applied_job_ids"
+
+
+def test_slow_query_threshold(traced, monkeypatch):
+    conn = db.get_connection()
+    monkeypatch.setattr(query_log, "SLOW_QUERY_MS", 60_000)
+    conn.execute("SELECT COUNT(*) FROM users").fetchall()
+    assert traced.records == []
+
+    monkeypatch.setattr(query_log, "SLOW_QUERY_MS", 0)
+    conn.execute("SELECT COUNT(*) FROM companies").fetchall()
+    conn.close()
+    assert len(traced.records) == 1
+    message = traced.records[0].getMessage()
+    assert "rows=1" in message and "sql=SELECT COUNT(*) FROM companies" in message
+
+
+def test_statements_are_grouped_per_rerun(traced, make_candidate):
+    user_id = make_candidate()
+
+    query_log.begin_rerun("browse_jobs")
+    for _ in range(3):
+        get_applied_job_ids(user_id)
+    conn = db.get_connection()
+    conn.execute("SELECT name FROM users WHERE id=?", (user_id,)).fetchall()
+    conn.close()
+    # st.rerun() skips end_rerun(); the next begin_rerun() closes the dangling run
+    query_log.begin_rerun("dashboard")
+    get_applied_job_ids(user_id)
+    summary = query_log.end_rerun()
+
+    assert summary["page"] == "dashboard" and summary["statements"] == 1
+    browse = query_log.recent_reruns()[1]
+    assert browse["page"] == "browse_jobs"
+    assert browse["statements"] == 4 and browse["distinct"] == 2
+    assert sorted(t["calls"] for t in browse["top"]) == [1, 3]
+    assert query_log.end_rerun() is None
+
+
+def test_disabled_tracing_leaves_connections_untraced(app_db, monkeypatch):
+    monkeypatch.setattr(query_log, "_enabled", False)
+    monkeypatch.setattr(db, "_pool", db.ConnectionPool(app_db, profile="test"))
+    query_log.reset()
+    conn = db.get_connection()
+    assert not isinstance(conn, db.TracedConnection)
+    conn.execute("SELECT 1").fetchall()
+    conn.close()
+    assert query_log.top_statements() == []
+    db._pool.close_all()
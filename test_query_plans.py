@@ -0,0 +1,47 @@
+# test_query_plans.py
+# EXPLAIN QUERY PLAN regression checks for the SQL registered with db.hot_query().
+# Run: python -m pytest -q test_query_plans.py
+import importlib
+import sqlite3
+
+import pytest
+
+import db
+
+for _module in db.HOT_QUERY_MODULES:
+    importlib.import_module(_module)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "plans.db")
+    db.run_migrations(conn)
+    yield conn
+    conn.close()
+
+
+def test_every_module_registers_its_queries():
+    assert {"open_jobs", "company_jobs_with_counts", "job_applicants"} <= set(db.HOT_QUERIES)
+
+
+@pytest.mark.parametrize("name", sorted(db.HOT_QUERIES))
+def test_hot_query_searches_an_index(conn, name):
+    sql, params, allow = db.HOT_QUERIES[name]
+    plan = db.explain_query_plan(conn, sql, params)
+    assert db.full_scans(conn, sql, params, allow) == [], plan
+    assert any(step.startswith("SEARCH ") for step in plan), plan
+
+
+def test_full_scan_is_detected(conn):
+    conn.execute("DROP INDEX idx_job_posts_status_created")
+    sql, params, allow = db.HOT_QUERIES["open_jobs"]
+    assert db.full_scans(conn, sql, params, allow)
+
+
+def test_index_scan_is_detected(conn):
+    conn.execute("CREATE TABLE t (a, b)")
+    conn.execute("CREATE INDEX idx_t_a_b ON t (a, b)")
+    sql = "SELECT a FROM t INDEXED BY idx_t_a_b WHERE b = 1"
+    assert db.explain_query_plan(conn, sql) == ["SCAN t USING COVERING INDEX idx_t_a_b"]
+    assert db.full_scans(conn, sql) == ["SCAN t USING COVERING INDEX idx_t_a_b"]
+    assert db.full_scans(conn, sql, allow=("SCAN t USING",)) == []
@@ -0,0 +1,62 @@
+# test_save_skills.py
+# candidate.resume_parser.save_skills writes only the skill diff.
+# Run: python -m pytest -q test_save_skills.py
+import pytest
+
+from candidate.resume_parser import save_skills
+from db import get_connection
+from utils.events import subscribe, unsubscribe, SKILLS_CHANGED
+
+
+@pytest.fixture
+def events():
+    seen = []
+
+    def listener(**payload):
+        seen.append(payload)
+    subscribe(SKILLS_CHANGED, listener)
+    yield seen
+    unsubscribe(SKILLS_CHANGED, listener)
+
+
+def _rows(user_id):
+    conn = get_connection()
+    rows = conn.execute("SELECT id, skill FROM user_skills WHERE user_id=? ORDER BY id", (user_id,)).fetchall()
+    conn.close()
+    return rows
+
+
+def test_first_save_adds_everything(make_candidate, events):
+    uid = make_candidate()
+    assert save_skills(uid, ["Python", "SQL", "Docker"]) == (["Python", "SQL", "Docker"], [])
+    assert [s for _, s in _rows(uid)] == ["Python", "SQL", "Docker"]
+    assert events == [{"user_id": uid, "added": ["Python", "SQL", "Docker"], "removed": []}]
+
+
+def test_same_skills_write_nothing(make_candidate, events):
+    uid = make_candidate()
+    save_skills(uid, ["Python", "React"])
+    before = _rows(uid)
+    # another spelling of the same canonical skill is not a change either
+    assert save_skills(uid, ["python", "ReactJS", " Python "]) == ([], [])
+    assert _rows(uid) == before
+    assert len(events) == 1
+
+
+def test_only_the_diff_is_written(make_candidate, events):
+    uid = make_candidate()
+    save_skills(uid, ["Python", "SQL", "Docker"])
+    kept = {s: row_id for row_id, s in _rows(uid)}
+    assert save_skills(uid, ["Python", "Docker", "Kubernetes"]) == (["Kubernetes"], ["SQL"])
+    rows = {s: row_id for row_id, s in _rows(uid)}
+    assert set(rows) == {"Python", "Docker", "Kubernetes"}
+    # untouched skills keep their rows
+    assert rows["Python"] == kept["Python"] and rows["Docker"] == kept["Docker"]
+    assert events[-1] == {"user_id": uid, "added": ["Kubernetes"], "removed": ["SQL"]}
+
+
+def test_empty_list_removes_everything(make_candidate):
+    uid = make_candidate()
+    save_skills(uid, ["Python", "SQL"])
+    assert save_skills(uid, []) == ([], ["Python", "SQL"])
+    assert _rows(uid) == []
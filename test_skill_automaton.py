@@ -0,0 +1,65 @@
+# test_skill_automaton.py
+# jobmatch.skill_automaton: word boundaries, leftmost-longest matches, and only
+# the curated vocabulary is searched for in free text.
+# Run: python -m pytest -q test_skill_automaton.py
+from candidate.resume_parser import extract_skills_from_resume
+from jobmatch import skill_automaton
+from jobmatch.skill_automaton import SkillAutomaton, get_automaton
+from jobmatch.skill_dictionary import get_dictionary, skill_ids
+
+SPELLINGS = {"java": 1, "javascript": 2, "c": 3, "c++": 4, "learning": 5, "machine learning": 6,
+             "react": 7, "node.js": 8, "go": 9}
+
+
+def _found(text, skip_ambiguous=False):
+    return [(text[s:e], i) for s, e, i in SkillAutomaton(SPELLINGS).find_all(text, skip_ambiguous)]
+
+
+def test_word_boundaries():
+    assert _found("JavaScript and Java") == [("JavaScript", 2), ("Java", 1)]
+    assert _found("javas java_x xjava java2") == []
+    assert _found("(Java), C.") == [("Java", 1), ("C", 3)]
+
+
+def test_leftmost_longest_without_overlap():
+    assert _found("C++ and C") == [("C++", 4), ("C", 3)]
+    assert _found("deep machine learning, learning") == [("machine learning", 6), ("learning", 5)]
+    assert _found("Node.js") == [("Node.js", 8)]
+
+
+def test_whitespace_runs_match_one_space_and_offsets_follow_the_text():
+    text = "Skilled in Machine \n\t Learning."
+    assert _found(text) == [("Machine \n\t Learning", 6)]
+    # "İ" lowercases to two characters; offsets must still point into text
+    assert _found("İİ java") == [("java", 1)]
+
+
+def test_ambiguous_spellings_can_be_skipped():
+    assert _found("React to change, Go home, Java", skip_ambiguous=True) == [("Java", 1)]
+    assert _found("React, Go", skip_ambiguous=False) == [("React", 7), ("Go", 9)]
+
+
+def test_ambiguous_skills_only_count_in_the_skills_section(app_db):
+    text = "Worked on Python services. I react quickly and go the extra mile."
+    assert extract_skills_from_resume("", text) == ["Python"]
+    found = extract_skills_from_resume("Docker, React", text)
+    assert found[:2] == ["Docker", "React"] and "Python" in found and "go" not in found
+
+
+def test_learned_spellings_are_not_searched_for(app_db):
+    automaton = get_automaton()
+    # what typed skill fields and resumes have taught the dictionary over time
+    learned = skill_ids(["the", "english", "good team player", "kubernetes operator"], create=True)
+    assert len(learned) == 4
+    assert get_automaton() is automaton   # learning a spelling does not rebuild anything
+    text = "I am a good team player, fluent in English, and the Python guy."
+    assert extract_skills_from_resume("", text) == ["Python"]
+
+
+def test_version_follows_the_curated_vocabulary(app_db):
+    version = get_automaton().version
+    assert SkillAutomaton(SPELLINGS).version == SkillAutomaton(dict(SPELLINGS)).version
+    assert SkillAutomaton({**SPELLINGS, "rust": 10}).version != SkillAutomaton(SPELLINGS).version
+    # a reloaded dictionary rebuilds from the database; same vocabulary, same version
+    get_dictionary(reload=True)
+    assert get_automaton().version == version
@@ -0,0 +1,93 @@
+# test_skill_bits.py
+# jobmatch.skill_bits: popcount scores / masks agree with the list-based functions,
+# and the stored bitsets follow user_skills / job_skills.
+# Run: python -m pytest -q test_skill_bits.py
+import random
+
+import pytest
+
+from candidate.resume_parser import save_skills
+from db import connection
+from jobmatch.match_score import calculate_match_score, calculate_match_score_bits
+from jobmatch.missing_skills import find_missing_skills, find_missing_skill_bits
+from jobmatch.skill_bits import backfill, from_bits, from_blob, skill_ids_from_bits, to_bits, to_blob
+from jobmatch.skill_dictionary import skill_ids
+from jobmatch.store_data import (get_candidate_skill_bits, get_candidate_skill_ids, get_job_skill_ids,
+                                 update_job)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bits_match_list_functions(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        job = rng.sample(range(300), rng.randint(0, 12))
+        candidate = rng.sample(range(300), rng.randint(0, 40))
+        matched = [s for s in job if s in set(candidate)]
+        have, need = to_bits(candidate), to_bits(job)
+        assert calculate_match_score_bits(have, need) == calculate_match_score(matched, job)
+        assert from_bits(find_missing_skill_bits(have, need)) == sorted(find_missing_skills(candidate, job))
+
+
+def test_round_trip():
+    ids = [0, 7, 8, 63, 64, 1000]
+    assert from_bits(to_bits(ids)) == ids
+    assert from_bits(from_blob(to_blob(to_bits(ids)))) == ids
+    assert to_blob(0) == b"" and from_blob(None) == 0 and from_blob(b"") == 0
+
+
+def _job_bits(job_id):
+    with connection() as conn:
+        return from_blob(conn.execute("SELECT skill_bits FROM job_posts WHERE id=?", (job_id,)).fetchone()[0])
+
+
+def test_stored_bits_follow_skill_rows(make_candidate, make_job):
+    uid = make_candidate()
+    save_skills(uid, ["Python", "SQL"])
+    assert sorted(skill_ids_from_bits(get_candidate_skill_bits(uid))) == sorted(get_candidate_skill_ids(uid))
+    save_skills(uid, ["Docker"])
+    assert sorted(skill_ids_from_bits(get_candidate_skill_bits(uid))) == sorted(get_candidate_skill_ids(uid))
+
+    job_id = make_job("Python, Docker, Kubernetes")
+    assert sorted(skill_ids_from_bits(_job_bits(job_id))) == sorted(get_job_skill_ids(job_id))
+    update_job(job_id, "Engineer", "Go", None, None)
+    assert sorted(skill_ids_from_bits(_job_bits(job_id))) == sorted(get_job_skill_ids(job_id))
+
+
+def test_backfill_rebuilds_from_skill_rows(make_candidate, make_job):
+    uid = make_candidate()
+    save_skills(uid, ["Python", "SQL"])
+    job_id = make_job("Python, React")
+    with connection() as conn:
+        conn.execute("UPDATE users SET skill_bits=NULL")
+        conn.execute("UPDATE job_posts SET skill_bits=?", (to_blob(to_bits([1, 2, 3])),))
+        conn.execute("UPDATE skills SET bit=NULL WHERE curated=0")
+        backfill(conn.cursor())
+    assert sorted(skill_ids_from_bits(get_candidate_skill_bits(uid))) == sorted(get_candidate_skill_ids(uid))
+    assert sorted(skill_ids_from_bits(_job_bits(job_id))) == sorted(get_job_skill_ids(job_id))
+
+
+def _curated_count():
+    with connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM skills WHERE curated=1").fetchone()[0]
+
+
+def test_learned_skills_do_not_widen_bitsets(make_candidate, make_job):
+    uid = make_candidate()
+    # junk from resumes gets ids, but no bit positions
+    save_skills(uid, ["Python"] + [f"misc phrase {i}" for i in range(200)])
+    assert get_candidate_skill_bits(uid).bit_length() <= _curated_count()
+    job_id = make_job("Python, SQL")
+    assert _job_bits(job_id).bit_length() <= _curated_count()
+
+
+def test_skill_first_used_by_a_job_reaches_existing_candidates(make_candidate, make_job):
+    uid = make_candidate()
+    save_skills(uid, ["Python", "Quantum Knitting"])
+    (knitting,) = skill_ids(["Quantum Knitting"])
+    assert knitting not in skill_ids_from_bits(get_candidate_skill_bits(uid))
+
+    job_id = make_job("Quantum Knitting, Go")
+    assert knitting in skill_ids_from_bits(_job_bits(job_id))
+    # the candidate's stored bitset picked up the new position
+    assert knitting in skill_ids_from_bits(get_candidate_skill_bits(uid))
+    assert calculate_match_score_bits(get_candidate_skill_bits(uid), _job_bits(job_id)) == 50.0
@@ -0,0 +1,41 @@
+# test_skill_dictionary.py
+# jobmatch.skill_dictionary: every spelling of a skill resolves to one id.
+# Run: python -m pytest -q test_skill_dictionary.py
+import db
+from jobmatch.skill_dictionary import canonical, get_dictionary, normalize_skill, skill_ids, skill_names
+
+
+def test_normalize_skill():
+    assert normalize_skill("  React.JS ") == "react.js"
+    assert normalize_skill("- Machine   Learning,") == "machine learning"
+    assert normalize_skill(None) == ""
+
+
+def test_aliases_resolve_to_one_id(app_db):
+    d = get_dictionary()
+    react = d.lookup("React")
+    assert react is not None
+    assert {d.lookup(s) for s in ("ReactJS", "react.js", " REACT JS ")} == {react}
+    assert canonical("reactjs") == "react"
+    assert canonical("Some New Thing") == "some new thing"
+
+
+def test_skill_ids_are_distinct_in_order(app_db):
+    ids = skill_ids(["SQL", "Python", "python3", "no such skill", "Postgres"])
+    assert skill_names(ids) == ["sql", "python", "postgresql"]
+
+
+def test_create_adds_unknown_skills(app_db):
+    [new_id] = skill_ids(["Quantum Basket Weaving"], create=True)
+    assert skill_ids(["quantum basket weaving"]) == [new_id]
+    conn = db.get_connection()
+    assert conn.execute("SELECT name FROM skills WHERE id=?", (new_id,)).fetchone() == ("quantum basket weaving",)
+    conn.close()
+
+
+def test_skill_names_sees_skills_added_elsewhere(app_db):
+    get_dictionary()
+    # another process adds a skill after this one loaded the dictionary
+    with db.connection() as conn:
+        new_id = conn.execute("INSERT INTO skills (name) VALUES ('zig')").lastrowid
+    assert skill_names([new_id]) == ["zig"]
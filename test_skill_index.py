@@ -0,0 +1,57 @@
+# test_skill_index.py
+# jobmatch.skill_index.SkillIndex: top-K from posting lists equals a brute-force ranking.
+# Run: python -m pytest -q test_skill_index.py
+import random
+
+import pytest
+
+from jobmatch.match_score import calculate_match_score
+from jobmatch.skill_index import SkillIndex
+
+
+def _brute_force(jobs, candidate, k):
+    ranked = []
+    for job_id, skills in jobs.items():
+        n = len(set(candidate) & set(skills))
+        if n:
+            ranked.append((calculate_match_score(range(n), skills), n, job_id))
+    ranked.sort(reverse=True)
+    return [(job_id, score, n) for score, n, job_id in ranked[:k]]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_top_k_matches_brute_force(seed):
+    rng = random.Random(seed)
+    jobs = {job_id: rng.sample(range(30), rng.randint(1, 8)) for job_id in range(1, 200)}
+    index = SkillIndex()
+    for job_id, skills in jobs.items():
+        index.add(job_id, skills)
+    for _ in range(10):
+        candidate = rng.sample(range(35), rng.randint(1, 10))
+        assert index.top_k(candidate, k=10) == _brute_force(jobs, candidate, 10)
+
+
+def test_jobs_without_shared_skills_are_not_returned():
+    index = SkillIndex()
+    index.add(1, [1, 2])
+    index.add(2, [3])
+    assert index.top_k([3, 9]) == [(2, 100.0, 1)]
+    assert index.top_k([9]) == []
+
+
+def test_add_replaces_and_remove_cleans_postings():
+    index = SkillIndex()
+    index.add(1, [1, 2])
+    index.add(1, [2, 3])
+    assert index.job_skills[1] == (2, 3)
+    assert 1 not in index.postings
+    index.remove(1)
+    assert len(index) == 0 and not index.postings
+
+
+def test_ties_prefer_more_matches_then_newer_job():
+    index = SkillIndex()
+    index.add(1, [1, 2])        # 1 of 2 -> 50%
+    index.add(2, [1, 2, 3, 4])  # 2 of 4 -> 50%, more matched
+    index.add(3, [1, 5])        # 1 of 2 -> 50%, newer than job 1
+    assert [job_id for job_id, _, _ in index.top_k([1, 3])] == [2, 3, 1]
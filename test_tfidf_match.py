@@ -0,0 +1,61 @@
+# test_tfidf_match.py
+# jobmatch.tfidf_match: the saved model is refit when job text changed behind its back.
+# Run: python -m pytest -q test_tfidf_match.py
+import pytest
+
+import db
+from jobmatch import tfidf_match
+from jobmatch.store_data import update_job
+
+
+@pytest.fixture
+def model_path(app_db, tmp_path, monkeypatch):
+    path = str(tmp_path / "models" / "tfidf_jobs.joblib")
+    monkeypatch.setattr(tfidf_match, "MODEL_PATH", path)
+    monkeypatch.setattr(tfidf_match, "SAVE_DELAY", 3600)   # tests call save_model() themselves
+    yield path
+    if tfidf_match._save_timer is not None:
+        tfidf_match._save_timer.cancel()
+        tfidf_match._save_timer = None
+
+
+def _db_fingerprint():
+    conn = db.get_connection()
+    try:
+        return tfidf_match._fingerprint(conn)
+    finally:
+        conn.close()
+
+
+def test_edit_while_down_changes_fingerprint(make_job, model_path):
+    job_id = make_job("Python, Django")
+    make_job("Java, Spring", role="Backend")
+    model = tfidf_match.get_model()
+    assert model.fingerprint == _db_fingerprint()
+
+    # same ids and count, different text: edited while the app was not running
+    with db.connection() as conn:
+        conn.execute("UPDATE job_posts SET skills='Rust, Tokio' WHERE id=?", (job_id,))
+    assert model.fingerprint != _db_fingerprint()
+
+    tfidf_match._model = None
+    refit = tfidf_match.get_model()
+    assert refit is not model and refit.fingerprint == _db_fingerprint()
+
+
+def test_patched_model_matches_database_after_reload(make_job, model_path):
+    job_id = make_job("Python, Django")
+    tfidf_match.get_model()
+    update_job(job_id, "Engineer", "Python, Flask", None, None)
+    make_job("Go, Kubernetes", role="Platform")
+
+    model = tfidf_match.get_model()
+    assert model.pending_updates == 2
+    assert model.fingerprint == _db_fingerprint()
+    # the patch is written later by the timer, not by the event handler
+    assert tfidf_match._save_timer is not None
+
+    tfidf_match.save_model()
+    loaded = tfidf_match.TfidfJobModel.load()
+    assert loaded.fingerprint == _db_fingerprint()
+    assert loaded.job_ids == model.job_ids
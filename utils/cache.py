@@ -0,0 +1,87 @@
+# utils/cache.py
+"""
+Process-wide read-through cache with TTL and explicit invalidation.
+
+All Streamlit sessions run in one process, so one cached copy of e.g. the
+open-jobs listing is shared by every candidate instead of being re-queried
+on every rerun. Cached values are shared: treat them as read-only.
+"""
+import os
+import threading
+import time
+
+DEFAULT_TTL = float(os.environ.get("TRUSTHIRE_CACHE_TTL", "300"))
+
+_registry = {}
+
+
+class TTLCache:
+    def __init__(self, name, ttl=DEFAULT_TTL, maxsize=1024):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}               # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self._generation = 0          # bumped by invalidate()
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "invalidations": 0}
+        _registry[name] = self
+
+    def _lookup(self, key):
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    def get_or_load(self, key, loader):
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.stats["hits"] += 1
+                return value
+            self.stats["misses"] += 1
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # one loader per key: concurrent sessions wait for it instead of
+        # all hitting the database at once after an invalidation
+        with load_lock:
+            with self._lock:
+                found, value = self._lookup(key)
+                if found:
+                    return value
+                generation = self._generation
+            value = loader()
+            with self._lock:
+                self.stats["loads"] += 1
+                # invalidated while loading: the value may predate the write
+                if generation != self._generation:
+                    return value
+                if len(self._data) >= self.maxsize and key not in self._data:
+                    self._data.pop(next(iter(self._data)))
+                self._data[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when key is None."""
+        with self._lock:
+            self.stats["invalidations"] += 1
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def info(self):
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return {
+                "cache": self.name,
+                **self.stats,
+                "hit_rate": round(self.stats["hits"] / total, 3) if total else 0.0,
+                "size": len(self._data),
+                "ttl_s": self.ttl,
+            }
+
+
+def all_stats():
+    return [c.info() for c in _registry.values()]
@@ -0,0 +1,45 @@
+# utils/events.py
+"""
+Tiny in-process publish/subscribe used to keep derived data (caches, indexes)
+in step with the write paths in hr/ and candidate/.
+
+    subscribe(JOB_CHANGED, lambda job_id, action, **_: ...)
+    emit(JOB_CHANGED, job_id=12, action="updated")
+"""
+import logging
+import threading
+from collections import defaultdict
+
+# job_id, action in {"created", "updated", "closed", "deleted"}
+JOB_CHANGED = "job_changed"
+# job_id, candidate_id
+APPLICATION_CREATED = "application_created"
+# user_id, added, removed (skill names) -- from save_skills
+SKILLS_CHANGED = "skills_changed"
+
+_subscribers = defaultdict(list)
+_lock = threading.Lock()
+
+
+def subscribe(event, fn):
+    with _lock:
+        if fn not in _subscribers[event]:
+            _subscribers[event].append(fn)
+    return fn
+
+
+def unsubscribe(event, fn):
+    with _lock:
+        if fn in _subscribers[event]:
+            _subscribers[event].remove(fn)
+
+
+def emit(event, **payload):
+    """Call every subscriber; one failing subscriber never breaks the write path."""
+    with _lock:
+        handlers = list(_subscribers[event])
+    for fn in handlers:
+        try:
+            fn(**payload)
+        except Exception:
+            logging.exception(f"{event} subscriber {getattr(fn, '__name__', fn)} failed")
@@ -0,0 +1,281 @@
+# utils/query_log.py
+"""
+Opt-in SQL instrumentation for pooled connections.
+
+Enable with TRUSTHIRE_SQL_TRACE=1. Every statement run through db.get_connection()
+is then timed (execute + fetch), its rows counted, its text normalised and
+attributed to the page function that issued it. main.py wraps each Streamlit
+rerun in begin_rerun()/end_rerun() so stats can be grouped per render.
+Statements slower than TRUSTHIRE_SLOW_QUERY_MS go to logs/slow_queries.log.
+"""
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+SLOW_QUERY_MS = float(os.environ.get("TRUSTHIRE_SLOW_QUERY_MS", "100"))
+LOG_DIR = os.environ.get(
+    "TRUSTHIRE_LOG_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs"),
+)
+
+# modules whose functions count as "the calling page"
+PAGE_PACKAGES = ("auth.", "candidate.", "hr.", "admin.", "jobmatch.", "pages.")
+
+_enabled = os.environ.get("TRUSTHIRE_SQL_TRACE", "").lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_local = threading.local()
+_totals = {}                      # normalised sql -> aggregate stats
+_recent_reruns = deque(maxlen=50)
+_slow_logger = None
+
+
+def enabled():
+    return _enabled
+
+
+def set_enabled(value: bool):
+    global _enabled
+    _enabled = bool(value)
+
+
+# ---------- NORMALISATION ----------
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    s = _STRING_RE.sub("?", sql or "")
+    s = _NUMBER_RE.sub("?", s)
+    s = _IN_LIST_RE.sub("(?, ...)", s)
+    return _SPACE_RE.sub(" ", s).strip()
+
+
+def _calling_page():
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(PAGE_PACKAGES):
+            return f"{module}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "main"
+
+
+def _get_slow_logger():
+    global _slow_logger
+    if _slow_logger is None:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        logger = logging.getLogger("trusthire.slow_sql")
+        logger.propagate = False
+        handler = RotatingFileHandler(
+            os.path.join(LOG_DIR, "slow_queries.log"), maxBytes=1_000_000, backupCount=5
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        _slow_logger = logger
+    return _slow_logger
+
+
+# ---------- RECORDS ----------
+class _Record:
+    __slots__ = ("sql", "caller", "rerun", "ms", "rows", "done")
+
+    def __init__(self, sql, caller, rerun):
+        self.sql = sql
+        self.caller = caller
+        self.rerun = rerun
+        self.ms = 0.0
+        self.rows = 0
+        self.done = False
+
+    def add(self, ms, rows=0):
+        self.ms += ms
+        self.rows += rows
+
+    def finish(self):
+        if self.done:
+            return
+        self.done = True
+
+        with _lock:
+            agg = _totals.get(self.sql)
+            if agg is None:
+                agg = _totals[self.sql] = {
+                    "sql": self.sql, "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "callers": set(),
+                }
+            agg["calls"] += 1
+            agg["total_ms"] += self.ms
+            agg["max_ms"] = max(agg["max_ms"], self.ms)
+            agg["rows"] += self.rows
+            agg["callers"].add(self.caller)
+
+        if self.rerun is not None:
+            self.rerun.add(self)
+
+        if self.ms >= SLOW_QUERY_MS:
+            label = self.rerun.label if self.rerun is not None else "-"
+            _get_slow_logger().info(
+                "%.1f ms rows=%d page=%s caller=%s sql=%s", self.ms, self.rows, label, self.caller, self.sql
+            )
+
+
+class _Rerun:
+    def __init__(self, label):
+        self.label = label
+        self.started = time.time()
+        self.statements = 0
+        self.total_ms = 0.0
+        self.by_sql = {}
+
+    def add(self, rec):
+        self.statements += 1
+        self.total_ms += rec.ms
+        agg = self.by_sql.setdefault(rec.sql, {"calls": 0, "total_ms": 0.0, "rows": 0, "caller": rec.caller})
+        agg["calls"] += 1
+        agg["total_ms"] += rec.ms
+        agg["rows"] += rec.rows
+
+    def summary(self, top=5):
+        worst = sorted(self.by_sql.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:top]
+        return {
+            "page": self.label,
+            "started": time.strftime("%H:%M:%S", time.localtime(self.started)),
+            "statements": self.statements,
+            "distinct": len(self.by_sql),
+            "total_ms": round(self.total_ms, 2),
+            "top": [{"sql": sql, **stats, "total_ms": round(stats["total_ms"], 2)} for sql, stats in worst],
+        }
+
+
+# ---------- CURSOR ----------
+class TracingCursor(sqlite3.Cursor):
+    """sqlite3 cursor that reports timings and row counts to this module."""
+    _record = None
+
+    def _start(self, sql):
+        if self._record is not None:
+            self._record.finish()
+        self._record = _Record(normalize_sql(sql), _calling_page(), getattr(_local, "rerun", None))
+
+    def _after_write(self, ms):
+        # rowcount is -1 for SELECT; rows are then counted as they are fetched
+        self._record.add(ms, max(self.rowcount, 0))
+
+    def execute(self, sql, parameters=()):
+        self._start(sql)
+        t0 = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._after_write((time.perf_counter() - t0) * 1000)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._start(sql)
+        t0 = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._after_write((time.perf_counter() - t0) * 1000)
+
+    def _fetched(self, t0, rows, exhausted):
+        rec = self._record
+        if rec is not None:
+            rec.add((time.perf_counter() - t0) * 1000, rows)
+            if exhausted:
+                rec.finish()
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(t0, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        t0 = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(t0, len(rows), not rows)
+        return rows
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(t0, len(rows), True)
+        return rows
+
+    def __next__(self):
+        t0 = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(t0, 0, True)
+            raise
+        self._fetched(t0, 1, False)
+        return row
+
+    def close(self):
+        if self._record is not None:
+            self._record.finish()
+        super().close()
+
+    def __del__(self):
+        if self._record is not None:
+            self._record.finish()
+
+
+# ---------- PER-RERUN GROUPING ----------
+def begin_rerun(label):
+    """Start grouping statements for one Streamlit script run on this thread."""
+    if not _enabled:
+        return
+    # st.rerun()/st.stop() skip end_rerun(), so close a dangling run first
+    end_rerun()
+    _local.rerun = _Rerun(label)
+
+
+def end_rerun():
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return None
+    _local.rerun = None
+    summary = rerun.summary()
+    with _lock:
+        _recent_reruns.appendleft(summary)
+    return summary
+
+
+# ---------- REPORTING ----------
+def top_statements(limit=20, order_by="total_ms"):
+    with _lock:
+        rows = [
+            {
+                "sql": a["sql"],
+                "calls": a["calls"],
+                "total_ms": round(a["total_ms"], 2),
+                "avg_ms": round(a["total_ms"] / a["calls"], 2),
+                "max_ms": round(a["max_ms"], 2),
+                "rows": a["rows"],
+                "callers": ", ".join(sorted(a["callers"])),
+            }
+            for a in _totals.values()
+        ]
+    rows.sort(key=lambda r: r[order_by], reverse=True)
+    return rows[:limit]
+
+
+def recent_reruns():
+    with _lock:
+        return list(_recent_reruns)
+
+
+def reset():
+    with _lock:
+        _totals.clear()
+        _recent_reruns.clear()